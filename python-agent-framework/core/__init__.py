@@ -12,6 +12,7 @@ from .orchestrator import (
     ParallelOrchestrator,
     HierarchicalOrchestrator,
     ConditionalOrchestrator,
+    SpeculativeOrchestrator,
     CustomOrchestrator
 )
 
@@ -25,5 +26,6 @@ __all__ = [
     'ParallelOrchestrator',
     'HierarchicalOrchestrator',
     'ConditionalOrchestrator',
+    'SpeculativeOrchestrator',
     'CustomOrchestrator'
 ]
@@ -9,11 +9,13 @@ Author: LLM Agent Framework
 License: MIT
 """
 
+import asyncio
 import json
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Generator, List, Optional, Union
 from datetime import datetime
 
+from .cache import ToolResultCache
 from .llm_client import LLMClient
 from .tool import Tool
 
@@ -56,7 +58,9 @@ class Agent:
         memory_enabled: bool = True,
         max_memory_tokens: int = 4000,
         max_iterations: int = 10,
-        use_react: bool = True
+        use_react: bool = True,
+        tool_cache: Optional[ToolResultCache] = None,
+        model: Optional[str] = None
     ):
         """
         Initialize the Agent.
@@ -72,10 +76,19 @@ class Agent:
             max_memory_tokens: Max tokens for memory / 记忆的最大令牌数
             max_iterations: Max reasoning iterations / 最大推理迭代次数
             use_react: Use ReAct reasoning template / 使用ReAct推理模板
+            tool_cache: Cache for results of cacheable tools; share one
+                instance between agents to reuse results across them /
+                可缓存工具结果的缓存；多个智能体共享同一实例即可互相复用结果
+            model: Model for this agent's calls, overriding the client's model
+                so cheap steps can use a smaller model / 此智能体调用使用的模型，
+                覆盖客户端的模型，使简单步骤可以使用更小的模型
         """
         self.name = name
         self.llm_client = llm_client
         self.tools = {tool.name: tool for tool in (tools or [])}
+        self.tool_cache = ToolResultCache() if tool_cache is None else tool_cache
+        self.model = model
+        self._llm_kwargs = {"model": model} if model else {}
         self.role = role
         self.use_react = use_react
         self.custom_instructions = system_prompt or ""
@@ -172,7 +185,7 @@ If you don't need any tools, respond normally to the user.
             }
             
             # Stream LLM response
-            response = self.llm_client.chat(messages, stream=True)
+            response = self.llm_client.chat(messages, stream=True, **self._llm_kwargs)
             
             if not response.get("success"):
                 error_msg = f"LLM API error: {response.get('error')}"
@@ -186,6 +199,18 @@ If you don't need any tools, respond normally to the user.
                 for chunk in self.llm_client.parse_stream(response["response"]):
                     full_content += chunk
                     yield {"type": "thought_chunk", "content": chunk}
+                    # Act as soon as a JSON tool call block is closed instead
+                    # of waiting for whatever the model writes after it; other
+                    # JSON blocks (e.g. examples in an answer) keep streaming
+                    # JSON工具调用块一闭合就立即执行，而不等待模型之后输出的内容；
+                    # 其他JSON块（例如答案中的示例）继续流式输出
+                    if (
+                        "`" in chunk
+                        and self._has_complete_json_block(full_content)
+                        and self._parse_tool_call(full_content) is not None
+                    ):
+                        response["response"].close()
+                        break
                 yield {"type": "thought_end", "content": "\n"}
             else:
                 full_content = response["content"]
@@ -277,6 +302,73 @@ If you don't need any tools, respond normally to the user.
         reasoning loop, tool calling, and response generation.
         这是智能体执行的主要入口点。它处理推理循环、工具调用和响应生成。
 
+        Args:
+            task: Task description / 任务描述
+            context: Additional context / 额外上下文
+
+        Returns:
+            Final response string / 最终响应字符串
+        """
+        loop = self._reasoning_loop(task, context)
+        try:
+            request = next(loop)
+            while True:
+                if isinstance(request, list):
+                    request = loop.send(self.llm_client.chat(request, **self._llm_kwargs))
+                else:
+                    request = loop.send(self._execute_tool(request))
+        except StopIteration as stop:
+            return stop.value
+
+    async def run_async(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Execute a task using the agent without blocking the event loop.
+        使用智能体执行任务而不阻塞事件循环。
+
+        Same reasoning loop as run(), but LLM calls are awaited and tools run
+        in a worker thread, so several agents can run concurrently with
+        asyncio.gather without one agent's tool blocking the others.
+        与run()相同的推理循环，但LLM调用是异步等待的，工具在工作线程中运行，
+        因此多个智能体可以通过asyncio.gather并发运行，一个智能体的工具不会阻塞其他智能体。
+
+        Args:
+            task: Task description / 任务描述
+            context: Additional context / 额外上下文
+
+        Returns:
+            Final response string / 最终响应字符串
+        """
+        loop = self._reasoning_loop(task, context)
+        try:
+            request = next(loop)
+            while True:
+                if isinstance(request, list):
+                    result = await self.llm_client.chat_async(request, **self._llm_kwargs)
+                else:
+                    result = await asyncio.to_thread(self._execute_tool, request)
+                request = loop.send(result)
+        except StopIteration as stop:
+            return stop.value
+
+    def _reasoning_loop(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]]
+    ) -> Generator[Union[List[Dict[str, str]], Dict[str, Any]], Dict[str, Any], str]:
+        """
+        Reasoning loop shared by run() and run_async().
+        run()和run_async()共享的推理循环。
+
+        Yields the message list for each LLM call and the tool call dict for
+        each tool execution, and receives the LLM response or tool result
+        back, so the caller decides whether each step is sync or async.
+        每次LLM调用时产出消息列表、每次工具执行时产出工具调用字典，并接收LLM响应或工具结果，
+        由调用方决定每一步同步还是异步执行。
+
         Args:
             task: Task description / 任务描述
             context: Additional context / 额外上下文
@@ -290,7 +382,7 @@ If you don't need any tools, respond normally to the user.
         while iteration < self.max_iterations:
             iteration += 1
 
-            response = self.llm_client.chat(messages)
+            response = yield messages
 
             if not response.get("success"):
                 error_msg = f"LLM API error: {response.get('error')}"
@@ -320,7 +412,7 @@ If you don't need any tools, respond normally to the user.
 
             if tool_call:
                 # Execute the tool
-                tool_result = self._execute_tool(tool_call)
+                tool_result = yield tool_call
 
                 # Add assistant's reasoning and tool call to messages
                 messages.append({
@@ -356,6 +448,21 @@ If you don't need any tools, respond normally to the user.
 
         return "Maximum iterations reached. Task may be incomplete."
     
+    @staticmethod
+    def _has_complete_json_block(content: str) -> bool:
+        """
+        Check whether content contains a closed ```json code block.
+        检查内容是否包含已闭合的```json代码块。
+
+        Args:
+            content: Partial LLM response / 部分LLM响应
+
+        Returns:
+            True if a complete block is present / 如果存在完整代码块则为True
+        """
+        start = content.find("```json")
+        return start != -1 and content.find("```", start + 7) != -1
+
     def _extract_final_answer(self, content: str) -> Optional[str]:
         """
         Extract final answer from ReAct format response.
@@ -510,7 +617,7 @@ If you don't need any tools, respond normally to the user.
         tool = self.tools[tool_name]
 
         try:
-            result = tool.execute(**parameters)
+            result = self.tool_cache.call(tool, parameters)
             self._log_execution("tool_result", result)
             return result
         except Exception as e:
@@ -581,6 +688,44 @@ If you don't need any tools, respond normally to the user.
         """
         return self.execution_log.copy()
 
+    def get_execution_log_array(self, data_chars: int = 512):
+        """
+        Get the execution log as a NumPy structured array.
+        以NumPy结构化数组形式获取执行日志。
+
+        Event data is serialised to a string and truncated to ``data_chars``
+        characters, so columns can be filtered and counted without looping
+        over the entries in Python.
+        事件数据序列化为字符串并截断为 ``data_chars`` 个字符，
+        因此无需在Python中逐条循环即可筛选和统计各列。
+
+        Args:
+            data_chars: Maximum characters kept per event's data / 每个事件数据保留的最大字符数
+
+        Returns:
+            Array with ``timestamp``, ``event_type`` and ``data`` fields /
+            包含 ``timestamp``、``event_type`` 和 ``data`` 字段的数组
+
+        Raises:
+            ImportError: If numpy is not installed / 如果未安装numpy
+        """
+        import numpy as np
+
+        dtype = [
+            ("timestamp", "datetime64[us]"),
+            ("event_type", "U32"),
+            ("data", f"U{data_chars}")
+        ]
+        return np.array([
+            (
+                entry["timestamp"],
+                entry["event_type"],
+                entry["data"] if isinstance(entry["data"], str)
+                else json.dumps(entry["data"], ensure_ascii=False, default=str)
+            )
+            for entry in self.execution_log
+        ], dtype=dtype)
+
     def clear_execution_log(self) -> None:
         """
         Clear the execution log.
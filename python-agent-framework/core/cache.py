@@ -0,0 +1,253 @@
+"""
+Cache Utilities / 缓存工具
+
+This module provides a small thread-safe LRU cache (with optional TTL) and
+a disk-backed variant used by the LLM client, and a tool-result cache used by
+the tool registry and agents.
+此模块提供一个小型线程安全的LRU缓存（可选TTL）及其磁盘持久化版本，供LLM客户端使用；
+以及供工具注册表和智能体使用的工具结果缓存。
+
+Author: LLM Agent Framework
+License: MIT
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache.
+    线程安全的最近最少使用缓存。
+
+    Attributes:
+        maxsize (int): Maximum number of entries / 最大条目数
+        ttl (float): Seconds an entry stays valid, None for no expiry /
+            条目有效秒数，None表示永不过期
+        hits (int): Number of cache hits / 缓存命中次数
+        misses (int): Number of cache misses / 缓存未命中次数
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        """
+        Initialize the cache.
+        初始化缓存。
+
+        Args:
+            maxsize: Maximum number of entries / 最大条目数
+            ttl: Seconds an entry stays valid (optional) / 条目有效秒数（可选）
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value and mark it as recently used.
+        获取缓存值并将其标记为最近使用。
+
+        Args:
+            key: Cache key / 缓存键
+            default: Value returned on a miss / 未命中时返回的值
+
+        Returns:
+            Cached value or default / 缓存值或默认值
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or (entry[0] is not None and entry[0] < time.monotonic()):
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+        存储值，缓存已满时淘汰最近最少使用的条目。
+
+        Args:
+            key: Cache key / 缓存键
+            value: Value to store / 要存储的值
+        """
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset counters.
+        移除所有条目并重置计数器。
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Return number of cached entries."""
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if key is cached."""
+        return key in self._data
+
+
+class DiskCache(LRUCache):
+    """
+    LRU cache that also persists entries as JSON files, so they survive
+    restarts. Values must be JSON-serialisable.
+    同时将条目持久化为JSON文件的LRU缓存，重启后仍然有效。值必须可JSON序列化。
+
+    Attributes:
+        directory (str): Directory holding the cache files / 存放缓存文件的目录
+    """
+
+    def __init__(self, directory: str, maxsize: int = 128):
+        """
+        Initialize the cache.
+        初始化缓存。
+
+        Args:
+            directory: Directory for cache files; created if missing /
+                缓存文件目录；不存在时自动创建
+            maxsize: Maximum number of entries kept in memory / 内存中保留的最大条目数
+        """
+        super().__init__(maxsize)
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: Hashable) -> str:
+        """Return the file path for a key. / 返回键对应的文件路径。"""
+        digest = hashlib.blake2b(str(key).encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Get a cached value from memory, falling back to disk.
+        从内存获取缓存值，未命中时回退到磁盘。
+
+        Args:
+            key: Cache key / 缓存键
+            default: Value returned on a miss / 未命中时返回的值
+
+        Returns:
+            Cached value or default / 缓存值或默认值
+        """
+        value = super().get(key, default)
+        if value is not default:
+            return value
+
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return default
+
+        with self._lock:
+            self.misses -= 1
+            self.hits += 1
+        super().set(key, value)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value in memory and on disk.
+        将值存储到内存和磁盘。
+
+        Args:
+            key: Cache key / 缓存键
+            value: JSON-serialisable value / 可JSON序列化的值
+        """
+        super().set(key, value)
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f, ensure_ascii=False, default=str)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError):
+            # Disk persistence is best effort; the memory entry still works
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from memory and disk.
+        从内存和磁盘移除所有条目。
+        """
+        super().clear()
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if key is cached in memory or on disk."""
+        return super().__contains__(key) or os.path.exists(self._path(key))
+
+
+class ToolResultCache(LRUCache):
+    """
+    Memoizes results of tools that declare ``cacheable = True``.
+    缓存声明了 ``cacheable = True`` 的工具的执行结果。
+
+    Only successful results are stored, so failures are retried on the next
+    call. Entries expire after ``ttl`` seconds so tools backed by changing
+    data (weather, databases) are eventually refreshed.
+    仅缓存成功的结果，失败会在下次调用时重试。条目在 ``ttl`` 秒后过期，
+    因此依赖变化数据的工具（天气、数据库）最终会刷新。
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = 300):
+        """
+        Initialize the cache.
+        初始化缓存。
+
+        Args:
+            maxsize: Maximum number of entries / 最大条目数
+            ttl: Seconds an entry stays valid / 条目有效秒数
+        """
+        super().__init__(maxsize, ttl)
+
+    def call(self, tool: Any, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a tool, serving repeated calls from the cache.
+        执行工具，重复调用直接从缓存返回。
+
+        Args:
+            tool: Tool instance / 工具实例
+            kwargs: Tool parameters / 工具参数
+
+        Returns:
+            Tool execution result / 工具执行结果
+        """
+        if not getattr(tool, "cacheable", False):
+            return tool.execute(**kwargs)
+
+        key = (tool.name, json.dumps(kwargs, sort_keys=True, default=str))
+        cached = self.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = tool.execute(**kwargs)
+        if isinstance(result, dict) and result.get("success"):
+            # Store a deep copy so the caller can modify the result it gets
+            # back, including nested lists and dicts
+            # 存储深拷贝，调用方修改返回的结果（包括嵌套的列表和字典）不会影响缓存
+            self.set(key, copy.deepcopy(result))
+        return result
@@ -12,12 +12,24 @@ License: MIT
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
 import json
+import threading
 import time
-from typing import Dict, Any, List, Optional, Union
+import weakref
+from typing import Dict, Any, List, Optional, Tuple, Union
 from datetime import datetime
 import os
 
+from .cache import DiskCache, LRUCache
+
+try:
+    import httpx
+except ImportError:
+    # httpx is optional; chat_async falls back to a worker thread
+    httpx = None
+
 
 class LLMClient:
     """
@@ -43,7 +55,11 @@ class LLMClient:
         model: str = "gpt-4",
         timeout: int = 60,
         max_retries: int = 3,
-        api_type: str = "openai"
+        api_type: str = "openai",
+        cache_size: int = 0,
+        prompt_caching: bool = False,
+        session: Optional[requests.Session] = None,
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize the LLM client.
@@ -56,6 +72,20 @@ class LLMClient:
             timeout: Request timeout / 请求超时时间
             max_retries: Maximum retries / 最大重试次数
             api_type: API type ("openai", "claude", "custom") / API类型
+            cache_size: Number of responses kept in the in-memory response
+                cache; 0 disables it / 内存响应缓存的条目数；0表示禁用
+            prompt_caching: Send the Claude system prompt as a content block
+                marked cacheable, so the provider can reuse it across calls.
+                Off by default because proxies and older API versions expect
+                a plain string / 将Claude系统提示作为标记为可缓存的内容块发送，
+                以便服务商跨调用复用。默认关闭，因为代理和旧版API要求纯字符串
+            session: HTTP session to reuse; pass the same session to several
+                clients to share one keep-alive connection pool /
+                复用的HTTP会话；多个客户端传入同一会话即可共享连接池
+            cache_dir: Directory for a persistent response cache; responses
+                survive restarts, with cache_size (default 128) entries kept
+                in memory / 持久化响应缓存目录；响应在重启后仍可复用，
+                内存中保留cache_size（默认128）个条目
         """
         self.api_url = api_url
         self.api_key = api_key
@@ -63,10 +93,80 @@ class LLMClient:
         self.timeout = timeout
         self.max_retries = max_retries
         self.api_type = api_type
+        self.prompt_caching = prompt_caching
+        if cache_dir:
+            self._response_cache = DiskCache(cache_dir, cache_size or 128)
+        elif cache_size > 0:
+            self._response_cache = LRUCache(cache_size)
+        else:
+            self._response_cache = None
+        self.session = session or self._create_session()
+        # One httpx.AsyncClient per event loop for chat_async; the lock makes
+        # the lookup safe when one client is shared across threads
+        # chat_async在每个事件循环上使用一个httpx.AsyncClient；客户端跨线程共享时由锁保证查找安全
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_lock = threading.Lock()
 
         self.request_count = 0
         self.total_tokens = 0
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create a keep-alive session sized for concurrent agents.
+        创建适合并发智能体的长连接会话。
+
+        The default pool keeps 10 connections per host; parallel orchestrators
+        sharing one client can exceed that and would reopen connections.
+        默认连接池每个主机保留10个连接；共享客户端的并行编排器可能超出该数量并重新建立连接。
+
+        Returns:
+            Configured session / 配置好的会话
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """
+        Return the pooled async HTTP client for the running event loop.
+        返回当前事件循环的异步HTTP连接池客户端。
+
+        Connections are bound to the loop that opened them, so each loop
+        gets its own client. Call aclose() before the loop finishes (e.g. at
+        the end of the coroutine passed to asyncio.run) to release it.
+        连接绑定到打开它们的事件循环，因此每个事件循环有自己的客户端。
+        请在事件循环结束前调用aclose()（例如在传给asyncio.run的协程末尾）以释放它。
+
+        Returns:
+            Async HTTP client / 异步HTTP客户端
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+                )
+                self._async_clients[loop] = client
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Close the async HTTP client of the running event loop, if any.
+        关闭当前事件循环的异步HTTP客户端（如果存在）。
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
     def chat(
         self,
         messages: List[Dict[str, str]],
@@ -84,7 +184,9 @@ class LLMClient:
             temperature: Sampling temperature (0-2) / 采样温度
             max_tokens: Maximum tokens to generate / 生成的最大令牌数
             stream: Whether to stream the response / 是否流式响应
-            **kwargs: Additional API-specific parameters / 额外的API特定参数
+            **kwargs: Additional API-specific parameters, e.g. model to
+                override the client's model for this call / 额外的API特定参数，
+                例如用model覆盖本次调用的模型
 
         Returns:
             Response dictionary containing the completion / 包含补全的响应字典
@@ -92,12 +194,41 @@ class LLMClient:
         Raises:
             Exception: If request fails after retries / 如果重试后请求失败
         """
+        cache_key = None
+        if self._response_cache is not None and not stream:
+            cache_key = self._cache_key(messages, temperature, max_tokens, kwargs)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
         if self.api_type == "openai":
-            return self._openai_chat(messages, temperature, max_tokens, stream, **kwargs)
+            response = self._openai_chat(messages, temperature, max_tokens, stream, **kwargs)
         elif self.api_type == "claude":
-            return self._claude_chat(messages, temperature, max_tokens, stream, **kwargs)
+            response = self._claude_chat(messages, temperature, max_tokens, stream, **kwargs)
         else:
-            return self._custom_chat(messages, temperature, max_tokens, stream, **kwargs)
+            response = self._custom_chat(messages, temperature, max_tokens, stream, **kwargs)
+
+        if cache_key is not None and response.get("success"):
+            self._response_cache.set(cache_key, response)
+        return response
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        extra: Dict[str, Any]
+    ) -> str:
+        """
+        Build a response-cache key from everything that affects the completion.
+        根据影响补全结果的所有参数构建响应缓存键。
+        """
+        return json.dumps(
+            [self.api_type, self.model, messages, temperature, max_tokens, extra],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
 
     def _openai_chat(
         self,
@@ -111,25 +242,13 @@ class LLMClient:
         OpenAI-compatible chat completion.
         OpenAI兼容的聊天补全。
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        payload = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": temperature,
-            "stream": stream,
-            **kwargs
-        }
-
-        if max_tokens:
-            payload["max_tokens"] = max_tokens
+        headers, payload = self._openai_request(
+            messages, temperature, max_tokens, stream, **kwargs
+        )
 
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(
+                response = self.session.post(
                     self.api_url,
                     headers=headers,
                     json=payload,
@@ -145,24 +264,12 @@ class LLMClient:
                         "success": True,
                         "stream": True,
                         "response": response,
-                        "model": self.model,
+                        "model": payload["model"],
                         "timestamp": datetime.now().isoformat()
                     }
                 
                 # Non-streaming response
-                result = response.json()
-
-                self.request_count += 1
-                if "usage" in result:
-                    self.total_tokens += result["usage"].get("total_tokens", 0)
-
-                return {
-                    "success": True,
-                    "content": result["choices"][0]["message"]["content"],
-                    "raw_response": result,
-                    "model": self.model,
-                    "timestamp": datetime.now().isoformat()
-                }
+                return self._openai_result(response.json())
 
             except requests.exceptions.RequestException as e:
                 if attempt == self.max_retries - 1:
@@ -179,6 +286,89 @@ class LLMClient:
             "timestamp": datetime.now().isoformat()
         }
     
+    def _openai_request(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        stream: bool,
+        **kwargs
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """
+        Build headers and payload for an OpenAI-compatible request.
+        构建OpenAI兼容请求的请求头和负载。
+        """
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "stream": stream,
+            **kwargs
+        }
+
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+
+        return headers, payload
+
+    def _openai_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse an OpenAI-compatible response and update usage stats.
+        解析OpenAI兼容响应并更新使用统计。
+        """
+        self.request_count += 1
+        if "usage" in result:
+            self.total_tokens += result["usage"].get("total_tokens", 0)
+
+        return {
+            "success": True,
+            "content": result["choices"][0]["message"]["content"],
+            "raw_response": result,
+            "model": result.get("model", self.model),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ):
+        """
+        Send a chat request and yield content chunks as they arrive (SSE).
+        发送聊天请求并在内容到达时逐块产出（SSE）。
+
+        Args:
+            messages: List of message dicts / 消息字典列表
+            temperature: Sampling temperature / 采样温度
+            max_tokens: Maximum tokens to generate / 生成的最大令牌数
+            **kwargs: Additional API parameters / 其他API参数
+
+        Yields:
+            str: Content chunks / 内容块
+
+        Raises:
+            RuntimeError: If the request fails / 如果请求失败
+        """
+        response = self.chat(messages, temperature, max_tokens, stream=True, **kwargs)
+        if not response.get("success"):
+            raise RuntimeError(f"LLM API error: {response.get('error')}")
+        if not response.get("stream"):
+            yield response["content"]
+            return
+
+        raw = response["response"]
+        try:
+            yield from self.parse_stream(raw)
+        finally:
+            raw.close()
+
     def parse_stream(self, response):
         """
         Parse streaming response from OpenAI-compatible API.
@@ -215,6 +405,48 @@ class LLMClient:
         Claude API chat completion.
         Claude API聊天补全。
         """
+        headers, payload = self._claude_request(
+            messages, temperature, max_tokens, **kwargs
+        )
+
+        for attempt in range(self.max_retries):
+            try:
+                response = self.session.post(
+                    self.api_url,
+                    headers=headers,
+                    json=payload,
+                    timeout=self.timeout
+                )
+
+                response.raise_for_status()
+                return self._claude_result(response.json())
+
+            except requests.exceptions.RequestException as e:
+                if attempt == self.max_retries - 1:
+                    return {
+                        "success": False,
+                        "error": str(e),
+                        "timestamp": datetime.now().isoformat()
+                    }
+                time.sleep(2 ** attempt)
+
+        return {
+            "success": False,
+            "error": "Max retries exceeded",
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def _claude_request(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        **kwargs
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """
+        Build headers and payload for a Claude API request.
+        构建Claude API请求的请求头和负载。
+        """
         headers = {
             "x-api-key": self.api_key,
             "anthropic-version": "2023-06-01",
@@ -239,45 +471,32 @@ class LLMClient:
         }
 
         if system_message:
-            payload["system"] = system_message
-
-        for attempt in range(self.max_retries):
-            try:
-                response = requests.post(
-                    self.api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=self.timeout
-                )
-
-                response.raise_for_status()
-                result = response.json()
-
-                self.request_count += 1
-                if "usage" in result:
-                    self.total_tokens += result["usage"].get("input_tokens", 0)
-                    self.total_tokens += result["usage"].get("output_tokens", 0)
+            if self.prompt_caching:
+                payload["system"] = [{
+                    "type": "text",
+                    "text": system_message,
+                    "cache_control": {"type": "ephemeral"}
+                }]
+            else:
+                payload["system"] = system_message
 
-                return {
-                    "success": True,
-                    "content": result["content"][0]["text"],
-                    "raw_response": result,
-                    "model": self.model,
-                    "timestamp": datetime.now().isoformat()
-                }
+        return headers, payload
 
-            except requests.exceptions.RequestException as e:
-                if attempt == self.max_retries - 1:
-                    return {
-                        "success": False,
-                        "error": str(e),
-                        "timestamp": datetime.now().isoformat()
-                    }
-                time.sleep(2 ** attempt)
+    def _claude_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse a Claude API response and update usage stats.
+        解析Claude API响应并更新使用统计。
+        """
+        self.request_count += 1
+        if "usage" in result:
+            self.total_tokens += result["usage"].get("input_tokens", 0)
+            self.total_tokens += result["usage"].get("output_tokens", 0)
 
         return {
-            "success": False,
-            "error": "Max retries exceeded",
+            "success": True,
+            "content": result["content"][0]["text"],
+            "raw_response": result,
+            "model": result.get("model", self.model),
             "timestamp": datetime.now().isoformat()
         }
 
@@ -298,6 +517,89 @@ class LLMClient:
         """
         return self._openai_chat(messages, temperature, max_tokens, stream, **kwargs)
 
+    async def chat_async(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Send a chat completion request without blocking the event loop.
+        发送聊天补全请求而不阻塞事件循环。
+
+        Uses a pooled httpx.AsyncClient when installed so many requests can be
+        awaited together (e.g. with asyncio.gather) over kept-alive
+        connections; otherwise runs chat() in a worker thread. Streaming is
+        not supported here.
+        安装了httpx时使用带连接池的httpx.AsyncClient，以便多个请求可以通过长连接一起等待；
+        否则在工作线程中运行chat()。此方法不支持流式输出。
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' / 消息字典列表
+            temperature: Sampling temperature (0-2) / 采样温度
+            max_tokens: Maximum tokens to generate / 生成的最大令牌数
+            **kwargs: Additional API-specific parameters / 额外的API特定参数
+
+        Returns:
+            Response dictionary containing the completion / 包含补全的响应字典
+        """
+        if httpx is None:
+            return await asyncio.to_thread(
+                self.chat, messages, temperature, max_tokens, False, **kwargs
+            )
+
+        cache_key = None
+        if self._response_cache is not None:
+            cache_key = self._cache_key(messages, temperature, max_tokens, kwargs)
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
+        if self.api_type == "claude":
+            headers, payload = self._claude_request(
+                messages, temperature, max_tokens, **kwargs
+            )
+            parse_result = self._claude_result
+        else:
+            headers, payload = self._openai_request(
+                messages, temperature, max_tokens, False, **kwargs
+            )
+            parse_result = self._openai_result
+
+        client = self._get_async_client()
+        for attempt in range(self.max_retries):
+            try:
+                response = await client.post(
+                    self.api_url,
+                    headers=headers,
+                    json=payload
+                )
+
+                response.raise_for_status()
+                result = parse_result(response.json())
+                if cache_key is not None:
+                    self._response_cache.set(cache_key, result)
+                return result
+
+            # A non-JSON body is retried like a transport error, matching
+            # chat(), where requests raises it as a RequestException
+            # 非JSON响应体与传输错误一样重试，与chat()一致（requests将其作为RequestException抛出）
+            except (httpx.HTTPError, ValueError) as e:
+                if attempt == self.max_retries - 1:
+                    return {
+                        "success": False,
+                        "error": str(e),
+                        "timestamp": datetime.now().isoformat()
+                    }
+                await asyncio.sleep(2 ** attempt)
+
+        return {
+            "success": False,
+            "error": "Max retries exceeded",
+            "timestamp": datetime.now().isoformat()
+        }
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get usage statistics for this client.
@@ -310,7 +612,8 @@ class LLMClient:
             "request_count": self.request_count,
             "total_tokens": self.total_tokens,
             "model": self.model,
-            "api_type": self.api_type
+            "api_type": self.api_type,
+            "cache_hits": self._response_cache.hits if self._response_cache is not None else 0
         }
 
     def reset_stats(self) -> None:
@@ -320,6 +623,9 @@ class LLMClient:
         """
         self.request_count = 0
         self.total_tokens = 0
+        if self._response_cache is not None:
+            self._response_cache.hits = 0
+            self._response_cache.misses = 0
 
     @classmethod
     def from_env(cls, api_type: str = "openai") -> "LLMClient":
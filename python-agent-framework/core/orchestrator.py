@@ -8,8 +8,10 @@ Author: LLM Agent Framework
 License: MIT
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import deque
+from typing import Deque, List, Dict, Any, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
@@ -26,6 +28,19 @@ class Orchestrator(ABC):
     编排器管理多个智能体协同工作以完成复杂任务的执行流程。
     """
 
+    # Number of characters kept in each history entry's result preview
+    # 每条历史记录中结果预览保留的字符数
+    RESULT_PREVIEW_CHARS = 200
+
+    # Maximum history entries kept, None to keep the full run history; set it
+    # on a subclass to cap memory for long-running orchestrators (older
+    # entries are then dropped)
+    # 保留的最大历史条目数，None表示保留完整历史；长时间运行的编排器可在子类中设置以限制内存
+    # （此时更早的条目会被丢弃）
+    HISTORY_SIZE: Optional[int] = None
+
+    _HISTORY_FIELDS = ("timestamp", "agent", "result", "result_len", "result_preview")
+
     def __init__(self, agents: List[Agent]):
         """
         Initialize orchestrator with agents.
@@ -35,7 +50,44 @@ class Orchestrator(ABC):
             agents: List of agent instances / 智能体实例列表
         """
         self.agents = agents
-        self.execution_history: List[Dict[str, Any]] = []
+        # Flat list of every agent involved; subclasses may replace
+        # self.agents with another shape (e.g. a name mapping)
+        # 所有参与的智能体的扁平列表；子类可能将self.agents替换为其他结构（如名称映射）
+        self._all_agents: List[Agent] = list(agents)
+        # History is stored column-wise in deques, bounded by HISTORY_SIZE
+        # 历史记录按列存储在双端队列中，长度受HISTORY_SIZE限制
+        self._history: Dict[str, Deque[Any]] = {
+            field: deque(maxlen=self.HISTORY_SIZE) for field in self._HISTORY_FIELDS
+        }
+
+    @property
+    def execution_history(self) -> List[Dict[str, Any]]:
+        """
+        Execution history as a list of entry dicts, built on access.
+        以条目字典列表形式返回的执行历史，访问时构建。
+
+        Returns:
+            List of history entries / 历史条目列表
+        """
+        columns = self._history
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    def history_columns(self, *fields: str) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Get history columns without building per-entry dicts.
+        获取历史列而不构建逐条字典。
+
+        Args:
+            *fields: Column names (timestamp, agent, result, result_len,
+                result_preview); all columns if omitted / 列名；省略时返回所有列
+
+        Returns:
+            Tuple of column snapshots / 列快照元组
+
+        Raises:
+            KeyError: If a field name is unknown / 如果字段名未知
+        """
+        return tuple(tuple(self._history[field]) for field in (fields or self._HISTORY_FIELDS))
 
     @abstractmethod
     def run(self, task: str, context: Optional[Dict[str, Any]] = None) -> Any:
@@ -52,6 +104,17 @@ class Orchestrator(ABC):
         """
         raise NotImplementedError
 
+    async def aclose(self) -> None:
+        """
+        Close the async HTTP clients that run_async() opened on the running
+        event loop; await it before the loop finishes.
+        关闭run_async()在当前事件循环上打开的异步HTTP客户端；请在事件循环结束前等待它。
+        """
+        clients = {id(agent.llm_client): agent.llm_client for agent in self._all_agents}
+        await asyncio.gather(*(
+            client.aclose() for client in clients.values() if hasattr(client, "aclose")
+        ))
+
     def _log_execution(self, agent_name: str, result: Any) -> None:
         """
         Log execution result.
@@ -61,11 +124,13 @@ class Orchestrator(ABC):
             agent_name: Name of agent / 智能体名称
             result: Execution result / 执行结果
         """
-        self.execution_history.append({
-            "timestamp": datetime.now().isoformat(),
-            "agent": agent_name,
-            "result": result
-        })
+        result_str = result if isinstance(result, str) else str(result)
+        history = self._history
+        history["timestamp"].append(datetime.now().isoformat())
+        history["agent"].append(agent_name)
+        history["result"].append(result)
+        history["result_len"].append(len(result_str))
+        history["result_preview"].append(result_str[:self.RESULT_PREVIEW_CHARS])
 
 
 class SequentialOrchestrator(Orchestrator):
@@ -73,14 +138,114 @@ class SequentialOrchestrator(Orchestrator):
     Sequential orchestrator - agents work one after another.
     顺序编排器 - 智能体依次工作。
 
-    Each agent receives the previous agent's output as input.
-    每个智能体接收前一个智能体的输出作为输入。
+    Each agent receives the previous agent's output as input. When
+    ``dependencies`` is given, agents only wait for the agents they depend
+    on, and agents whose dependencies are satisfied run concurrently.
+    每个智能体接收前一个智能体的输出作为输入。提供 ``dependencies`` 时，
+    智能体只等待其依赖的智能体，依赖已满足的智能体并发运行。
 
     Example:
         Researcher → Analyst → Writer
         研究员 → 分析师 → 写作者
+
+        [Researcher, Analyst] → Writer
+        (dependencies={"Writer": ["Researcher", "Analyst"]})
     """
 
+    def __init__(
+        self,
+        agents: List[Agent],
+        dependencies: Optional[Dict[str, List[str]]] = None
+    ):
+        """
+        Initialize sequential orchestrator.
+        初始化顺序编排器。
+
+        Args:
+            agents: List of agents; the last one produces the final result /
+                智能体列表；最后一个产生最终结果
+            dependencies: Map of agent name to the names it depends on
+                (optional); agents not listed have no dependencies /
+                智能体名称到其依赖名称的映射（可选）；未列出的智能体没有依赖
+
+        Raises:
+            ValueError: If a dependency is unknown or cyclic / 如果依赖未知或存在循环
+        """
+        super().__init__(agents)
+        self.dependencies = dependencies
+        self._waves = self._plan_waves(dependencies) if dependencies else None
+
+    def _plan_waves(self, dependencies: Dict[str, List[str]]) -> List[List[Agent]]:
+        """
+        Group agents into waves that can run concurrently.
+        将智能体分组为可并发运行的批次。
+
+        Args:
+            dependencies: Map of agent name to dependency names / 智能体名称到依赖名称的映射
+
+        Returns:
+            Waves of agents in execution order / 按执行顺序排列的智能体批次
+
+        Raises:
+            ValueError: If a dependency names an unknown agent or the
+                dependencies form a cycle / 如果依赖引用了未知智能体或依赖形成循环
+        """
+        names = {agent.name for agent in self.agents}
+        for name, deps in dependencies.items():
+            if name not in names:
+                raise ValueError(f"Unknown agent in dependencies: '{name}'")
+            unknown = [dep for dep in deps if dep not in names]
+            if unknown:
+                raise ValueError(
+                    f"Agent '{name}' depends on unknown agent(s): {', '.join(unknown)}"
+                )
+
+        waves = []
+        done = set()
+        pending = list(self.agents)
+        while pending:
+            wave = [
+                agent for agent in pending
+                if done.issuperset(dependencies.get(agent.name, ()))
+            ]
+            if not wave:
+                raise ValueError(
+                    "Cyclic dependencies between agents: "
+                    + ", ".join(agent.name for agent in pending)
+                )
+            waves.append(wave)
+            done.update(agent.name for agent in wave)
+            pending = [agent for agent in pending if agent.name not in done]
+        return waves
+
+    def _agent_input(
+        self,
+        agent: Agent,
+        task: str,
+        continuation_task: str,
+        context: Dict[str, Any],
+        results: Dict[str, str]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the task and context for an agent from its dependencies' results.
+        根据依赖智能体的结果构建该智能体的任务和上下文。
+
+        Returns:
+            (task, context) tuple / (任务, 上下文) 元组
+        """
+        deps = self.dependencies.get(agent.name)
+        if not deps:
+            return task, context
+
+        agent_context = dict(context)
+        if len(deps) == 1:
+            agent_context["previous_result"] = results[deps[0]]
+        else:
+            agent_context["previous_result"] = "\n\n".join(
+                f"[{dep}]\n{results[dep]}" for dep in deps
+            )
+        return continuation_task, agent_context
+
     def run(self, task: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Execute agents sequentially.
@@ -95,6 +260,29 @@ class SequentialOrchestrator(Orchestrator):
         """
         current_task = task
         current_context = context or {}
+        # The task never changes, so the follow-up prompt is built only once
+        # 任务不变，因此后续提示只需构建一次
+        continuation_task = f"Based on the previous result, continue with: {task}"
+
+        if self._waves:
+            results = {}
+            for wave in self._waves:
+                inputs = [
+                    self._agent_input(agent, task, continuation_task, current_context, results)
+                    for agent in wave
+                ]
+                print(f"[SequentialOrchestrator] Running agents: {', '.join(a.name for a in wave)}")
+                if len(wave) == 1:
+                    outputs = [wave[0].run(*inputs[0])]
+                else:
+                    with ThreadPoolExecutor(max_workers=len(wave)) as executor:
+                        outputs = list(executor.map(
+                            lambda agent, args: agent.run(*args), wave, inputs
+                        ))
+                for agent, result in zip(wave, outputs):
+                    results[agent.name] = result
+                    self._log_execution(agent.name, result)
+            return results[self.agents[-1].name]
 
         for agent in self.agents:
             print(f"[SequentialOrchestrator] Running agent: {agent.name}")
@@ -103,10 +291,47 @@ class SequentialOrchestrator(Orchestrator):
             self._log_execution(agent.name, result)
 
             current_context["previous_result"] = result
-            current_task = f"Based on the previous result, continue with: {task}"
+            current_task = continuation_task
 
         return result
 
+    async def run_async(self, task: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Execute agents on one event loop, awaiting independent agents together.
+        在同一事件循环上执行智能体，独立的智能体一起等待。
+
+        Args:
+            task: Initial task / 初始任务
+            context: Additional context / 额外上下文
+
+        Returns:
+            Final agent's output / 最终智能体的输出
+        """
+        current_context = context or {}
+        continuation_task = f"Based on the previous result, continue with: {task}"
+
+        if not self._waves:
+            current_task = task
+            for agent in self.agents:
+                print(f"[SequentialOrchestrator] Running agent: {agent.name}")
+                result = await agent.run_async(current_task, current_context)
+                self._log_execution(agent.name, result)
+                current_context["previous_result"] = result
+                current_task = continuation_task
+            return result
+
+        results = {}
+        for wave in self._waves:
+            print(f"[SequentialOrchestrator] Running agents: {', '.join(a.name for a in wave)}")
+            outputs = await asyncio.gather(*(
+                agent.run_async(*self._agent_input(agent, task, continuation_task, current_context, results))
+                for agent in wave
+            ))
+            for agent, result in zip(wave, outputs):
+                results[agent.name] = result
+                self._log_execution(agent.name, result)
+        return results[self.agents[-1].name]
+
 
 class ParallelOrchestrator(Orchestrator):
     """
@@ -121,7 +346,12 @@ class ParallelOrchestrator(Orchestrator):
         任务 → [智能体1, 智能体2, 智能体3] → 合并结果
     """
 
-    def __init__(self, agents: List[Agent], max_workers: int = 3):
+    def __init__(
+        self,
+        agents: List[Agent],
+        max_workers: int = 3,
+        max_concurrency: Optional[int] = None
+    ):
         """
         Initialize parallel orchestrator.
         初始化并行编排器。
@@ -129,9 +359,12 @@ class ParallelOrchestrator(Orchestrator):
         Args:
             agents: List of agents / 智能体列表
             max_workers: Maximum parallel workers / 最大并行工作数
+            max_concurrency: Maximum agents awaited at once by run_async(),
+                None for no limit / run_async()同时等待的最大智能体数，None表示不限制
         """
         super().__init__(agents)
         self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
 
     def run(self, task: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         """
@@ -167,6 +400,51 @@ class ParallelOrchestrator(Orchestrator):
 
         return results
 
+    async def run_async(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, str]:
+        """
+        Execute agents concurrently on one event loop.
+        在同一事件循环上并发执行智能体。
+
+        All LLM calls are awaited together, so wall-clock time is bounded by
+        the slowest agent rather than max_workers. Set max_concurrency to stay
+        under provider rate limits.
+        所有LLM调用一起等待，因此总耗时取决于最慢的智能体，而不受max_workers限制。
+        设置max_concurrency可避免超出服务商的速率限制。
+
+        Args:
+            task: Task for all agents / 所有智能体的任务
+            context: Additional context / 额外上下文
+
+        Returns:
+            Dict mapping agent names to their results / 将智能体名称映射到其结果的字典
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency or max(len(self.agents), 1))
+
+        async def run_agent(agent: Agent) -> str:
+            async with semaphore:
+                return await agent.run_async(task, context)
+
+        outcomes = await asyncio.gather(
+            *(run_agent(agent) for agent in self.agents),
+            return_exceptions=True
+        )
+
+        results = {}
+        for agent, outcome in zip(self.agents, outcomes):
+            if isinstance(outcome, Exception):
+                result = f"Error: {str(outcome)}"
+            else:
+                result = outcome
+                print(f"[ParallelOrchestrator] {agent.name} completed")
+            results[agent.name] = result
+            self._log_execution(agent.name, result)
+
+        return results
+
 
 class HierarchicalOrchestrator(Orchestrator):
     """
@@ -184,7 +462,13 @@ class HierarchicalOrchestrator(Orchestrator):
           └── Worker Agent 3
     """
 
-    def __init__(self, manager: Agent, workers: List[Agent]):
+    def __init__(
+        self,
+        manager: Agent,
+        workers: List[Agent],
+        prefetch: bool = False,
+        max_workers: int = 3
+    ):
         """
         Initialize hierarchical orchestrator.
         初始化层级编排器。
@@ -192,10 +476,15 @@ class HierarchicalOrchestrator(Orchestrator):
         Args:
             manager: Manager agent / 管理者智能体
             workers: Worker agents / 工作者智能体
+            prefetch: Start all worker subtasks in the background as soon as
+                the manager's plan is ready / 管理者计划完成后立即在后台预取所有工作者子任务
+            max_workers: Maximum background workers when prefetching / 预取时的最大后台工作数
         """
         super().__init__([manager] + workers)
         self.manager = manager
         self.workers = {worker.name: worker for worker in workers}
+        self.prefetch = prefetch
+        self.max_workers = max_workers
 
     def run(self, task: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -226,12 +515,16 @@ Respond with your plan and the subtask for each worker.
         plan = self.manager.run(manager_prompt, context)
         self._log_execution(self.manager.name, plan)
 
-        worker_results = {}
-        for worker_name, worker in self.workers.items():
-            subtask = f"Based on the manager's plan:\n{plan}\n\nComplete your part of the task: {task}"
-            result = worker.run(subtask, context)
-            worker_results[worker_name] = result
-            self._log_execution(worker_name, result)
+        subtask = f"Based on the manager's plan:\n{plan}\n\nComplete your part of the task: {task}"
+
+        if self.prefetch:
+            worker_results = self._prefetch_workers(subtask, context)
+        else:
+            worker_results = {}
+            for worker_name, worker in self.workers.items():
+                result = worker.run(subtask, context)
+                worker_results[worker_name] = result
+                self._log_execution(worker_name, result)
 
         final_prompt = f"""Original task: {task}
 
@@ -248,6 +541,41 @@ Synthesize the final response based on all worker outputs.
 
         return final_result
 
+    def _prefetch_workers(self, subtask: str, context: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Run all worker subtasks in background threads.
+        在后台线程中运行所有工作者子任务。
+
+        Every worker prompt depends only on the manager's plan, so all of
+        them can be dispatched as soon as the plan is available. Results are
+        collected in worker order to keep the history deterministic.
+        每个工作者的提示仅依赖管理者的计划，因此计划生成后即可全部分派。
+
+        Args:
+            subtask: Subtask prompt shared by all workers / 所有工作者共享的子任务提示
+            context: Additional context / 额外上下文
+
+        Returns:
+            Dict mapping worker names to their results / 将工作者名称映射到其结果的字典
+        """
+        worker_results = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                worker_name: executor.submit(worker.run, subtask, context)
+                for worker_name, worker in self.workers.items()
+            }
+
+            for worker_name, future in futures.items():
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = f"Error: {str(e)}"
+                worker_results[worker_name] = result
+                self._log_execution(worker_name, result)
+
+        return worker_results
+
     def _format_results(self, results: Dict[str, str]) -> str:
         """
         Format worker results for display.
@@ -293,6 +621,13 @@ class ConditionalOrchestrator(Orchestrator):
         self.router = router
         self.agents = agents
         self.default_agent = default_agent
+        # Lowercased names, longest first, so the most specific name wins
+        # 小写名称按长度降序排列，优先匹配最具体的名称
+        self._name_lookup = sorted(
+            ((name.lower(), name) for name in agents),
+            key=lambda item: len(item[0]),
+            reverse=True
+        )
 
     def run(self, task: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -313,14 +648,15 @@ Available agents: {', '.join(self.agents.keys())}
 Which agent should handle this task? Respond with just the agent name.
 """
 
-        selected_name = self.router.run(routing_prompt, context).strip()
-        self._log_execution(self.router.name, f"Selected: {selected_name}")
+        router_output = self.router.run(routing_prompt, context).strip()
+        selected_name = self._match_agent_name(router_output)
+        self._log_execution(self.router.name, f"Selected: {selected_name or router_output}")
 
-        if selected_name not in self.agents:
+        if selected_name is None:
             if self.default_agent:
                 selected_name = self.default_agent
             else:
-                selected_name = list(self.agents.keys())[0]
+                selected_name = next(iter(self.agents))
 
         selected_agent = self.agents[selected_name]
         result = selected_agent.run(task, context)
@@ -328,6 +664,170 @@ Which agent should handle this task? Respond with just the agent name.
 
         return result
 
+    def _match_agent_name(self, router_output: str) -> Optional[str]:
+        """
+        Find the agent name mentioned in the router's output.
+        在路由器输出中查找提到的智能体名称。
+
+        Routers often wrap the name in prose (e.g. "The best agent is:
+        researcher."), so after an exact match the longest agent name
+        contained in the output is used.
+        路由器常在名称外包裹说明文字，因此精确匹配失败后使用输出中包含的最长名称。
+
+        Args:
+            router_output: Raw router response / 路由器原始响应
+
+        Returns:
+            Matched agent name or None / 匹配的智能体名称或None
+        """
+        if router_output in self.agents:
+            return router_output
+
+        lowered = router_output.lower()
+        for lowered_name, name in self._name_lookup:
+            if lowered_name in lowered:
+                return name
+        return None
+
+
+class SpeculativeOrchestrator(Orchestrator):
+    """
+    Speculative orchestrator - a cheap draft of the final step runs alongside
+    the upstream agent, and the final agent only verifies or repairs it.
+    推测式编排器 - 最终步骤的低成本草稿与上游智能体同时运行，最终智能体只需验证或修正草稿。
+
+    When the draft is accepted, the final agent answers with a short ACCEPT
+    instead of generating the full response, so the expensive step costs
+    little more than the upstream agent's latency. The draft can be given a
+    reduced task (``draft_task``) holding only what it needs, and the result
+    keeps the upstream output next to the final one.
+    草稿被接受时，最终智能体只需回复简短的ACCEPT而非生成完整响应，
+    因此昂贵步骤的耗时几乎只取决于上游智能体。草稿可以接收只包含所需内容的精简任务
+    （``draft_task``），结果中同时保留上游输出和最终输出。
+
+    Example:
+        [Analyst, DraftVisualizer] → Visualizer (accept / repair)
+        [分析师, 草稿可视化专家] → 可视化专家（接受 / 修正）
+    """
+
+    VERIFY_TEMPLATE = (
+        "Upstream result:\n{upstream}\n\n"
+        "Draft response written before the upstream result was available:\n{draft}\n\n"
+        "Original task: {task}\n\n"
+        "If the draft is correct and complete given the upstream result, reply "
+        "with exactly ACCEPT. Otherwise reply with the corrected full response."
+    )
+
+    def __init__(self, upstream: Agent, draft: Agent, verifier: Agent):
+        """
+        Initialize speculative orchestrator.
+        初始化推测式编排器。
+
+        Args:
+            upstream: Agent whose result the final step depends on / 最终步骤所依赖的上游智能体
+            draft: Fast agent (e.g. a smaller model) that drafts the final
+                response without the upstream result / 在没有上游结果时起草最终响应的快速智能体（如小模型）
+            verifier: Agent that accepts or repairs the draft / 接受或修正草稿的智能体
+        """
+        super().__init__([upstream, draft, verifier])
+        self.upstream = upstream
+        self.draft = draft
+        self.verifier = verifier
+
+    def _finish(self, upstream_result: str, draft_result: str, verdict: str) -> Dict[str, str]:
+        """
+        Log the verifier's verdict and build the final result.
+        记录验证者的结论并构建最终结果。
+
+        Args:
+            upstream_result: Upstream agent output / 上游智能体输出
+            draft_result: Draft agent output / 草稿智能体输出
+            verdict: Verifier reply / 验证者回复
+
+        Returns:
+            Upstream output and final response, keyed by agent name /
+                以智能体名称为键的上游输出和最终响应
+        """
+        # Only a reply that is exactly ACCEPT counts; anything else, such as
+        # "ACCEPT, but ..." or "Accept.", is a repair
+        # 只有恰好为ACCEPT的回复才算接受；其他任何回复（如"ACCEPT, but ..."或"Accept."）都视为修正
+        accepted = verdict.strip() == "ACCEPT"
+        print(f"[SpeculativeOrchestrator] Draft {'accepted' if accepted else 'repaired'}")
+        self._log_execution(self.verifier.name, verdict)
+        return {
+            self.upstream.name: upstream_result,
+            self.verifier.name: draft_result if accepted else verdict
+        }
+
+    def run(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]] = None,
+        draft_task: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Run the upstream and draft agents together, then verify the draft.
+        同时运行上游和草稿智能体，然后验证草稿。
+
+        Args:
+            task: Task description / 任务描述
+            context: Additional context / 额外上下文
+            draft_task: Reduced task for the draft agent, defaults to task /
+                草稿智能体的精简任务，默认为task
+
+        Returns:
+            Upstream output and the accepted draft or the verifier's repaired
+                response, keyed by agent name /
+                以智能体名称为键的上游输出，以及被接受的草稿或验证者修正后的响应
+        """
+        print(f"[SpeculativeOrchestrator] Running {self.upstream.name} and {self.draft.name}")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            upstream_future = executor.submit(self.upstream.run, task, context)
+            draft_future = executor.submit(self.draft.run, draft_task or task, context)
+            upstream_result = upstream_future.result()
+            draft_result = draft_future.result()
+        self._log_execution(self.upstream.name, upstream_result)
+        self._log_execution(self.draft.name, draft_result)
+
+        verdict = self.verifier.run(self.VERIFY_TEMPLATE.format(
+            upstream=upstream_result, draft=draft_result, task=task
+        ))
+        return self._finish(upstream_result, draft_result, verdict)
+
+    async def run_async(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]] = None,
+        draft_task: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Async version of run() on one event loop.
+        在同一事件循环上运行的run()异步版本。
+
+        Args:
+            task: Task description / 任务描述
+            context: Additional context / 额外上下文
+            draft_task: Reduced task for the draft agent, defaults to task /
+                草稿智能体的精简任务，默认为task
+
+        Returns:
+            Upstream output and the accepted draft or the verifier's repaired
+                response, keyed by agent name /
+                以智能体名称为键的上游输出，以及被接受的草稿或验证者修正后的响应
+        """
+        print(f"[SpeculativeOrchestrator] Running {self.upstream.name} and {self.draft.name}")
+        upstream_result, draft_result = await asyncio.gather(
+            self.upstream.run_async(task, context),
+            self.draft.run_async(draft_task or task, context)
+        )
+        self._log_execution(self.upstream.name, upstream_result)
+        self._log_execution(self.draft.name, draft_result)
+
+        verdict = await self.verifier.run_async(self.VERIFY_TEMPLATE.format(
+            upstream=upstream_result, draft=draft_result, task=task
+        ))
+        return self._finish(upstream_result, draft_result, verdict)
+
 
 class CustomOrchestrator(Orchestrator):
     """
@@ -9,8 +9,31 @@ License: MIT
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 import json
+import sys
+
+from .cache import ToolResultCache
+
+try:
+    from jsonschema import Draft7Validator
+    from jsonschema.exceptions import SchemaError
+except ImportError:
+    # jsonschema is optional; fall back to the built-in checks
+    Draft7Validator = None
+
+
+# JSON schema type name -> Python type(s) used by the built-in checks
+# JSON Schema类型名 -> 内置检查使用的Python类型
+_TYPE_MAP = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict
+}
 
 
 class Tool(ABC):
@@ -25,8 +48,19 @@ class Tool(ABC):
         name (str): Unique identifier for the tool / 工具的唯一标识符
         description (str): Description of what the tool does / 工具功能描述
         parameters (Dict): Parameter schema for the tool / 工具的参数模式
+        cacheable (bool): Whether results depend only on the arguments and may
+            be reused / 结果是否只取决于参数并可复用
     """
 
+    # Opt-in: set True on tools without side effects so repeated calls are
+    # served from ToolResultCache / 无副作用的工具可设为True以复用结果
+    cacheable = False
+
+    __slots__ = (
+        '_name', '_description', '_parameters', '_cached_dict',
+        '_validator', '_expected_types', '_required'
+    )
+
     def __init__(
         self,
         name: str,
@@ -42,10 +76,76 @@ class Tool(ABC):
             description: Tool description / 工具描述
             parameters: Parameter schema (optional) / 参数模式（可选）
         """
+        self._cached_dict: Optional[Dict[str, Any]] = None
         self.name = name
         self.description = description
         self.parameters = parameters or {}
 
+    @property
+    def name(self) -> str:
+        """Tool name / 工具名称"""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        # Interned names make registry and agent lookups an identity compare
+        # 驻留的名称使注册表和智能体查找只需比较对象标识
+        self._name = sys.intern(value) if isinstance(value, str) else value
+        self._cached_dict = None
+
+    @property
+    def description(self) -> str:
+        """Tool description / 工具描述"""
+        return self._description
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
+        self._cached_dict = None
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """Parameter schema / 参数模式"""
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self, value: Dict[str, Any]) -> None:
+        self._parameters = value
+        self._cached_dict = None
+        self._required = tuple(value.get("required", ()))
+        properties = value.get("properties", {})
+        # Schemas without required fields or properties accept anything, so
+        # skip compiling a validator for them / 无必需字段和属性的模式接受任意参数，无需编译验证器
+        self._validator = (
+            self._build_validator(value) if self._required or properties else None
+        )
+        self._expected_types = {
+            key: _TYPE_MAP[prop["type"]]
+            for key, prop in properties.items()
+            if prop.get("type") in _TYPE_MAP
+        }
+
+    @staticmethod
+    def _build_validator(schema: Dict[str, Any]):
+        """
+        Compile a JSON schema validator for the parameter schema.
+        为参数模式编译JSON Schema验证器。
+
+        Args:
+            schema: Parameter schema / 参数模式
+
+        Returns:
+            Validator, or None if jsonschema is unavailable or the schema is
+            invalid / 验证器；如果jsonschema不可用或模式无效则为None
+        """
+        if Draft7Validator is None or not schema:
+            return None
+        try:
+            Draft7Validator.check_schema(schema)
+        except SchemaError:
+            return None
+        return Draft7Validator(schema)
+
     @abstractmethod
     def execute(self, **kwargs) -> Dict[str, Any]:
         """
@@ -71,68 +171,52 @@ class Tool(ABC):
         Convert tool to dictionary format for LLM function calling.
         将工具转换为LLM函数调用的字典格式。
 
+        The dict is built once and reused until name, description or
+        parameters are reassigned; callers must not mutate it.
+        字典只构建一次并复用，直到名称、描述或参数被重新赋值；调用方不应修改它。
+
         Returns:
             Dict representation of the tool / 工具的字典表示
         """
-        return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": self.parameters
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.parameters
+            }
+        return self._cached_dict
 
     def validate_parameters(self, **kwargs) -> bool:
         """
         Validate provided parameters against the schema.
         根据模式验证提供的参数。
 
+        Uses the precompiled jsonschema validator when available, otherwise
+        falls back to required-field and type checks.
+        可用时使用预编译的jsonschema验证器，否则回退到必需字段和类型检查。
+
         Args:
             **kwargs: Parameters to validate / 要验证的参数
 
         Returns:
             True if valid, False otherwise / 如果有效则为True，否则为False
         """
-        if not self.parameters:
-            return True
+        if self._validator is not None:
+            return self._validator.is_valid(kwargs)
 
-        required = self.parameters.get("required", [])
-        properties = self.parameters.get("properties", {})
+        if not self._required and not self._expected_types:
+            return True
 
-        for param in required:
+        for param in self._required:
             if param not in kwargs:
                 return False
 
+        expected_types = self._expected_types
         for key, value in kwargs.items():
-            if key in properties:
-                expected_type = properties[key].get("type")
-                if expected_type and not self._check_type(value, expected_type):
-                    return False
-
-        return True
-
-    def _check_type(self, value: Any, expected_type: str) -> bool:
-        """
-        Check if value matches expected type.
-        检查值是否匹配预期类型。
-
-        Args:
-            value: Value to check / 要检查的值
-            expected_type: Expected type string / 预期类型字符串
-
-        Returns:
-            True if types match / 如果类型匹配则为True
-        """
-        type_mapping = {
-            "string": str,
-            "number": (int, float),
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict
-        }
+            expected = expected_types.get(key)
+            if expected is not None and not isinstance(value, expected):
+                return False
 
-        expected = type_mapping.get(expected_type)
-        if expected:
-            return isinstance(value, expected)
         return True
 
     def __repr__(self) -> str:
@@ -154,9 +238,19 @@ class ToolRegistry:
     此类维护工具集合，并提供注册、检索和列出工具的方法。
     """
 
-    def __init__(self):
-        """Initialize the tool registry. / 初始化工具注册表。"""
+    __slots__ = ('_tools', '_result_cache')
+
+    def __init__(self, result_cache: Optional[ToolResultCache] = None):
+        """
+        Initialize the tool registry.
+        初始化工具注册表。
+
+        Args:
+            result_cache: Cache for results of cacheable tools (optional) /
+                可缓存工具结果的缓存（可选）
+        """
         self._tools: Dict[str, Tool] = {}
+        self._result_cache = ToolResultCache() if result_cache is None else result_cache
 
     def register(self, tool: Tool) -> None:
         """
@@ -186,6 +280,23 @@ class ToolRegistry:
         """
         return self._tools.get(name)
 
+    def execute(self, name: str, **kwargs) -> Dict[str, Any]:
+        """
+        Execute a registered tool, reusing cached results when allowed.
+        执行已注册的工具，允许时复用缓存结果。
+
+        Args:
+            name: Tool name / 工具名称
+            **kwargs: Tool parameters / 工具参数
+
+        Returns:
+            Tool execution result / 工具执行结果
+
+        Raises:
+            KeyError: If the tool is not registered / 如果工具未注册
+        """
+        return self._result_cache.call(self._tools[name], kwargs)
+
     def list_tools(self) -> list[str]:
         """
         List all registered tool names.
@@ -196,15 +307,19 @@ class ToolRegistry:
         """
         return list(self._tools.keys())
 
-    def get_all(self) -> Dict[str, Tool]:
+    def get_all(self) -> Mapping[str, Tool]:
         """
         Get all registered tools.
         获取所有已注册的工具。
 
+        Returns a read-only view instead of a copy; use register/unregister
+        to change the registry.
+        返回只读视图而非副本；请通过register/unregister修改注册表。
+
         Returns:
-            Dictionary of all tools / 所有工具的字典
+            Read-only mapping of all tools / 所有工具的只读映射
         """
-        return self._tools.copy()
+        return MappingProxyType(self._tools)
 
     def unregister(self, name: str) -> bool:
         """
@@ -224,10 +339,11 @@ class ToolRegistry:
 
     def clear(self) -> None:
         """
-        Clear all registered tools.
-        清除所有已注册的工具。
+        Clear all registered tools and cached results.
+        清除所有已注册的工具和缓存结果。
         """
         self._tools.clear()
+        self._result_cache.clear()
 
     def __len__(self) -> int:
         """Return number of registered tools."""
@@ -8,16 +8,25 @@ Author: LLM Agent Framework
 License: MIT
 """
 
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from functools import lru_cache
 
-from core.agent import Agent
-from core.llm_client import LLMClient
-from tools.base_tools import CalculatorTool, TextProcessingTool
-from dotenv import load_dotenv
+# Framework imports and load_dotenv() live inside the examples and the
+# __main__ block, so importing one example doesn't pay for the others
+# 框架导入和load_dotenv()放在示例函数和__main__块中，导入单个示例时无需加载其余部分
 
-load_dotenv()
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Create the LLM client once and reuse it. / 只创建一次LLM客户端并复用。"""
+    from core.llm_client import LLMClient
+
+    return LLMClient(
+        api_url=os.getenv("LLM_API_URL"),
+        api_key=os.getenv("LLM_API_KEY"),
+        model=os.getenv("LLM_MODEL", "gpt-4"),
+        cache_size=128
+    )
 
 
 def example_1_simple_agent():
@@ -25,16 +34,15 @@ def example_1_simple_agent():
     Example 1: Create a simple agent with calculator tool.
     示例1：创建一个带有计算器工具的简单智能体。
     """
+    from core.agent import Agent
+    from tools.base_tools import CalculatorTool
+
     print("=" * 60)
     print("Example 1: Simple Agent with Calculator")
     print("示例1：带计算器的简单智能体")
     print("=" * 60)
 
-    client = LLMClient(
-        api_url=os.getenv("LLM_API_URL"),
-        api_key=os.getenv("LLM_API_KEY"),
-        model=os.getenv("LLM_MODEL", "gpt-4")
-    )
+    client = _get_client()
 
     agent = Agent(
         name="MathAssistant",
@@ -52,16 +60,15 @@ def example_2_multiple_tools():
     Example 2: Agent with multiple tools.
     示例2：具有多个工具的智能体。
     """
+    from core.agent import Agent
+    from tools.base_tools import CalculatorTool, TextProcessingTool
+
     print("=" * 60)
     print("Example 2: Agent with Multiple Tools")
     print("示例2：具有多个工具的智能体")
     print("=" * 60)
 
-    client = LLMClient(
-        api_url=os.getenv("LLM_API_URL"),
-        api_key=os.getenv("LLM_API_KEY"),
-        model=os.getenv("LLM_MODEL", "gpt-4")
-    )
+    client = _get_client()
 
     agent = Agent(
         name="TextAnalyzer",
@@ -83,16 +90,15 @@ def example_3_conversation_memory():
     Example 3: Agent with conversation memory.
     示例3：具有对话记忆的智能体。
     """
+    from core.agent import Agent
+    from tools.base_tools import CalculatorTool
+
     print("=" * 60)
     print("Example 3: Agent with Conversation Memory")
     print("示例3：具有对话记忆的智能体")
     print("=" * 60)
 
-    client = LLMClient(
-        api_url=os.getenv("LLM_API_URL"),
-        api_key=os.getenv("LLM_API_KEY"),
-        model=os.getenv("LLM_MODEL", "gpt-4")
-    )
+    client = _get_client()
 
     agent = Agent(
         name="Assistant",
@@ -113,16 +119,15 @@ def example_4_custom_system_prompt():
     Example 4: Agent with custom system prompt.
     示例4：具有自定义系统提示的智能体。
     """
+    from core.agent import Agent
+    from tools.base_tools import CalculatorTool
+
     print("=" * 60)
     print("Example 4: Custom System Prompt")
     print("示例4：自定义系统提示")
     print("=" * 60)
 
-    client = LLMClient(
-        api_url=os.getenv("LLM_API_URL"),
-        api_key=os.getenv("LLM_API_KEY"),
-        model=os.getenv("LLM_MODEL", "gpt-4")
-    )
+    client = _get_client()
 
     custom_prompt = """You are a professional data scientist specializing in
     statistical analysis. Provide detailed, academic-style explanations."""
@@ -143,16 +148,15 @@ def example_5_execution_log():
     Example 5: Viewing agent execution logs.
     示例5：查看智能体执行日志。
     """
+    from core.agent import Agent
+    from tools.base_tools import CalculatorTool
+
     print("=" * 60)
     print("Example 5: Execution Logs")
     print("示例5：执行日志")
     print("=" * 60)
 
-    client = LLMClient(
-        api_url=os.getenv("LLM_API_URL"),
-        api_key=os.getenv("LLM_API_KEY"),
-        model=os.getenv("LLM_MODEL", "gpt-4")
-    )
+    client = _get_client()
 
     agent = Agent(
         name="Calculator",
@@ -162,10 +166,17 @@ def example_5_execution_log():
 
     agent.run("Calculate sqrt(25)")
 
-    log = agent.get_execution_log()
+    import numpy as np
+
+    log = agent.get_execution_log_array()
     print(f"\nExecution log entries: {len(log)}")
-    for entry in log:
-        print(f"- {entry['event_type']}: {entry.get('data', '')[:50]}...")
+    for event_type, data in zip(log["event_type"], log["data"].astype("U50")):
+        print(f"- {event_type}: {data}...")
+
+    event_types, counts = np.unique(log["event_type"], return_counts=True)
+    print("\nEvents by type / 按类型统计事件:")
+    for event_type, count in zip(event_types, counts):
+        print(f"- {event_type}: {count}")
     print()
 
 
@@ -180,6 +191,11 @@ if __name__ == "__main__":
     - LLM_API_KEY
     - LLM_MODEL
     """
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from dotenv import load_dotenv
+    load_dotenv()
 
     print("\n" + "="*60)
     print("LLM Agent Framework - Basic Usage Examples")
@@ -8,17 +8,33 @@ Author: LLM Agent Framework
 License: MIT
 """
 
+import copy
 import sys
 import os
+import math
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from typing import Dict, Any, List
 from core.tool import Tool
-from core.agent import Agent
-from core.llm_client import LLMClient
-from dotenv import load_dotenv
 
-load_dotenv()
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional; without it the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Largest n whose Fibonacci number fits in int64 / 斐波那契数可放入int64的最大n
+_FIB_INT64_MAX_N = 92
+
+
+@njit(cache=True, nogil=True)
+def _fib_kernel(n):
+    """Iterative Fibonacci for n <= _FIB_INT64_MAX_N. / n <= _FIB_INT64_MAX_N时的迭代斐波那契。"""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
 
 class CustomCalculatorTool(Tool):
@@ -27,28 +43,44 @@ class CustomCalculatorTool(Tool):
     示例：带有额外功能的自定义计算器。
     """
 
+    cacheable = True
+
+    _PARAMETERS = {
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "description": "Operation: 'factorial', 'fibonacci', 'power'"
+            },
+            "number": {
+                "type": "integer",
+                "description": "Input number"
+            },
+            "base": {
+                "type": "integer",
+                "description": "Base for power operation (optional)"
+            }
+        },
+        "required": ["operation", "number"]
+    }
+
+    # Static fields of a successful result; execute() copies and fills it
+    # 成功结果的固定字段；execute()复制后填充
+    _RESULT_TEMPLATE = {
+        "success": True,
+        "operation": None,
+        "input": None,
+        "result": None
+    }
+
     def __init__(self):
         super().__init__(
             name="custom_calculator",
             description="Perform calculations with custom functions like factorial and fibonacci",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "description": "Operation: 'factorial', 'fibonacci', 'power'"
-                    },
-                    "number": {
-                        "type": "integer",
-                        "description": "Input number"
-                    },
-                    "base": {
-                        "type": "integer",
-                        "description": "Base for power operation (optional)"
-                    }
-                },
-                "required": ["operation", "number"]
-            }
+            # Each instance gets its own copy, so changing one tool's schema
+            # never leaks into the class template or other instances
+            # 每个实例都有自己的副本，修改某个工具的模式不会影响类模板或其他实例
+            parameters=copy.deepcopy(self._PARAMETERS)
         )
 
     def execute(self, operation: str, number: int, base: int = 2, **kwargs) -> Dict[str, Any]:
@@ -62,19 +94,18 @@ class CustomCalculatorTool(Tool):
             elif operation == "fibonacci":
                 result = self._fibonacci(number)
             elif operation == "power":
-                result = number ** base
+                result = pow(number, base)
             else:
                 return {
                     "success": False,
                     "error": f"Unknown operation: {operation}"
                 }
 
-            return {
-                "success": True,
-                "operation": operation,
-                "input": number,
-                "result": result
-            }
+            response = self._RESULT_TEMPLATE.copy()
+            response["operation"] = operation
+            response["input"] = number
+            response["result"] = result
+            return response
 
         except Exception as e:
             return {
@@ -86,19 +117,20 @@ class CustomCalculatorTool(Tool):
         """Calculate factorial. / 计算阶乘。"""
         if n < 0:
             raise ValueError("Factorial not defined for negative numbers")
-        if n == 0 or n == 1:
-            return 1
-        return n * self._factorial(n - 1)
+        return math.factorial(n)
 
     def _fibonacci(self, n: int) -> int:
         """Calculate nth Fibonacci number. / 计算第n个斐波那契数。"""
         if n < 0:
             raise ValueError("Fibonacci not defined for negative numbers")
-        if n == 0:
-            return 0
-        if n == 1:
-            return 1
-        return self._fibonacci(n - 1) + self._fibonacci(n - 2)
+        if n <= _FIB_INT64_MAX_N:
+            return int(_fib_kernel(n))
+        # Beyond int64 the compiled kernel would overflow; use Python ints
+        # 超出int64范围时编译内核会溢出，改用Python整数
+        a, b = 0, 1
+        for _ in range(n):
+            a, b = b, a + b
+        return a
 
 
 class WeatherTool(Tool):
@@ -110,24 +142,37 @@ class WeatherTool(Tool):
     在生产环境中，与真实的天气API（如OpenWeatherMap）集成。
     """
 
+    cacheable = True
+
+    _PARAMETERS = {
+        "type": "object",
+        "properties": {
+            "city": {
+                "type": "string",
+                "description": "City name"
+            },
+            "units": {
+                "type": "string",
+                "description": "Units: 'celsius' or 'fahrenheit'"
+            }
+        },
+        "required": ["city"]
+    }
+
+    _RESULT_TEMPLATE = {
+        "success": True,
+        "city": None,
+        "temperature": None,
+        "units": "celsius",
+        "condition": "Sunny",
+        "message": "This is mock data. Integrate with a real weather API for production."
+    }
+
     def __init__(self, api_key: str = None):
         super().__init__(
             name="weather",
             description="Get weather information for a city",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "city": {
-                        "type": "string",
-                        "description": "City name"
-                    },
-                    "units": {
-                        "type": "string",
-                        "description": "Units: 'celsius' or 'fahrenheit'"
-                    }
-                },
-                "required": ["city"]
-            }
+            parameters=copy.deepcopy(self._PARAMETERS)
         )
         self.api_key = api_key
 
@@ -136,14 +181,11 @@ class WeatherTool(Tool):
         Get weather information.
         获取天气信息。
         """
-        return {
-            "success": True,
-            "city": city,
-            "temperature": 22 if units == "celsius" else 72,
-            "units": units,
-            "condition": "Sunny",
-            "message": "This is mock data. Integrate with a real weather API for production."
-        }
+        result = self._RESULT_TEMPLATE.copy()
+        result["city"] = city
+        result["temperature"] = 22 if units == "celsius" else 72
+        result["units"] = units
+        return result
 
 
 class DatabaseQueryTool(Tool):
@@ -155,24 +197,34 @@ class DatabaseQueryTool(Tool):
     创建与数据库交互的工具的模板。
     """
 
+    _PARAMETERS = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "SQL query to execute"
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of results"
+            }
+        },
+        "required": ["query"]
+    }
+
+    _RESULT_TEMPLATE = {
+        "success": True,
+        "query": None,
+        "results": None,
+        "count": 0,
+        "message": "Mock results. Connect to real database for production."
+    }
+
     def __init__(self, connection_string: str = None):
         super().__init__(
             name="database_query",
             description="Query database and return results",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "SQL query to execute"
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of results"
-                    }
-                },
-                "required": ["query"]
-            }
+            parameters=copy.deepcopy(self._PARAMETERS)
         )
         self.connection_string = connection_string
 
@@ -184,16 +236,16 @@ class DatabaseQueryTool(Tool):
         # In production, use actual database connection
         # import sqlite3 or psycopg2, etc.
 
-        return {
-            "success": True,
-            "query": query,
-            "results": [
-                {"id": 1, "name": "Example Row 1"},
-                {"id": 2, "name": "Example Row 2"}
-            ],
-            "count": 2,
-            "message": "Mock results. Connect to real database for production."
-        }
+        rows = [
+            {"id": 1, "name": "Example Row 1"},
+            {"id": 2, "name": "Example Row 2"}
+        ]
+
+        result = self._RESULT_TEMPLATE.copy()
+        result["query"] = query
+        result["results"] = rows
+        result["count"] = len(rows)
+        return result
 
 
 class EmailTool(Tool):
@@ -205,28 +257,37 @@ class EmailTool(Tool):
     创建通信工具的模板。
     """
 
+    _PARAMETERS = {
+        "type": "object",
+        "properties": {
+            "to": {
+                "type": "string",
+                "description": "Recipient email address"
+            },
+            "subject": {
+                "type": "string",
+                "description": "Email subject"
+            },
+            "body": {
+                "type": "string",
+                "description": "Email body"
+            }
+        },
+        "required": ["to", "subject", "body"]
+    }
+
+    _RESULT_TEMPLATE = {
+        "success": True,
+        "to": None,
+        "subject": None,
+        "message": "Email sent successfully (mock). Configure SMTP for real sending."
+    }
+
     def __init__(self, smtp_config: Dict[str, Any] = None):
         super().__init__(
             name="email",
             description="Send emails",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "to": {
-                        "type": "string",
-                        "description": "Recipient email address"
-                    },
-                    "subject": {
-                        "type": "string",
-                        "description": "Email subject"
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Email body"
-                    }
-                },
-                "required": ["to", "subject", "body"]
-            }
+            parameters=copy.deepcopy(self._PARAMETERS)
         )
         self.smtp_config = smtp_config or {}
 
@@ -239,12 +300,10 @@ class EmailTool(Tool):
         # import smtplib
         # from email.mime.text import MIMEText
 
-        return {
-            "success": True,
-            "to": to,
-            "subject": subject,
-            "message": "Email sent successfully (mock). Configure SMTP for real sending."
-        }
+        result = self._RESULT_TEMPLATE.copy()
+        result["to"] = to
+        result["subject"] = subject
+        return result
 
 
 def example_using_custom_tools():
@@ -252,6 +311,9 @@ def example_using_custom_tools():
     Example of using custom tools with an agent.
     使用自定义工具与智能体的示例。
     """
+    from core.agent import Agent
+    from core.llm_client import LLMClient
+
     print("=" * 70)
     print("Custom Tools Example / 自定义工具示例")
     print("=" * 70)
@@ -311,6 +373,9 @@ if __name__ == "__main__":
     - Include error handling / 包含错误处理
     """
 
+    from dotenv import load_dotenv
+    load_dotenv()
+
     print("\n" + "="*70)
     print("Custom Tool Template Examples")
     print("自定义工具模板示例")
@@ -8,41 +8,49 @@ Author: LLM Agent Framework
 License: MIT
 """
 
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from core.agent import Agent
-from core.llm_client import LLMClient
-from core.orchestrator import (
-    SequentialOrchestrator,
-    ParallelOrchestrator,
-    HierarchicalOrchestrator
-)
-from tools.base_tools import CalculatorTool, TextProcessingTool
-from tools.research_tools import ScientificComputeTool
-from dotenv import load_dotenv
-
-load_dotenv()
+import asyncio
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def create_client():
-    """Create and return LLM client. / 创建并返回LLM客户端。"""
+    """Create the LLM client once and reuse it. / 只创建一次LLM客户端并复用。"""
+    from core.llm_client import LLMClient
+
     return LLMClient(
         api_url=os.getenv("LLM_API_URL"),
         api_key=os.getenv("LLM_API_KEY"),
-        model=os.getenv("LLM_MODEL", "gpt-4")
+        model=os.getenv("LLM_MODEL", "gpt-4"),
+        cache_size=128
     )
 
 
+async def run_and_close(orchestrator, task):
+    """
+    Run an orchestrator asynchronously, then close its HTTP clients before
+    asyncio.run ends the loop.
+    异步运行编排器，并在asyncio.run结束事件循环前关闭其HTTP客户端。
+    """
+    try:
+        return await orchestrator.run_async(task)
+    finally:
+        await orchestrator.aclose()
+
+
 def example_1_sequential():
     """
     Example 1: Sequential orchestration.
     示例1：顺序编排。
 
-    Agents work one after another, each building on the previous result.
-    智能体依次工作，每个都建立在前一个结果之上。
+    The researcher and analyst run concurrently; the writer builds on both
+    results.
+    研究员和分析师并发运行；写作者基于两者的结果进行工作。
     """
+    from core.agent import Agent
+    from core.orchestrator import SequentialOrchestrator
+    from tools.base_tools import CalculatorTool, TextProcessingTool
+
     print("=" * 60)
     print("Example 1: Sequential Orchestration")
     print("示例1：顺序编排")
@@ -71,7 +79,12 @@ def example_1_sequential():
         system_prompt="You are a technical writer. Summarize findings clearly."
     )
 
-    orchestrator = SequentialOrchestrator([researcher, analyst, writer])
+    # Researcher and analyst are independent; only the writer needs both
+    # 研究员和分析师互不依赖，只有写作者需要两者的结果
+    orchestrator = SequentialOrchestrator(
+        [researcher, analyst, writer],
+        dependencies={"Writer": ["Researcher", "Analyst"]}
+    )
 
     task = "Analyze the concept of machine learning and its applications"
     print(f"\nTask: {task}\n")
@@ -88,6 +101,9 @@ def example_2_parallel():
     Multiple agents work simultaneously on the same task from different angles.
     多个智能体同时从不同角度处理同一任务。
     """
+    from core.agent import Agent
+    from core.orchestrator import ParallelOrchestrator
+
     print("=" * 60)
     print("Example 2: Parallel Orchestration")
     print("示例2：并行编排")
@@ -121,7 +137,7 @@ def example_2_parallel():
     task = "Analyze quantum computing"
     print(f"\nTask: {task}\n")
 
-    results = orchestrator.run(task)
+    results = asyncio.run(run_and_close(orchestrator, task))
 
     print("\nResults from different perspectives:")
     for agent_name, result in results.items():
@@ -138,6 +154,11 @@ def example_3_hierarchical():
     A manager agent delegates tasks to worker agents.
     管理者智能体将任务委派给工作者智能体。
     """
+    from core.agent import Agent
+    from core.orchestrator import HierarchicalOrchestrator
+    from tools.base_tools import CalculatorTool, TextProcessingTool
+    from tools.research_tools import ScientificComputeTool
+
     print("=" * 60)
     print("Example 3: Hierarchical Orchestration")
     print("示例3：层级编排")
@@ -190,6 +211,10 @@ def example_4_custom_workflow():
     Example 4: Custom workflow combining different patterns.
     示例4：结合不同模式的自定义工作流。
     """
+    from core.agent import Agent
+    from core.orchestrator import ParallelOrchestrator
+    from tools.base_tools import TextProcessingTool
+
     print("=" * 60)
     print("Example 4: Custom Workflow")
     print("示例4：自定义工作流")
@@ -220,12 +245,12 @@ def example_4_custom_workflow():
     print(f"\nTask: {task}\n")
 
     print("Phase 1: Parallel research...")
-    research_results = parallel_orchestrator.run(task)
+    research_results = asyncio.run(run_and_close(parallel_orchestrator, task))
 
-    combined_research = "\n\n".join([
+    combined_research = "\n\n".join(
         f"{name}: {result}"
         for name, result in research_results.items()
-    ])
+    )
 
     print("\nPhase 2: Synthesis...")
     final_result = synthesizer.run(
@@ -240,6 +265,11 @@ if __name__ == "__main__":
     Run orchestration examples.
     运行编排示例。
     """
+    import sys
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from dotenv import load_dotenv
+    load_dotenv()
 
     print("\n" + "="*60)
     print("LLM Agent Framework - Orchestration Examples")
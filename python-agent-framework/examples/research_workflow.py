@@ -10,60 +10,212 @@ License: MIT
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import json
+import string
+import asyncio
+from types import SimpleNamespace
+from functools import lru_cache
+from pathlib import Path
+
+# Framework root, added to sys.path once even if this module is re-imported
+# 框架根目录，即使模块被重复导入也只加入sys.path一次
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 from core.agent import Agent
 from core.llm_client import LLMClient
-from core.orchestrator import SequentialOrchestrator
-from tools.base_tools import CalculatorTool, PythonREPLTool
-from tools.research_tools import ScientificComputeTool, StatisticalTestTool
-from tools.data_tools import DataAnalysisTool, VisualizationTool
+from core.orchestrator import SpeculativeOrchestrator
 from dotenv import load_dotenv
 
-load_dotenv()
+# Skip re-parsing .env when the settings are already in the environment
+# (e.g. the module is re-imported or the variables were exported)
+# 若配置已在环境变量中（如模块被重新导入或变量已导出），则不再重复解析.env
+if "LLM_API_URL" not in os.environ:
+    load_dotenv()
+
+# Section separators for console output / 控制台输出的分隔线
+BAR = "=" * 70
+THIN = "-" * 70
+
+# Client settings are read once, so every client built here sees the same
+# configuration even if the environment changes mid-run
+# 客户端配置只读取一次，即使运行中环境变量改变，此处创建的所有客户端配置也保持一致
+LLM_CFG = SimpleNamespace(
+    url=os.getenv("LLM_API_URL"),
+    key=os.getenv("LLM_API_KEY"),
+    model=os.getenv("LLM_MODEL", "gpt-4"),
+    # Cheaper model for simple steps; falls back to model when unset
+    # 简单步骤使用的较便宜模型；未设置时回退到model
+    small_model=os.getenv("LLM_SMALL_MODEL"),
+    cache_dir=os.getenv("LLM_CACHE_DIR")
+)
+
+# Prompt templates are parsed once at import time
+# 提示模板在导入时只解析一次
+_RESEARCH_TASK_TEMPLATE = string.Template("""
+Research Task: Analyze the relationship between study hours and exam scores.
+
+Dataset of $n students as [study_hours, exam_score] pairs:
+$dataset
+
+Exact statistics computed with SciPy (use these numbers, do not recompute):
+$statistics
+
+Please:
+1. Interpret the descriptive statistics and the correlation
+2. Explain whether the relationship between study hours and scores is significant
+3. Specify one chart that illustrates the findings
+4. Provide a summary of the research findings
+
+Format output bilingually (English + 中文).
+
+The chart is given as JSON only:
+$chart_format
+""")
+
+# Chart spec shared by the full task and the draft task
+# 完整任务和草稿任务共用的图表规格格式
+_CHART_FORMAT = (
+    '{"chart_type": "scatter" | "line" | "bar" | "histogram" | "box", '
+    '"params": {"title": str, "x_column": str, "y_column": str}}'
+)
+
+# The draft only needs the columns, not the dataset or the statistics, so it
+# is answered quickly while the analyst works
+# 草稿只需要列名，不需要数据集或统计量，因此在分析师工作时即可快速完成
+_DRAFT_TASK_TEMPLATE = string.Template("""
+A dataset of $n students has the columns study_hours and exam_score.
+Propose one chart showing how exam scores depend on study hours.
+Reply with JSON only:
+$chart_format
+""")
+
+SAMPLE_DATA = {
+    "group_a": [23, 25, 28, 30, 27, 26, 29, 31, 24, 28],
+    "group_b": [35, 38, 40, 37, 39, 36, 41, 38, 37, 40]
+}
+
+_ANALYSIS_TASK_TEMPLATE = string.Template("""
+Summarize this experimental data:
+$data
+
+Exact statistics computed with SciPy (use these numbers, do not recompute):
+$statistics
+
+Using these numbers:
+1. Summarize the descriptive statistics for both groups
+2. Interpret the two-sample t-test
+3. State whether there's a significant difference (alpha = 0.05)
+
+Format output bilingually (English + 中文).
+""")
+
+
+def render_chart_spec(spec_text: str, data: dict) -> dict:
+    """
+    Render the chart spec chosen by the visualization step.
+    渲染可视化步骤选定的图表规格。
 
+    Args:
+        spec_text: Reply holding the JSON chart spec / 包含JSON图表规格的回复
+        data: Column name to values / 列名到数值的映射
 
-def research_workflow_example():
-    """
-    Complete research workflow: data collection → analysis → visualization.
-    完整的研究工作流：数据收集 → 分析 → 可视化。
+    Returns:
+        VisualizationTool result / VisualizationTool结果
     """
-    print("=" * 70)
-    print("Scientific Research Workflow Example")
-    print("科研工作流示例")
-    print("=" * 70)
-
-    client = LLMClient(
-        api_url=os.getenv("LLM_API_URL"),
-        api_key=os.getenv("LLM_API_KEY"),
-        model=os.getenv("LLM_MODEL", "gpt-4")
+    from tools.data_tools import VisualizationTool
+
+    # Replies may wrap the JSON in prose or a code fence
+    # 回复可能会用文字或代码块包裹JSON
+    try:
+        spec = json.loads(spec_text[spec_text.find("{"):spec_text.rfind("}") + 1])
+    except ValueError as e:
+        return {"success": False, "error": f"Invalid chart spec: {e}"}
+    return VisualizationTool().execute(
+        chart_type=spec.get("chart_type", "scatter"),
+        data=data,
+        params=spec.get("params")
     )
 
-    print("\n1. Creating specialized research agents...")
-    print("1. 创建专门的研究智能体...")
 
-    data_engineer = Agent(
-        name="DataEngineer",
-        llm_client=client,
-        tools=[
-            PythonREPLTool(),
-            CalculatorTool()
-        ],
-        system_prompt="""You are a data engineer. You collect, clean, and
-        prepare data for analysis. Generate sample datasets when needed."""
+@lru_cache(maxsize=1)
+def _get_client():
+    """Create the LLM client once and share it. / 只创建一次LLM客户端并共享。"""
+    # Set LLM_CACHE_DIR to replay identical requests from disk on reruns
+    # 设置LLM_CACHE_DIR后，重复运行时相同请求将从磁盘缓存返回
+    return LLMClient(
+        api_url=LLM_CFG.url,
+        api_key=LLM_CFG.key,
+        model=LLM_CFG.model,
+        cache_dir=LLM_CFG.cache_dir
     )
 
-    statistician = Agent(
-        name="Statistician",
-        llm_client=client,
-        tools=[
-            StatisticalTestTool(),
-            ScientificComputeTool(),
-            CalculatorTool()
-        ],
-        system_prompt="""You are a statistician. Perform statistical analysis
-        and hypothesis testing on datasets."""
-    )
+
+def generate_study_dataset(n: int = 50, seed: int = 0):
+    """
+    Generate a reproducible study-hours vs exam-score dataset.
+    生成可复现的学习时长与考试成绩数据集。
+
+    Args:
+        n: Number of students / 学生人数
+        seed: Random seed / 随机种子
+
+    Returns:
+        (hours, scores) NumPy arrays / (学习时长, 成绩) NumPy数组
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    hours = rng.uniform(0, 10, n)
+    scores = np.clip(50 + 5 * hours + rng.normal(0, 10, n), 0, 100)
+    return hours, scores
+
+
+def describe_sample(values) -> dict:
+    """
+    Descriptive statistics of a sample, rounded for prompts.
+    样本的描述性统计，为提示进行了舍入。
+
+    Args:
+        values: Sample values / 样本值
+
+    Returns:
+        Dict with n, mean, std, min and max / 包含n、均值、标准差、最小值和最大值的字典
+    """
+    from scipy import stats
+
+    desc = stats.describe(values)
+    return {
+        "n": int(desc.nobs),
+        "mean": round(float(desc.mean), 3),
+        "std": round(float(desc.variance) ** 0.5, 3),
+        "min": round(float(desc.minmax[0]), 3),
+        "max": round(float(desc.minmax[1]), 3)
+    }
+
+
+async def research_workflow_example():
+    """
+    Complete research workflow: local dataset → [analysis, draft chart] →
+    verified chart → rendered visualization.
+    完整的研究工作流：本地数据集 → [分析, 图表草稿] → 经验证的图表 → 渲染的可视化。
+
+    The dataset is generated with NumPy rather than by an LLM agent, which
+    saves a round-trip and makes the numbers reproducible.
+    数据集由NumPy生成而非LLM智能体生成，省去一次往返调用并使数据可复现。
+    """
+    import numpy as np
+    from scipy import stats
+    from tools.base_tools import CalculatorTool
+    from tools.data_tools import DataAnalysisTool
+
+    print(BAR, "Scientific Research Workflow Example", "科研工作流示例", BAR, sep="\n")
+
+    client = _get_client()
+
+    print("\n1. Creating specialized research agents...")
+    print("1. 创建专门的研究智能体...")
 
     data_analyst = Agent(
         name="DataAnalyst",
@@ -76,129 +228,151 @@ def research_workflow_example():
         extract meaningful insights."""
     )
 
+    # Verifies the draft chart spec, so it keeps the main model; the chart is
+    # rendered locally from the final spec, so no agent needs the tool
+    # 负责验证图表规格草稿，因此使用主模型；图表根据最终规格在本地渲染，因此智能体都不需要该工具
     visualizer = Agent(
         name="Visualizer",
         llm_client=client,
-        tools=[
-            VisualizationTool(),
-        ],
-        system_prompt="""You are a data visualization specialist. Create
-        clear and informative visualizations."""
+        tools=[],
+        system_prompt="""You are a data visualization specialist. Choose
+        clear and informative charts and give them as JSON chart specs."""
+    )
+
+    # Drafts the chart spec from the column names alone while the analyst works
+    # 在分析师工作时仅根据列名起草图表规格
+    draft_visualizer = Agent(
+        name="DraftVisualizer",
+        llm_client=client,
+        model=LLM_CFG.small_model,
+        tools=[],
+        system_prompt="""You are a data visualization specialist. Propose
+        clear and informative charts as JSON chart specs."""
     )
 
     print("\n2. Creating research orchestrator...")
     print("2. 创建研究编排器...")
 
-    research_team = SequentialOrchestrator([
-        data_engineer,
-        statistician,
-        data_analyst,
-        visualizer
-    ])
+    # The statistics are computed locally, so no statistician agent is needed.
+    # The analyst interprets them while a chart spec is drafted; the visualizer
+    # then only accepts or repairs that draft
+    # 统计量在本地计算，无需统计学家智能体。分析师解读统计量的同时起草图表规格；
+    # 可视化专家随后只需接受或修正该草稿
+    research_team = SpeculativeOrchestrator(
+        upstream=data_analyst,
+        draft=draft_visualizer,
+        verifier=visualizer
+    )
 
     print("\n3. Defining research task...")
     print("3. 定义研究任务...")
 
-    research_task = """
-    Research Task: Analyze the relationship between study hours and exam scores.
-
-    Please:
-    1. Generate a sample dataset of 50 students with study hours (0-10) and exam scores (0-100)
-    2. Perform statistical analysis (correlation, descriptive statistics)
-    3. Test if there's a significant relationship between study hours and scores
-    4. Create visualizations to illustrate findings
-    5. Provide a summary of the research findings
-
-    研究任务：分析学习时长与考试成绩之间的关系。
-
-    请：
-    1. 生成50名学生的样本数据集，包含学习时长（0-10小时）和考试成绩（0-100分）
-    2. 进行统计分析（相关性、描述性统计）
-    3. 测试学习时长与成绩之间是否存在显著关系
-    4. 创建可视化以说明发现
-    5. 提供研究发现摘要
-    """
+    hours, scores = generate_study_dataset()
+    dataset = np.column_stack([hours, scores]).round(1).tolist()
+    r, p_value = stats.pearsonr(hours, scores)
+    regression = stats.linregress(hours, scores)
+    statistics = {
+        "study_hours": describe_sample(hours),
+        "exam_scores": describe_sample(scores),
+        "pearson_r": round(float(r), 4),
+        "p_value": float(p_value),
+        "regression": {
+            "slope": round(float(regression.slope), 3),
+            "intercept": round(float(regression.intercept), 3),
+            "r_squared": round(float(regression.rvalue) ** 2, 4)
+        }
+    }
+    research_task = _RESEARCH_TASK_TEMPLATE.substitute(
+        n=len(dataset),
+        dataset=json.dumps(dataset, separators=(",", ":")),
+        statistics=json.dumps(statistics, separators=(",", ":")),
+        chart_format=_CHART_FORMAT
+    )
+    draft_task = _DRAFT_TASK_TEMPLATE.substitute(n=len(dataset), chart_format=_CHART_FORMAT)
 
     print("\n4. Executing research workflow...")
     print("4. 执行研究工作流...")
-    print("-" * 70)
+    print(THIN)
 
-    result = research_team.run(research_task)
+    results = await research_team.run_async(research_task, draft_task=draft_task)
 
-    print("\n" + "=" * 70)
-    print("RESEARCH FINDINGS | 研究发现")
-    print("=" * 70)
-    print(result)
-    print("=" * 70)
+    print("\n" + BAR, "RESEARCH FINDINGS | 研究发现", BAR, sep="\n")
+    print(results[data_analyst.name])
+    print(BAR)
+
+    # The accepted or repaired spec is rendered whichever way the verdict went
+    # 无论结论如何，都会渲染被接受或修正后的图表规格
+    chart = render_chart_spec(
+        results[visualizer.name],
+        {"study_hours": hours.round(1).tolist(), "exam_score": scores.round(1).tolist()}
+    )
+    print(f"\nChart | 图表: {chart.get('message') or chart.get('error')}")
 
     print("\n5. Viewing execution history...")
     print("5. 查看执行历史...")
 
-    for i, entry in enumerate(research_team.execution_history, 1):
-        print(f"\nStep {i}: {entry['agent']}")
-        print(f"Timestamp: {entry['timestamp']}")
-        print(f"Result: {entry['result'][:100]}..." if len(entry['result']) > 100 else f"Result: {entry['result']}")
-
-    print("\n" + "=" * 70)
-    print("Research workflow completed successfully!")
-    print("研究工作流成功完成！")
-    print("=" * 70)
+    # Previews are stored with each history entry, so the full results are
+    # never re-measured or sliced here / 预览随历史记录保存，此处无需再测量或切片完整结果
+    columns = research_team.history_columns("agent", "timestamp", "result_preview", "result_len")
+    lines = []
+    for i, (agent, timestamp, preview, result_len) in enumerate(zip(*columns), 1):
+        ellipsis = "..." if result_len > 100 else ""
+        lines.append(
+            f"\nStep {i}: {agent}\n"
+            f"Timestamp: {timestamp}\n"
+            f"Result: {preview[:100]}{ellipsis}\n"
+        )
+    sys.stdout.writelines(lines)
+
+    print(
+        "\n" + BAR,
+        "Research workflow completed successfully!",
+        "研究工作流成功完成！",
+        BAR,
+        sep="\n"
+    )
 
 
-def custom_analysis_example():
+async def custom_analysis_example():
     """
     Custom data analysis example.
     自定义数据分析示例。
     """
-    print("\n" + "=" * 70)
-    print("Custom Data Analysis Example")
-    print("自定义数据分析示例")
-    print("=" * 70)
-
-    client = LLMClient(
-        api_url=os.getenv("LLM_API_URL"),
-        api_key=os.getenv("LLM_API_KEY"),
-        model=os.getenv("LLM_MODEL", "gpt-4")
-    )
+    from scipy import stats
+
+    print("\n" + BAR, "Custom Data Analysis Example", "自定义数据分析示例", BAR, sep="\n")
+
+    client = _get_client()
+
+    # The t-test is exact and instant in SciPy; the LLM only writes the summary
+    # t检验在SciPy中精确且即时完成；LLM只负责撰写总结
+    group_a, group_b = SAMPLE_DATA["group_a"], SAMPLE_DATA["group_b"]
+    t_stat, p_value = stats.ttest_ind(group_a, group_b)
+    statistics = {
+        "group_a": describe_sample(group_a),
+        "group_b": describe_sample(group_b),
+        "t_test": {"t": round(float(t_stat), 4), "p_value": float(p_value)}
+    }
 
     analyst = Agent(
         name="CustomAnalyst",
         llm_client=client,
-        tools=[
-            DataAnalysisTool(),
-            StatisticalTestTool(),
-            CalculatorTool()
-        ],
+        tools=[],
         system_prompt="You are a data analyst specializing in experimental data."
     )
 
-    sample_data = {
-        "group_a": [23, 25, 28, 30, 27, 26, 29, 31, 24, 28],
-        "group_b": [35, 38, 40, 37, 39, 36, 41, 38, 37, 40]
-    }
-
-    task = f"""
-    Analyze this experimental data:
-    {sample_data}
-
-    Perform:
-    1. Descriptive statistics for both groups
-    2. T-test to compare the two groups
-    3. Determine if there's a significant difference
-
-    分析此实验数据并执行：
-    1. 两组的描述性统计
-    2. T检验比较两组
-    3. 确定是否存在显著差异
-    """
+    task = _ANALYSIS_TASK_TEMPLATE.substitute(
+        data=json.dumps(SAMPLE_DATA, separators=(",", ":")),
+        statistics=json.dumps(statistics, separators=(",", ":"))
+    )
 
     print("\nAnalyzing data...")
-    result = analyst.run(task)
+    result = await analyst.run_async(task)
 
     print("\nAnalysis Results | 分析结果:")
-    print("-" * 70)
+    print(THIN)
     print(result)
-    print("=" * 70)
+    print(BAR)
 
 
 if __name__ == "__main__":
@@ -207,17 +381,34 @@ if __name__ == "__main__":
     运行研究工作流示例。
     """
 
-    print("\n" + "="*70)
-    print("LLM Agent Framework - Research Workflow Examples")
-    print("LLM智能体框架 - 研究工作流示例")
-    print("="*70 + "\n")
-
-    try:
-        research_workflow_example()
+    print(
+        "\n" + BAR,
+        "LLM Agent Framework - Research Workflow Examples",
+        "LLM智能体框架 - 研究工作流示例",
+        BAR + "\n",
+        sep="\n"
+    )
 
-        print("\n\n")
+    async def main():
+        # The two examples are independent, so their LLM requests are
+        # interleaved on one event loop instead of one example waiting on the
+        # other; a failure in one does not cancel the other
+        # 两个示例互不依赖，因此它们的LLM请求在同一事件循环中交错进行，
+        # 而非一个示例等待另一个；其中一个失败不会取消另一个
+        results = await asyncio.gather(
+            research_workflow_example(),
+            custom_analysis_example(),
+            return_exceptions=True
+        )
+        # Release the shared client's connections before the loop closes
+        # 在事件循环关闭前释放共享客户端的连接
+        await _get_client().aclose()
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
 
-        custom_analysis_example()
+    try:
+        asyncio.run(main())
 
     except Exception as e:
         print(f"\n❌ Error running examples: {e}")
@@ -225,7 +416,4 @@ if __name__ == "__main__":
         print("1. Set up your .env file with API credentials")
         print("2. Installed all requirements: pip install -r requirements.txt")
 
-    print("\n" + "="*70)
-    print("All examples completed!")
-    print("所有示例完成！")
-    print("="*70 + "\n")
+    print("\n" + BAR, "All examples completed!", "所有示例完成！", BAR + "\n", sep="\n")
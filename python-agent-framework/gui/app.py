@@ -9,27 +9,65 @@ License: MIT
 """
 
 import streamlit as st
+import asyncio
 import sys
+import itertools
+import json
 import os
-from typing import List, Dict, Any
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import time
+from collections import UserDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from importlib import import_module
+from typing import List, Dict, Any, Final, Optional, Tuple
+
+# Framework root and generated-tool metadata directory, resolved once
+# 框架根目录和生成工具元数据目录，只解析一次
+_PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_METADATA_DIR = os.path.join(_PARENT_DIR, "tools_data", "generated_metadata")
+
+# Generated tools are imported as modules relative to the framework root
+# 生成的工具以相对于框架根目录的模块导入
+if _PARENT_DIR not in sys.path:
+    sys.path.insert(0, _PARENT_DIR)
 
 from core.agent import Agent
 from core.llm_client import LLMClient
-from core.orchestrator import SequentialOrchestrator, ParallelOrchestrator
-from tools.base_tools import CalculatorTool, FileIOTool, PythonREPLTool, TextProcessingTool
-from tools.research_tools import ScientificComputeTool, StatisticalTestTool, UnitConverterTool
-from tools.data_tools import DataAnalysisTool, VisualizationTool, DataCleaningTool
+from core.prompts import ROLE_TEMPLATES
 from utils.tool_storage import ToolStorageManager
 from utils.agent_storage import AgentStorageManager
-from utils.dynamic_tool import DynamicTool, load_tool_from_config
-from utils.tool_generator import ToolGenerator
+from utils.dynamic_tool import load_tool_from_config
 from utils.tool_indexer import ToolIndexer
+from gui.models import ToolParam
 
 from dotenv import load_dotenv
 load_dotenv()
 
+# Optional fast JSON parser for tool metadata
+# 可选的快速JSON解析器，用于工具元数据
+try:
+    import orjson
+
+    def _load_json(path: str) -> Any:
+        """Parse a JSON file. / 解析JSON文件。"""
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+except ImportError:
+    def _load_json(path: str) -> Any:
+        """Parse a JSON file. / 解析JSON文件。"""
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+# Partial reruns: widgets inside a fragment rerun only that fragment
+# (st.fragment, or st.experimental_fragment before Streamlit 1.37)
+# 局部重新运行：片段内的控件只重新运行该片段（Streamlit 1.37之前为st.experimental_fragment）
+_fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda func: func)
+)
+
 
 st.set_page_config(
     page_title="LLM Agent Framework",
@@ -41,140 +79,455 @@ st.title("🤖 LLM Agent Framework")
 st.markdown("### 科研LLM智能体框架 | Scientific Research LLM Agent Framework")
 
 
+# Static help text shown on several pages / 多个页面显示的静态帮助文本
+_TOOL_OVERVIEW_MD: Final[str] = """
+        ### 工具说明 | Tool Overview
+        
+        **工具是智能体可以调用的功能模块**
+        
+        #### 📦 两种类型的工具：
+        
+        1. **内置工具 (Built-in Tools)** - 系统预装，无需创建
+           - ✅ Calculator - 数学计算
+           - ✅ FileIO - 文件读写
+           - ✅ PythonREPL - 执行Python代码
+           - ✅ DataAnalysis - 数据分析
+           - 等等...共10个内置工具
+        
+        2. **自定义工具 (Custom Tools)** - 你创建的工具
+           - 在"生成工具"页面用AI生成
+           - 或在这里手动创建
+        
+        #### 💡 提示：
+        - 创建智能体时可以选择任意工具组合
+        - 内置工具开箱即用，无需配置
+        - 自定义工具保存在 `tools_data/` 文件夹
+        """
+
+_MANUAL_VS_AI_WARNING: Final[str] = """
+    ⚠️ **注意 | Note:** 
+    
+    - **这里是手动创建**简单工具（如简单的文本处理）
+    - **如果需要AI自动生成代码**，请使用左侧导航的"生成工具 | Generate Tool"页面
+    
+    **区别:**
+    - 🤖 AI生成：功能强大，自动编写代码，但消耗tokens
+    - ✍️ 手动创建：简单快速，不消耗tokens，适合基础工具
+    """
+
+_QUICK_START_MD: Final[str] = """
+        ### 使用步骤：
+        
+        **1️⃣ 配置LLM**
+        - 在左侧输入API信息
+        - 点击"测试连接"
+        
+        **2️⃣ 创建智能体**
+        - 进入"创建智能体"页面
+        - 选择工具，命名智能体
+        
+        **3️⃣ 开始对话**
+        - 进入"对话"页面
+        - 与智能体交互
+        
+        **💡 高级功能：**
+        - 生成工具：用AI创建自定义工具
+        - 编排：多智能体协作
+        """
+
+
+# Session state keys and factories for their initial values; a factory runs
+# only when its key is missing, so storage managers are built once per session
+# 会话状态键及其初始值工厂；仅在键缺失时调用工厂，因此存储管理器每个会话只创建一次
+_SESSION_DEFAULTS = {
+    "agents": dict,
+    "chat_history": lambda: deque(maxlen=CHAT_HISTORY_SIZE),
+    # Messages sent this session, including ones trimmed from chat_history
+    # 本会话发送的消息数，包括已从chat_history中移除的消息
+    "chat_count": int,
+    # How many of the latest messages the chat page replays
+    # 对话页面重放的最新消息数
+    "chat_render_window": lambda: CHAT_VISIBLE_MESSAGES,
+    "llm_client": lambda: None,
+    "tool_storage": ToolStorageManager,
+    "agent_storage": AgentStorageManager,
+    "tool_generator": lambda: None,
+    "tool_indexer": ToolIndexer,
+    "agent_cache": dict,
+    "custom_tools": dict,
+    # Manual tool parameters, the set of their names for duplicate checks and
+    # a version bumped on every change; see _set_tool_params
+    # 手动工具参数、用于检查重复的名称集合，以及每次变化时递增的版本号；见_set_tool_params
+    "tool_params": list,
+    "tool_param_names": set,
+    "tool_params_version": int,
+    # Bumped to give the tool generator's parameter table a fresh, empty key
+    # 递增以使工具生成器的参数表格使用新的空键
+    "gen_params_version": int,
+}
+
+
 def init_session_state():
     """Initialize session state variables. / 初始化会话状态变量。"""
-    if 'agents' not in st.session_state:
-        st.session_state.agents = {}
-    if 'chat_history' not in st.session_state:
-        st.session_state.chat_history = []
-    if 'llm_client' not in st.session_state:
-        st.session_state.llm_client = None
-    if 'tool_storage' not in st.session_state:
-        st.session_state.tool_storage = ToolStorageManager()
-    if 'agent_storage' not in st.session_state:
-        st.session_state.agent_storage = AgentStorageManager()
-    if 'tool_generator' not in st.session_state:
-        st.session_state.tool_generator = None
-    if 'tool_indexer' not in st.session_state:
-        st.session_state.tool_indexer = ToolIndexer()
-    if 'custom_tools' not in st.session_state:
-        # Load custom tools from storage
-        st.session_state.custom_tools = {}
+    for key, factory in _SESSION_DEFAULTS.items():
+        if key not in st.session_state:
+            st.session_state[key] = factory()
+
+
+def _lazy(module_path: str, class_name: str):
+    """
+    Factory that imports a tool module only when the tool is first built, so
+    numpy/scipy/pandas/matplotlib load only for tools that need them.
+    仅在首次创建工具时才导入其模块的工厂，因此只有需要的工具才会加载numpy/scipy/pandas/matplotlib。
+    """
+    return lambda: getattr(import_module(module_path), class_name)()
+
+
+# Built-in tool factories by display name; instances are created on first use
+# 按显示名称排列的内置工具工厂；实例在首次使用时创建
+_BUILTIN_FACTORIES = {
+    "Calculator": _lazy("tools.base_tools", "CalculatorTool"),
+    "File I/O": _lazy("tools.base_tools", "FileIOTool"),
+    "Python REPL": _lazy("tools.base_tools", "PythonREPLTool"),
+    "Text Processing": _lazy("tools.base_tools", "TextProcessingTool"),
+    "Scientific Compute": _lazy("tools.research_tools", "ScientificComputeTool"),
+    "Statistical Test": _lazy("tools.research_tools", "StatisticalTestTool"),
+    "Unit Converter": _lazy("tools.research_tools", "UnitConverterTool"),
+    "Data Analysis": _lazy("tools.data_tools", "DataAnalysisTool"),
+    "Visualization": _lazy("tools.data_tools", "VisualizationTool"),
+    "Data Cleaning": _lazy("tools.data_tools", "DataCleaningTool"),
+}
+_BUILTIN_INSTANCES: Dict[str, Any] = {}
+
+
+class _LazyToolDict(UserDict):
+    """
+    Tool mapping that lists every built-in tool but only instantiates one
+    when it is looked up; other tools are stored as usual.
+    列出所有内置工具、但只在查找时才实例化的工具映射；其他工具照常存储。
+    """
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.data:
+            return self.data[key]
+        factory = _BUILTIN_FACTORIES.get(key)
+        if factory is None:
+            raise KeyError(key)
+        if key not in _BUILTIN_INSTANCES:
+            _BUILTIN_INSTANCES[key] = factory()
+        return _BUILTIN_INSTANCES[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in _BUILTIN_FACTORIES or key in self.data
+
+    def __iter__(self):
+        yield from _BUILTIN_FACTORIES
+        yield from self.data
+
+    def __len__(self) -> int:
+        return len(_BUILTIN_FACTORIES) + len(self.data)
+
+
+# Role selector options and descriptions, built once
+# 角色选择选项及描述，只构建一次
+_ROLE_KEYS = tuple(ROLE_TEMPLATES)
+_ROLE_DESCRIPTIONS = {role: template["description"] for role, template in ROLE_TEMPLATES.items()}
+
+# Chat messages kept per session, and how many more are replayed each time
+# earlier messages are loaded / 每个会话保留的聊天消息数，以及每次加载更早消息时多重放的消息数
+CHAT_HISTORY_SIZE = 200
+CHAT_VISIBLE_MESSAGES = 20
+
+# Minimum time between redraws of a streaming thought (~30 fps) and of the
+# tool-call log / 流式思考（约30帧/秒）和工具调用日志两次重绘之间的最小间隔
+_RENDER_INTERVAL_NS = 33_000_000
+_TOOL_RENDER_INTERVAL_NS = 50_000_000
+
+# Agents awaited at once by a parallel orchestration / 并行编排时同时等待的智能体数
+_ORCHESTRATION_CONCURRENCY = 8
+
+def _mtime_ns(path: str) -> int:
+    """Modification time of a path, 0 if it is missing. / 路径的修改时间，不存在时为0。"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _generated_metadata_paths() -> List[str]:
+    """
+    Paths of all generated tool metadata files, in directory order.
+    所有生成工具元数据文件的路径，按目录顺序排列。
+
+    Returns:
+        List of JSON file paths, empty if the directory is missing /
+            JSON文件路径列表，目录不存在时为空
+    """
+    if not os.path.isdir(_METADATA_DIR):
+        return []
+    with os.scandir(_METADATA_DIR) as entries:
+        return [entry.path for entry in entries if entry.is_file() and entry.name.endswith(".json")]
+
+
+def _resolve_tool_name(tool: Any) -> str:
+    """Display name of a tool object or tool name. / 工具对象或工具名称的显示名称。"""
+    return getattr(tool, 'name', None) or (tool if isinstance(tool, str) else type(tool).__name__)
 
 
 def get_available_tools() -> Dict[str, Any]:
-    """Get dictionary of available tools. / 获取可用工具字典。"""
-    # Built-in tools
-    builtin_tools = {
-        "Calculator": CalculatorTool(),
-        "File I/O": FileIOTool(),
-        "Python REPL": PythonREPLTool(),
-        "Text Processing": TextProcessingTool(),
-        "Scientific Compute": ScientificComputeTool(),
-        "Statistical Test": StatisticalTestTool(),
-        "Unit Converter": UnitConverterTool(),
-        "Data Analysis": DataAnalysisTool(),
-        "Visualization": VisualizationTool(),
-        "Data Cleaning": DataCleaningTool(),
-    }
-    
-    # Load manually created custom tools from storage
+    """
+    Get dictionary of available tools. / 获取可用工具字典。
+
+    Tool instances are built once and reused across reruns; the cache is keyed
+    on the modification times of the custom-tool file and the generated-tool
+    metadata directory, so saving or generating a tool invalidates it.
+    工具实例只创建一次并在重新运行间复用；缓存以自定义工具文件和生成工具元数据目录的
+    修改时间为键，因此保存或生成工具会使其失效。
+    """
     tool_storage = st.session_state.get('tool_storage')
+    storage_mtime = _mtime_ns(tool_storage.tools_file) if tool_storage else 0
+    return _load_tools_cached(tool_storage, storage_mtime, _mtime_ns(_METADATA_DIR))
+
+
+def invalidate_tools_cache() -> None:
+    """Drop cached tool instances and classes. / 清除缓存的工具实例和类。"""
+    _load_tools_cached.clear()
+    _cached_tool_class.clear()
+    _cached_custom_tool.clear()
+    _load_generated_tools_cached.clear()
+    _list_generated_cached.clear()
+    _load_generated_metadata.clear()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _list_generated_cached(_tool_generator, mtime_ns: int) -> List[Dict[str, Any]]:
+    """
+    Generated tool metadata, cached until the metadata directory changes; the
+    TTL also picks up tools regenerated in place.
+    生成工具的元数据，元数据目录变化前一直缓存；TTL还能发现原地重新生成的工具。
+    """
+    return _tool_generator.list_generated_tools()
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_tool_class(module_path: str, tool_name: str):
+    """
+    Import a generated tool module once and return its tool class; a
+    Streamlit resource cache, so the lookup survives reruns of this script.
+    只导入一次生成的工具模块并返回其工具类；使用Streamlit资源缓存，因此查找结果在脚本重新运行后仍然保留。
+
+    Args:
+        module_path: Dotted module path / 点分隔的模块路径
+        tool_name: Name of the tool class / 工具类名称
+
+    Returns:
+        Tool class or None / 工具类或None
+    """
+    module = sys.modules.get(module_path) or import_module(module_path)
+    return getattr(module, tool_name, None)
+
+
+@st.cache_resource(max_entries=256, show_spinner=False)
+def _cached_custom_tool(config_json: str) -> Optional[Any]:
+    """
+    Build a custom tool once per distinct config, so editing one tool does
+    not rebuild the others. A Streamlit resource cache, since a module-level
+    cache in this script is reset on every rerun.
+    每个不同的配置只构建一次自定义工具，因此编辑一个工具不会重建其他工具。
+    使用Streamlit资源缓存，因为本脚本中的模块级缓存在每次重新运行时都会被重置。
+
+    Args:
+        config_json: Tool config serialised with sorted keys / 按键排序序列化的工具配置
+
+    Returns:
+        DynamicTool instance or None / DynamicTool实例或None
+    """
+    return load_tool_from_config(json.loads(config_json))
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _read_file_cached(path: str, mtime_ns: int) -> str:
+    """
+    Read a text file, cached across reruns until its mtime changes.
+    读取文本文件，在重新运行间缓存，直到修改时间变化。
+
+    Args:
+        path: File path / 文件路径
+        mtime_ns: Modification time, part of the cache key / 修改时间，作为缓存键的一部分
+
+    Returns:
+        File contents / 文件内容
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+# Python / JSON schema type names to JSON schema types for generated tool parameters
+# 生成工具参数的Python / JSON schema类型名到JSON schema类型的映射
+_PY_TO_JSONSCHEMA = {
+    "str": "string",
+    "string": "string",
+    "int": "integer",
+    "integer": "integer",
+    "float": "number",
+    "number": "number",
+    "bool": "boolean",
+    "boolean": "boolean",
+    "list": "array",
+    "array": "array",
+    "dict": "object",
+    "object": "object",
+}
+
+
+def _load_one_metadata(path: str) -> Optional[Tuple[str, Any]]:
+    """
+    Load one generated tool from its metadata file.
+    从元数据文件加载一个生成的工具。
+
+    Args:
+        path: Metadata file path / 元数据文件路径
+
+    Returns:
+        (display name, tool instance) or None / (显示名称, 工具实例) 或 None
+    """
+    try:
+        metadata = _load_json(path)
+        
+        tool_name = metadata.get("name")
+        tool_file = metadata.get("file_path")
+        
+        if not (tool_file and os.path.exists(tool_file)):
+            return None
+
+        # Import the generated tool dynamically
+        # Convert file path to module path
+        # e.g., tools/generated/mathcalculator.py -> tools.generated.mathcalculator
+        rel_path = os.path.relpath(tool_file, _PARENT_DIR)
+        module_path = rel_path.replace(os.sep, '.').replace('.py', '')
+        
+        try:
+            # Find the tool class (usually <ToolName>)
+            tool_class = _cached_tool_class(module_path, tool_name)
+            if tool_class:
+                return f"Generated: {tool_name}", tool_class()
+        except Exception as e:
+            # If import fails, create a dynamic tool from metadata
+            tool_config = {
+                "name": tool_name,
+                "description": metadata.get("description", ""),
+                "parameters": {
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            }
+            # Build parameters from metadata
+            for param in metadata.get("input_parameters", []):
+                param_name = param.get("name")
+                param_type = param.get("type", "string")
+                # Convert Python types to JSON schema types
+                json_type = _PY_TO_JSONSCHEMA.get(param_type, "string")
+                
+                tool_config["parameters"]["properties"][param_name] = {
+                    "type": json_type,
+                    "description": param.get("description", "")
+                }
+                tool_config["parameters"]["required"].append(param_name)
+            
+            # Try to read the code from file
+            tool_config["code"] = _read_file_cached(tool_file, _mtime_ns(tool_file))
+            
+            tool = load_tool_from_config(tool_config)
+            if tool:
+                return f"Generated: {tool_name}", tool
+    except Exception as e:
+        print(f"Error loading generated tool {os.path.basename(path)}: {e}")
+    return None
+
+
+@st.cache_resource(show_spinner=False)
+def _load_tools_cached(_tool_storage, storage_mtime: int, metadata_mtime: int) -> Dict[str, Any]:
+    """
+    Build all available tools; cached by get_available_tools().
+    构建所有可用工具；由get_available_tools()缓存。
+
+    Args:
+        _tool_storage: Custom tool storage (not part of the cache key) /
+            自定义工具存储（不参与缓存键）
+        storage_mtime: Modification time of the custom tool file / 自定义工具文件修改时间
+        metadata_mtime: Modification time of the metadata directory / 元数据目录修改时间
+
+    Returns:
+        Dict of display name to tool instance / 显示名称到工具实例的字典
+    """
+    # Built-in tools, instantiated on first lookup
+    builtin_tools = _LazyToolDict()
+    
+    # Load manually created custom tools from storage; the configs come from
+    # the same cache as the Tool Management page
+    # 从存储加载手动创建的自定义工具；配置与工具管理页面共用同一缓存
+    tool_storage = _tool_storage
     if tool_storage:
-        custom_tool_configs = tool_storage.load_all_tools()
+        custom_tool_configs = _load_custom_tools_cached(tool_storage, storage_mtime)
         for tool_config in custom_tool_configs:
-            tool = load_tool_from_config(tool_config)
+            tool = _cached_custom_tool(json.dumps(tool_config, sort_keys=True, default=str))
             if tool:
                 builtin_tools[f"Custom: {tool.name}"] = tool
     
     # Load AI-generated tools from generated_metadata
-    import json
-    import os
-    import sys
-    from importlib import import_module
-    
-    # Get absolute path to parent directory
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(current_dir)
-    
-    # Ensure the parent directory is in sys.path for imports
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    
-    metadata_dir = os.path.join(parent_dir, "tools_data", "generated_metadata")
-    
-    if os.path.exists(metadata_dir):
-        for filename in os.listdir(metadata_dir):
-            if filename.endswith(".json"):
-                file_path = os.path.join(metadata_dir, filename)
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        metadata = json.load(f)
-                    
-                    tool_name = metadata.get("name")
-                    tool_file = metadata.get("file_path")
-                    
-                    if tool_file and os.path.exists(tool_file):
-                        # Import the generated tool dynamically
-                        # Convert file path to module path
-                        # e.g., tools/generated/mathcalculator.py -> tools.generated.mathcalculator
-                        rel_path = os.path.relpath(tool_file, parent_dir)
-                        module_path = rel_path.replace(os.sep, '.').replace('.py', '')
-                        
-                        try:
-                            module = import_module(module_path)
-                            # Find the tool class (usually <ToolName>)
-                            tool_class = getattr(module, tool_name, None)
-                            if tool_class:
-                                builtin_tools[f"Generated: {tool_name}"] = tool_class()
-                        except Exception as e:
-                            # If import fails, create a dynamic tool from metadata
-                            tool_config = {
-                                "name": tool_name,
-                                "description": metadata.get("description", ""),
-                                "parameters": {
-                                    "type": "object",
-                                    "properties": {},
-                                    "required": []
-                                }
-                            }
-                            # Build parameters from metadata
-                            for param in metadata.get("input_parameters", []):
-                                param_name = param.get("name")
-                                param_type = param.get("type", "string")
-                                # Convert Python types to JSON schema types
-                                if param_type in ["str", "string"]:
-                                    json_type = "string"
-                                elif param_type in ["int", "integer"]:
-                                    json_type = "integer"
-                                elif param_type in ["float", "number"]:
-                                    json_type = "number"
-                                elif param_type in ["bool", "boolean"]:
-                                    json_type = "boolean"
-                                else:
-                                    json_type = "string"
-                                
-                                tool_config["parameters"]["properties"][param_name] = {
-                                    "type": json_type,
-                                    "description": param.get("description", "")
-                                }
-                                tool_config["parameters"]["required"].append(param_name)
-                            
-                            # Try to read the code from file
-                            if tool_file and os.path.exists(tool_file):
-                                with open(tool_file, "r", encoding="utf-8") as f:
-                                    tool_config["code"] = f.read()
-                            
-                            tool = load_tool_from_config(tool_config)
-                            if tool:
-                                builtin_tools[f"Generated: {tool_name}"] = tool
-                except Exception as e:
-                    print(f"Error loading generated tool {filename}: {e}")
-                    continue
-    
+    # Generated tools only change when the metadata directory does, so a
+    # rebuild triggered by custom tools reuses the previous scan
+    # 生成的工具仅在元数据目录变化时改变，因此由自定义工具触发的重建会复用上次扫描结果
+    builtin_tools.update(_load_generated_tools_cached(metadata_mtime))
     return builtin_tools
 
 
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_generated_tools_cached(metadata_mtime: int) -> Dict[str, Any]:
+    """
+    Build the AI-generated tools; cached separately from the custom tools.
+    构建AI生成的工具；与自定义工具分开缓存。
+
+    Args:
+        metadata_mtime: Modification time of the metadata directory / 元数据目录修改时间
+
+    Returns:
+        Dict of display name to tool instance / 显示名称到工具实例的字典
+    """
+    generated_tools = {}
+    if metadata_mtime:
+        paths = _generated_metadata_paths()
+        # Metadata reads and file checks are I/O-bound, so they overlap;
+        # results are merged in directory order
+        # 元数据读取和文件检查受I/O限制，因此并行执行；结果按目录顺序合并
+        if paths:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                for loaded in executor.map(_load_one_metadata, paths):
+                    if loaded:
+                        generated_tools[loaded[0]] = loaded[1]
+
+    return generated_tools
+
+
+@st.cache_resource(show_spinner=False)
+def _shared_http_session():
+    """
+    One keep-alive HTTP session shared by every browser session's LLM client,
+    so connections stay warm across sessions and reruns. Only the transport is
+    shared: credentials are sent per request, cookies are refused, and each
+    session keeps its own client with its own stats and response cache.
+    所有浏览器会话的LLM客户端共享一个长连接HTTP会话，使连接在会话和重新运行间保持可用。
+    只共享传输层：凭据按请求发送、拒绝Cookie，每个会话保留自己的客户端、统计和响应缓存。
+
+    Returns:
+        Shared requests session / 共享的requests会话
+    """
+    session = LLMClient._create_session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
 def setup_llm_client():
     """Setup LLM client configuration. / 设置LLM客户端配置。"""
     st.sidebar.header("⚙️ LLM Configuration | LLM配置")
@@ -204,12 +557,13 @@ def setup_llm_client():
         if api_url and api_key:
             with st.spinner("Testing connection... | 测试连接中..."):
                 try:
-                    # Create client
+                    # Create client on the shared connection pool
                     test_client = LLMClient(
                         api_url=api_url,
                         api_key=api_key,
                         model=model,
-                        api_type=api_type
+                        api_type=api_type,
+                        session=_shared_http_session()
                     )
                     
                     # Simple test with minimal cost
@@ -219,6 +573,9 @@ def setup_llm_client():
                     )
                     
                     if test_response.get("success"):
+                        # Only needed once a client is connected / 仅在连接客户端后才需要
+                        from utils.tool_generator import ToolGenerator
+
                         st.session_state.llm_client = test_client
                         st.session_state.tool_generator = ToolGenerator(test_client)
                         st.sidebar.success("✅ Connected successfully! | 连接成功！")
@@ -231,13 +588,26 @@ def setup_llm_client():
             st.sidebar.error("Please provide API URL and Key | 请提供API URL和密钥")
 
 
+@st.cache_data(show_spinner=False)
+def _load_all_agents_cached(_agent_storage, mtime_ns: int) -> List[Dict[str, Any]]:
+    """Saved agent configs, cached until the file changes. / 已保存的智能体配置，文件变化前一直缓存。"""
+    return _agent_storage.load_all_agents()
+
+
+@st.cache_data(show_spinner=False)
+def _agent_count_cached(_agent_storage, mtime_ns: int) -> int:
+    """Number of saved agents, cached until the file changes. / 已保存智能体数量，文件变化前一直缓存。"""
+    return _agent_storage.get_agent_count()
+
+
 def load_saved_agents():
     """Load all saved agents from storage into session."""
     if not st.session_state.llm_client:
         st.error("❌ 请先连接LLM才能加载智能体")
         return
     
-    saved_agents = st.session_state.agent_storage.load_all_agents()
+    agent_storage = st.session_state.agent_storage
+    saved_agents = _load_all_agents_cached(agent_storage, _mtime_ns(agent_storage.config_file))
     available_tools = get_available_tools()
     loaded_count = 0
     
@@ -254,15 +624,24 @@ def load_saved_agents():
             if tool_name in available_tools:
                 tools.append(available_tools[tool_name])
         
-        # Create agent with new parameters
-        agent = Agent(
-            name=agent_name,
-            llm_client=st.session_state.llm_client,
-            tools=tools,
-            role=role,
-            system_prompt=custom_instructions,
-            use_react=use_react
+        # Reuse the agent built for an identical config, client and tool set
+        # 对于相同的配置、客户端和工具集，复用已创建的智能体
+        cache_key = (
+            agent_name, role, custom_instructions, use_react,
+            id(st.session_state.llm_client), tuple(id(tool) for tool in tools)
         )
+        agent = st.session_state.agent_cache.get(cache_key)
+        if agent is None:
+            # Create agent with new parameters
+            agent = Agent(
+                name=agent_name,
+                llm_client=st.session_state.llm_client,
+                tools=tools,
+                role=role,
+                system_prompt=custom_instructions,
+                use_react=use_react
+            )
+            st.session_state.agent_cache[cache_key] = agent
         
         st.session_state.agents[agent_name] = agent
         loaded_count += 1
@@ -285,7 +664,8 @@ def create_agent_interface():
             load_saved_agents()
     
     # Show saved agents count
-    saved_count = st.session_state.agent_storage.get_agent_count()
+    agent_storage = st.session_state.agent_storage
+    saved_count = _agent_count_cached(agent_storage, _mtime_ns(agent_storage.config_file))
     if saved_count > 0:
         st.info(f"💾 已保存 {saved_count} 个智能体配置")
     
@@ -322,18 +702,14 @@ def create_agent_interface():
             placeholder="例如: DataAnalyst, MathTeacher"
         )
         
-        # Import role templates
-        from core.prompts import ROLE_TEMPLATES
-        
         role = st.selectbox(
             "🎭 角色类型 | Role Type *",
-            options=list(ROLE_TEMPLATES.keys()),
+            options=_ROLE_KEYS,
             help="选择预设角色模板，自动配置专业的系统提示词"
         )
         
         # Show role description
-        if role in ROLE_TEMPLATES:
-            st.caption(f"💡 {ROLE_TEMPLATES[role]['description']}")
+        st.caption(f"💡 {_ROLE_DESCRIPTIONS[role]}")
         
         # Advanced options
         with st.expander("⚙️ 高级选项 | Advanced Options"):
@@ -354,7 +730,7 @@ def create_agent_interface():
         available_tools = get_available_tools()
         selected_tools = st.multiselect(
             "🔧 选择工具 | Select Tools *",
-            options=list(available_tools.keys()),
+            options=tuple(available_tools),
             default=["Calculator"],
             help="选择智能体可以使用的工具"
         )
@@ -429,25 +805,23 @@ def chat_interface():
 
     selected_agent_name = st.selectbox(
         "Select Agent | 选择智能体",
-        options=list(st.session_state.agents.keys())
+        options=tuple(st.session_state.agents)
     )
     
     # Show agent info
     selected_agent = st.session_state.agents[selected_agent_name]
     with st.expander("ℹ️ 智能体信息 | Agent Info"):
-        # Get tool names safely
-        tool_names = []
-        for tool in selected_agent.tools:
-            if hasattr(tool, 'name'):
-                tool_names.append(tool.name)
-            elif isinstance(tool, str):
-                tool_names.append(tool)
-            else:
-                tool_names.append(str(type(tool).__name__))
+        # The GUI never changes an agent's tools after creation, so the
+        # joined names are computed once per agent
+        # GUI创建智能体后不会修改其工具，因此每个智能体只拼接一次工具名称
+        if not hasattr(selected_agent, "_cached_tool_names_str"):
+            selected_agent._cached_tool_names_str = ', '.join(
+                _resolve_tool_name(tool) for tool in selected_agent.tools
+            )
         
         st.markdown(f"""
         - **名称**: {selected_agent.name}
-        - **工具**: {', '.join(tool_names)}
+        - **工具**: {selected_agent._cached_tool_names_str}
         - **系统提示**: {selected_agent.system_prompt or '(未设置)'}
         
         ### 💬 对话示例：
@@ -456,17 +830,25 @@ def chat_interface():
         - "执行这段Python代码：print('Hello')"
         """)
 
-    for message in st.session_state.chat_history:
-        with st.chat_message(message["role"]):
-            st.write(message["content"])
+    # Messages are stored as (role, content) tuples
+    # 消息以 (角色, 内容) 元组存储
+    # Only the latest messages are replayed on each rerun; earlier ones are
+    # loaded on request / 每次重新运行只重放最新消息；更早的消息按需加载
+    history = st.session_state.chat_history
+    hidden = max(len(history) - st.session_state.chat_render_window, 0)
+    if hidden:
+        if st.button(f"Load earlier messages | 加载更早的消息 ({hidden})"):
+            st.session_state.chat_render_window += CHAT_VISIBLE_MESSAGES
+            st.rerun()
+    for role, content in itertools.islice(history, hidden, None):
+        with st.chat_message(role):
+            st.write(content)
 
     user_input = st.chat_input("Enter your message | 输入消息...")
 
     if user_input:
-        st.session_state.chat_history.append({
-            "role": "user",
-            "content": user_input
-        })
+        st.session_state.chat_history.append(("user", user_input))
+        st.session_state.chat_count += 1
 
         with st.chat_message("user"):
             st.write(user_input)
@@ -477,12 +859,21 @@ def chat_interface():
             # Create containers for different parts
             iteration_container = st.container()
             thought_container = st.container()
-            tool_container = st.container()
+            tool_placeholder = st.empty()
             final_container = st.container()
             
-            full_response = ""
-            current_thought = ""
+            # Chunks are collected in lists and joined only when rendered, and
+            # the streaming thought is redrawn at most every _RENDER_INTERVAL_NS
+            # 文本块收集到列表中，仅在渲染时拼接；流式思考最多每隔_RENDER_INTERVAL_NS重绘一次
+            full_response_parts: List[str] = []
+            current_thought_parts: List[str] = []
             thought_placeholder = None
+            last_render_ns = 0
+            # Tool calls and results share one placeholder that is redrawn
+            # at most every _TOOL_RENDER_INTERVAL_NS and flushed at the end
+            # 工具调用和结果共用一个占位符，最多每隔_TOOL_RENDER_INTERVAL_NS重绘一次，结束时统一刷新
+            tool_buffer: List[str] = []
+            last_tool_render_ns = 0
             
             # Stream the response
             for event in agent.run_stream(user_input):
@@ -492,64 +883,84 @@ def chat_interface():
                 if event_type == "iteration":
                     with iteration_container:
                         st.markdown(f"**{content}**")
-                    full_response += f"\n{content}\n"
+                    full_response_parts.append(f"\n{content}\n")
                     
                 elif event_type == "thought_start":
-                    current_thought = content
+                    current_thought_parts = [content]
                     with thought_container:
                         thought_placeholder = st.empty()
-                        thought_placeholder.markdown(current_thought + "▌")
-                    full_response += content
+                        thought_placeholder.markdown(content + "▌")
+                    last_render_ns = time.monotonic_ns()
+                    full_response_parts.append(content)
                     
                 elif event_type == "thought_chunk":
-                    current_thought += content
-                    if thought_placeholder:
-                        thought_placeholder.markdown(current_thought + "▌")
-                    full_response += content
+                    current_thought_parts.append(content)
+                    now_ns = time.monotonic_ns()
+                    if thought_placeholder and now_ns - last_render_ns >= _RENDER_INTERVAL_NS:
+                        thought_placeholder.markdown("".join(current_thought_parts) + "▌")
+                        last_render_ns = now_ns
+                    full_response_parts.append(content)
                     
                 elif event_type == "thought_end":
-                    current_thought += content
+                    current_thought_parts.append(content)
                     if thought_placeholder:
-                        thought_placeholder.markdown(current_thought)
-                    full_response += content
+                        thought_placeholder.markdown("".join(current_thought_parts))
+                    full_response_parts.append(content)
                     thought_placeholder = None
                     
                 elif event_type == "thought":
                     with thought_container:
                         st.markdown(content)
-                    full_response += content
+                    full_response_parts.append(content)
                     
-                elif event_type == "tool_call":
-                    with tool_container:
-                        st.markdown(content)
-                    full_response += f"\n{content}"
-                    
-                elif event_type == "tool_result":
-                    with tool_container:
-                        st.markdown(content)
-                    full_response += f"{content}\n"
+                elif event_type in ("tool_call", "tool_result"):
+                    tool_buffer.append(content)
+                    now_ns = time.monotonic_ns()
+                    if now_ns - last_tool_render_ns >= _TOOL_RENDER_INTERVAL_NS:
+                        tool_placeholder.markdown("\n\n".join(tool_buffer))
+                        last_tool_render_ns = now_ns
+                    if event_type == "tool_call":
+                        full_response_parts.append(f"\n{content}")
+                    else:
+                        full_response_parts.append(f"{content}\n")
                     
                 elif event_type == "final_answer":
                     with final_container:
                         st.markdown(content)
-                    full_response += content
+                    full_response_parts.append(content)
                     
                 elif event_type == "response":
                     st.markdown(content)
-                    full_response = content
+                    full_response_parts = [content]
                     
                 elif event_type == "error":
                     st.error(f"❌ 错误: {content}")
-                    full_response = f"❌ 错误: {content}"
+                    full_response_parts = [f"❌ 错误: {content}"]
                     
                 elif event_type == "max_iterations":
                     st.warning(content)
-                    full_response += f"\n{content}"
+                    full_response_parts.append(f"\n{content}")
+
+            if tool_buffer:
+                tool_placeholder.markdown("\n\n".join(tool_buffer))
+            full_response = "".join(full_response_parts)
+
+        st.session_state.chat_history.append(("assistant", full_response))
+        st.session_state.chat_count += 1
+
+
+# Python types offered for generated tool parameters
+# 生成工具参数可选的Python类型
+_GEN_PARAM_TYPES = ("str", "int", "float", "list", "dict", "bool")
 
-        st.session_state.chat_history.append({
-            "role": "assistant",
-            "content": full_response
-        })
+
+def _reset_param_fields() -> None:
+    """
+    Reset the parameter table by moving it to a new widget key; Streamlit
+    drops the old key's state once it is no longer rendered.
+    通过切换到新的控件键重置参数表格；旧键不再渲染后Streamlit会删除其状态。
+    """
+    st.session_state.gen_params_version += 1
 
 
 def tool_generator_interface():
@@ -625,50 +1036,34 @@ def tool_generator_interface():
         st.markdown("#### Input Parameters | 输入参数")
         st.caption("Define what inputs your tool needs")
         
-        # Dynamic parameter input
-        if 'param_count' not in st.session_state:
-            st.session_state.param_count = 1
-        
-        parameters = []
-        for i in range(st.session_state.param_count):
-            with st.expander(f"Parameter {i+1}", expanded=True):
-                pcol1, pcol2 = st.columns(2)
-                with pcol1:
-                    param_name = st.text_input(
-                        "Name",
-                        key=f"param_name_{i}",
-                        placeholder="e.g., url, text, data"
-                    )
-                    param_type = st.selectbox(
-                        "Type",
-                        ["str", "int", "float", "list", "dict", "bool"],
-                        key=f"param_type_{i}"
-                    )
-                with pcol2:
-                    param_desc = st.text_area(
-                        "Description",
-                        key=f"param_desc_{i}",
-                        placeholder="What is this parameter for?",
-                        height=100
-                    )
-                
-                if param_name and param_desc:
-                    parameters.append({
-                        "name": param_name,
-                        "type": param_type,
-                        "description": param_desc
-                    })
-        
-        pcol1, pcol2 = st.columns(2)
-        with pcol1:
-            if st.button("➕ Add Parameter"):
-                st.session_state.param_count += 1
-                st.rerun()
-        with pcol2:
-            if st.session_state.param_count > 1:
-                if st.button("➖ Remove Last"):
-                    st.session_state.param_count -= 1
-                    st.rerun()
+        # One editable table instead of a widget group per parameter; rows
+        # are added and deleted in place without a rerun
+        # 使用一个可编辑表格代替每个参数一组控件；行的添加和删除无需重新运行
+        import pandas as pd
+
+        edited = st.data_editor(
+            pd.DataFrame(columns=["name", "type", "description"]),
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "name": st.column_config.TextColumn(
+                    "Name", help="e.g., url, text, data"
+                ),
+                "type": st.column_config.SelectboxColumn(
+                    "Type", options=_GEN_PARAM_TYPES, default="str"
+                ),
+                "description": st.column_config.TextColumn(
+                    "Description", help="What is this parameter for?"
+                ),
+            },
+            key=f"gen_param_editor_{st.session_state.gen_params_version}"
+        )
+        parameters = [
+            {"name": row["name"], "type": row["type"] or "str", "description": row["description"]}
+            for row in edited.to_dict("records")
+            if row.get("name") and row.get("description")
+        ]
         
         expected_output = st.text_area(
             "Expected Output | 期望输出 *",
@@ -698,7 +1093,9 @@ def tool_generator_interface():
         # Show existing generated tools
         st.markdown("### 📚 Generated Tools")
         if st.session_state.tool_generator:
-            generated_tools = st.session_state.tool_generator.list_generated_tools()
+            generated_tools = _list_generated_cached(
+                st.session_state.tool_generator, _mtime_ns(_METADATA_DIR)
+            )
             if generated_tools:
                 for tool in generated_tools:
                     with st.expander(f"🔧 {tool['name']}"):
@@ -756,22 +1153,35 @@ def tool_generator_interface():
                 
                 # Refresh tool indexer
                 st.session_state.tool_indexer.refresh_index()
+                invalidate_tools_cache()
                 
-                # Reset parameter count
-                st.session_state.param_count = 1
+                # Reset parameter fields
+                _reset_param_fields()
                 
             else:
                 st.error(f"❌ Failed to generate tool: {result.get('error')}")
     
     with col2:
         if st.button("🔄 Reset Form | 重置表单", use_container_width=True):
-            st.session_state.param_count = 1
+            _reset_param_fields()
             st.rerun()
     
     with col3:
         st.button("📚 View Tools | 查看工具", use_container_width=True)
 
 
+async def _run_parallel(orchestrator, task: str) -> Dict[str, str]:
+    """
+    Run a parallel orchestration and close its HTTP clients before the
+    event loop ends.
+    运行并行编排，并在事件循环结束前关闭其HTTP客户端。
+    """
+    try:
+        return await orchestrator.run_async(task)
+    finally:
+        await orchestrator.aclose()
+
+
 def orchestrator_interface():
     """Multi-agent orchestration interface. / 多智能体编排界面。"""
     st.header("🎭 Multi-Agent Orchestration | 多智能体编排")
@@ -787,7 +1197,7 @@ def orchestrator_interface():
 
     selected_agents = st.multiselect(
         "Select Agents | 选择智能体",
-        options=list(st.session_state.agents.keys())
+        options=tuple(st.session_state.agents)
     )
 
     task = st.text_area(
@@ -806,6 +1216,10 @@ def orchestrator_interface():
 
         agents = [st.session_state.agents[name] for name in selected_agents]
 
+        # Imported on first run so other pages never load the orchestrators
+        # 首次运行时才导入，其他页面不会加载编排器
+        from core.orchestrator import SequentialOrchestrator, ParallelOrchestrator
+
         with st.spinner("Running orchestration | 运行编排中..."):
             if "Sequential" in orchestration_type:
                 orchestrator = SequentialOrchestrator(agents)
@@ -814,8 +1228,10 @@ def orchestrator_interface():
                 st.write("**Final Result | 最终结果:**")
                 st.write(result)
             else:
-                orchestrator = ParallelOrchestrator(agents)
-                results = orchestrator.run(task)
+                # LLM calls are awaited together on one event loop instead
+                # of a thread per agent / LLM调用在同一事件循环上一起等待，而不是每个智能体一个线程
+                orchestrator = ParallelOrchestrator(agents, max_concurrency=_ORCHESTRATION_CONCURRENCY)
+                results = asyncio.run(_run_parallel(orchestrator, task))
                 st.success("Orchestration Complete | 编排完成")
                 st.write("**Results | 结果:**")
                 for agent_name, result in results.items():
@@ -837,30 +1253,136 @@ def analytics_interface():
         st.metric("Total Agents | 总智能体数", len(st.session_state.agents))
 
     with col2:
-        st.metric("Total Messages | 总消息数", len(st.session_state.chat_history))
+        st.metric("Total Messages | 总消息数", st.session_state.chat_count)
 
     with col3:
         if st.session_state.llm_client:
-            stats = st.session_state.llm_client.get_stats()
-            st.metric("API Requests | API请求数", stats.get("request_count", 0))
+            # Only the request counter is shown, so read it directly
+            # 只显示请求计数，因此直接读取
+            st.metric("API Requests | API请求数", st.session_state.llm_client.request_count)
 
     st.subheader("Agent Details | 智能体详情")
 
     for agent_name, agent in st.session_state.agents.items():
-        with st.expander(f"🤖 {agent_name}"):
-            st.write(f"**Tools | 工具:** {', '.join(agent.tools.keys())}")
-            st.write(f"**Memory Enabled | 记忆启用:** {agent.memory_enabled}")
-
-            if st.button(f"Clear Memory | 清除记忆 ({agent_name})", key=f"clear_{agent_name}"):
-                agent.clear_memory()
-                st.success(f"Memory cleared for {agent_name}")
-
-            if st.button(f"View Execution Log | 查看执行日志 ({agent_name})", key=f"log_{agent_name}"):
-                log = agent.get_execution_log()
-                if log:
-                    st.json(log)
-                else:
-                    st.info("No execution log available")
+        _render_agent_details(agent_name, agent)
+
+
+@_fragment
+def _render_agent_details(agent_name: str, agent: Agent):
+    """
+    Details of one agent; its buttons rerun only this agent's block.
+    单个智能体的详情；其按钮只重新运行该智能体的区块。
+    """
+    with st.expander(f"🤖 {agent_name}"):
+        st.write(f"**Tools | 工具:** {', '.join(agent.tools.keys())}")
+        st.write(f"**Memory Enabled | 记忆启用:** {agent.memory_enabled}")
+
+        if st.button(f"Clear Memory | 清除记忆 ({agent_name})", key=f"clear_{agent_name}"):
+            agent.clear_memory()
+            st.success(f"Memory cleared for {agent_name}")
+
+        if st.button(f"View Execution Log | 查看执行日志 ({agent_name})", key=f"log_{agent_name}"):
+            log = agent.get_execution_log()
+            if log:
+                st.json(log)
+            else:
+                st.info("No execution log available")
+
+
+# Built-in tools shown in tool management: (name, Chinese name, description)
+# 工具管理中显示的内置工具：(名称, 中文名称, 描述)
+_BUILTIN_TOOLS: Tuple[Tuple[str, str, str], ...] = (
+    ("Calculator", "计算器", "执行数学计算和表达式求值"),
+    ("File I/O", "文件读写", "读取和写入文件"),
+    ("Python REPL", "Python执行器", "执行Python代码"),
+    ("Text Processing", "文本处理", "处理和分析文本"),
+    ("Scientific Compute", "科学计算", "科学和工程计算"),
+    ("Statistical Test", "统计检验", "统计测试和分析"),
+    ("Unit Converter", "单位转换", "转换各种单位"),
+    ("Data Analysis", "数据分析", "分析和计算数据统计"),
+    ("Visualization", "可视化", "创建图表和可视化"),
+    ("Data Cleaning", "数据清洗", "清理和预处理数据"),
+)
+
+# The static built-in overview is rendered as one markdown table
+# 静态内置工具概览渲染为一个Markdown表格
+_BUILTIN_TOOLS_TABLE_MD: Final[str] = "\n".join(
+    ["| 工具 Tool | 名称 | 功能 | 状态 |", "| --- | --- | --- | --- |"]
+    + [f"| {name_en} | {name_cn} | {desc} | ✅ 可用 |" for name_en, name_cn, desc in _BUILTIN_TOOLS]
+)
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_custom_tools_cached(_tool_storage, mtime_ns: int) -> List[Dict[str, Any]]:
+    """Custom tool configs, cached until the file changes. / 自定义工具配置，文件变化前一直缓存。"""
+    return _tool_storage.load_all_tools()
+
+
+def _custom_tool_configs(tool_storage) -> List[Dict[str, Any]]:
+    """
+    Get custom tool configs; saves, edits and deletes all rewrite the tools
+    file, so its mtime invalidates the cache.
+    获取自定义工具配置；保存、编辑和删除都会重写工具文件，因此其修改时间会使缓存失效。
+    """
+    return _load_custom_tools_cached(tool_storage, _mtime_ns(tool_storage.tools_file))
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _custom_tool_views_cached(_tool_storage, mtime_ns: int) -> List[Tuple[str, str, Optional[str]]]:
+    """
+    Pre-rendered View tab entries for custom tools, rebuilt only when the
+    tools file changes.
+    预渲染的自定义工具查看条目，仅在工具文件变化时重建。
+
+    Args:
+        _tool_storage: Custom tool storage (not part of the cache key) /
+            自定义工具存储（不参与缓存键）
+        mtime_ns: Tools file modification time, used as cache key / 工具文件修改时间，用作缓存键
+
+    Returns:
+        (name, details markdown, code) per tool / 每个工具的 (名称, 详情markdown, 代码)
+    """
+    views = []
+    for tool in _load_custom_tools_cached(_tool_storage, mtime_ns):
+        lines = [f"**描述:** {tool.get('description', '无描述')}"]
+        
+        # Parameters
+        params = tool.get('parameters', {}).get('properties', {})
+        required = tool.get('parameters', {}).get('required', [])
+        if params:
+            lines.append("**参数:**")
+            for param_name, param_info in params.items():
+                req_mark = "✅ 必需" if param_name in required else "⭕ 可选"
+                lines.append(f"- `{param_name}` ({param_info.get('type', 'unknown')}) - {req_mark}")
+        
+        views.append((tool.get('name', 'Unnamed Tool'), "\n\n".join(lines), tool.get('code')))
+    return views
+
+
+@st.cache_data(ttl=60, max_entries=1, show_spinner=False)
+def _load_generated_metadata(mtime_ns: int) -> List[Dict[str, Any]]:
+    """
+    Load all generated tool metadata, cached until the directory changes.
+    加载所有生成工具的元数据，目录变化前一直缓存。
+
+    Args:
+        mtime_ns: Directory modification time, used as cache key / 目录修改时间，用作缓存键
+
+    Returns:
+        List of metadata dicts / 元数据字典列表
+    """
+    if not mtime_ns:
+        return []
+    loaded = (_safe_load_json(path) for path in _generated_metadata_paths())
+    return [metadata for metadata in loaded if metadata is not None]
+
+
+def _safe_load_json(path: str) -> Optional[Any]:
+    """Parse a JSON file, None if it is unreadable. / 解析JSON文件，无法读取时返回None。"""
+    try:
+        return _load_json(path)
+    except Exception:
+        return None
 
 
 def tool_management_interface():
@@ -869,64 +1391,25 @@ def tool_management_interface():
     
     # Add explanation at the top
     with st.expander("ℹ️ 什么是工具？| What are Tools?", expanded=False):
-        st.markdown("""
-        ### 工具说明 | Tool Overview
-        
-        **工具是智能体可以调用的功能模块**
-        
-        #### 📦 两种类型的工具：
-        
-        1. **内置工具 (Built-in Tools)** - 系统预装，无需创建
-           - ✅ Calculator - 数学计算
-           - ✅ FileIO - 文件读写
-           - ✅ PythonREPL - 执行Python代码
-           - ✅ DataAnalysis - 数据分析
-           - 等等...共10个内置工具
-        
-        2. **自定义工具 (Custom Tools)** - 你创建的工具
-           - 在"生成工具"页面用AI生成
-           - 或在这里手动创建
-        
-        #### 💡 提示：
-        - 创建智能体时可以选择任意工具组合
-        - 内置工具开箱即用，无需配置
-        - 自定义工具保存在 `tools_data/` 文件夹
-        """)
+        st.markdown(_TOOL_OVERVIEW_MD)
     
     tool_storage = st.session_state.tool_storage
     
-    # Count generated tools
-    import json
-    import os
-    
-    # Get the absolute path to the parent directory
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(current_dir)
-    metadata_dir = os.path.join(parent_dir, "tools_data", "generated_metadata")
-    generated_count = 0
-    
-    if os.path.exists(metadata_dir):
-        json_files = [f for f in os.listdir(metadata_dir) if f.endswith('.json')]
-        generated_count = len(json_files)
-    else:
-        # Fallback: try current directory
-        metadata_dir = os.path.join(current_dir, "..", "tools_data", "generated_metadata")
-        metadata_dir = os.path.abspath(metadata_dir)
-        if os.path.exists(metadata_dir):
-            json_files = [f for f in os.listdir(metadata_dir) if f.endswith('.json')]
-            generated_count = len(json_files)
+    # Load generated tools metadata once for the count and the View tab
+    generated_tools = _load_generated_metadata(_mtime_ns(_METADATA_DIR))
+    generated_count = len(generated_tools)
     
     # Display tool statistics with better explanation
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("🔧 内置工具 | Built-in", "10")
+        st.metric("🔧 内置工具 | Built-in", len(_BUILTIN_TOOLS))
     with col2:
-        custom_count = tool_storage.get_tool_count()
+        custom_count = len(_custom_tool_configs(tool_storage))
         st.metric("✍️ 手动创建 | Manual", custom_count)
     with col3:
         st.metric("🤖 AI生成 | Generated", generated_count)
     with col4:
-        st.metric("📊 总计 | Total", 10 + custom_count + generated_count)
+        st.metric("📊 总计 | Total", len(_BUILTIN_TOOLS) + custom_count + generated_count)
     
     st.markdown("---")
     
@@ -940,209 +1423,238 @@ def tool_management_interface():
     
     # Tab 1: View All Tools (changed order - most useful first)
     with tab1:
-        col_header, col_refresh = st.columns([4, 1])
-        with col_header:
-            st.subheader("📋 查看所有可用工具 | View All Available Tools")
-        with col_refresh:
-            if st.button("🔄 刷新", help="重新加载所有工具", use_container_width=True):
-                st.cache_data.clear()
-                st.rerun()
-        
-        # Section 1: Built-in Tools
-        st.markdown("### 🔧 内置工具 (10个)")
-        st.caption("系统预装，创建智能体时可直接选择使用 | Pre-installed, ready to use when creating agents")
-        
-        builtin_tools_list = [
-            ("Calculator", "计算器", "执行数学计算和表达式求值"),
-            ("File I/O", "文件读写", "读取和写入文件"),
-            ("Python REPL", "Python执行器", "执行Python代码"),
-            ("Text Processing", "文本处理", "处理和分析文本"),
-            ("Scientific Compute", "科学计算", "科学和工程计算"),
-            ("Statistical Test", "统计检验", "统计测试和分析"),
-            ("Unit Converter", "单位转换", "转换各种单位"),
-            ("Data Analysis", "数据分析", "分析和计算数据统计"),
-            ("Visualization", "可视化", "创建图表和可视化"),
-            ("Data Cleaning", "数据清洗", "清理和预处理数据"),
-        ]
-        
-        for i, (name_en, name_cn, desc) in enumerate(builtin_tools_list):
-            with st.expander(f"✅ {name_en} | {name_cn}"):
-                st.markdown(f"**功能:** {desc}")
-                st.markdown("**状态:** ✅ 可用")
-                st.markdown("**使用:** 创建智能体时从工具列表选择")
-        
-        st.markdown("---")
-        
-        # Section 2: AI-Generated Tools
-        st.markdown("### 🤖 AI生成的工具")
-        st.caption("通过'生成工具'页面由AI自动创建的工具 | Tools automatically created by AI via 'Generate Tool' page")
-        
-        # Load generated tools metadata
-        import json
-        import os
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        parent_dir = os.path.dirname(current_dir)
-        metadata_dir = os.path.join(parent_dir, "tools_data", "generated_metadata")
-        
-        generated_tools = []
-        if os.path.exists(metadata_dir):
-            for filename in os.listdir(metadata_dir):
-                if filename.endswith('.json'):
-                    file_path = os.path.join(metadata_dir, filename)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            metadata = json.load(f)
-                            generated_tools.append(metadata)
-                    except Exception as e:
-                        continue
-        
-        if not generated_tools:
-            st.info("""
-            💡 **还没有AI生成的工具**
-            
-            **如何创建:**
-            1. 点击左侧导航的 **"生成工具 | Generate Tool"**
-            2. 描述你需要的工具功能
-            3. AI会自动生成完整的Python代码
-            4. 生成后可在"创建智能体"时使用
-            
-            **优势:**
-            - 自动编写代码，功能强大
-            - 支持复杂逻辑
-            - 包含错误处理
-            """)
-        else:
-            for i, metadata in enumerate(generated_tools):
-                tool_name = metadata.get('name', 'Unnamed')
-                with st.expander(f"🤖 {tool_name}"):
-                    st.markdown(f"**描述:** {metadata.get('description', '无描述')}")
-                    st.markdown(f"**创建时间:** {metadata.get('created_at', 'Unknown')[:19]}")
-                    
-                    # Parameters
-                    params = metadata.get('input_parameters', [])
-                    if params:
-                        st.markdown("**参数:**")
-                        for param in params:
-                            param_name = param.get('name')
-                            param_type = param.get('type', 'unknown')
-                            param_desc = param.get('description', '无描述')
-                            st.write(f"- `{param_name}` ({param_type}): {param_desc}")
-                    
-                    # Expected output
-                    if metadata.get('expected_output'):
-                        st.markdown(f"**返回值:** {metadata['expected_output']}")
-                    
-                    # Dependencies
-                    if metadata.get('dependencies'):
-                        deps = ', '.join(metadata['dependencies'])
-                        st.markdown(f"**依赖:** `{deps}`")
-                    
-                    # Code file
-                    tool_file = metadata.get('file_path')
-                    if tool_file and os.path.exists(tool_file):
-                        with st.expander("查看代码"):
-                            with open(tool_file, 'r', encoding='utf-8') as f:
-                                code = f.read()
-                            st.code(code, language='python')
-        
-        st.markdown("---")
-        
-        # Section 3: Manually Created Custom Tools
-        st.markdown("### ✍️ 手动创建的工具")
-        st.caption("通过工具管理手动添加的简单工具 | Simple tools manually added via tool management")
-        
-        custom_tools = tool_storage.load_all_tools()
-        
-        if not custom_tools:
-            st.info("""
-            💡 **还没有手动创建的工具**
-            
-            **创建方法:**
-            - 在上方的"创建工具"标签页手动创建
-            
-            **区别:**
-            - 手动创建：简单快速，适合基础工具，不消耗tokens
-            - AI生成：功能强大，自动编写代码，但消耗tokens
-            """)
-        else:
-            for i, tool in enumerate(custom_tools):
-                with st.expander(f"⭐ {tool.get('name', 'Unnamed Tool')}"):
-                    st.markdown(f"**描述:** {tool.get('description', '无描述')}")
-                    
-                    # Parameters
-                    params = tool.get('parameters', {}).get('properties', {})
-                    required = tool.get('parameters', {}).get('required', [])
-                    
-                    if params:
-                        st.markdown("**参数:**")
-                        for param_name, param_info in params.items():
-                            req_mark = "✅ 必需" if param_name in required else "⭕ 可选"
-                            st.write(f"- `{param_name}` ({param_info.get('type', 'unknown')}) - {req_mark}")
-                    
-                    # Code
-                    if tool.get('code'):
-                        with st.expander("查看代码"):
-                            st.code(tool.get('code'), language='python')
+        _view_tools_fragment(tool_storage, generated_tools)
     
     # Tab 2: Create Tool (manual creation)
     with tab2:
-        st.subheader("✍️ 手动创建工具 | Manually Create Tool")
-        
-        st.warning("""
-        ⚠️ **注意 | Note:** 
+        _create_tool_fragment(tool_storage)
+    
+    # Tab 3: Edit Tool
+    with tab3:
+        _edit_tool_fragment(tool_storage)
+    
+    # Tab 4: Delete Tool
+    with tab4:
+        _delete_tool_fragment(tool_storage)
+
+
+@_fragment
+def _view_tools_fragment(tool_storage, generated_tools):
+    """View all available tools. / 查看所有可用工具。"""
+    col_header, col_refresh = st.columns([4, 1])
+    with col_header:
+        st.subheader("📋 查看所有可用工具 | View All Available Tools")
+    with col_refresh:
+        if st.button("🔄 刷新", help="重新加载所有工具", use_container_width=True):
+            st.cache_data.clear()
+            invalidate_tools_cache()
+            st.rerun()
+    
+    # Section 1: Built-in Tools
+    st.markdown(f"### 🔧 内置工具 ({len(_BUILTIN_TOOLS)}个)")
+    st.caption("系统预装，创建智能体时可直接选择使用 | Pre-installed, ready to use when creating agents")
+    
+    st.markdown(_BUILTIN_TOOLS_TABLE_MD)
+    
+    st.markdown("---")
+    
+    # Section 2: AI-Generated Tools
+    st.markdown("### 🤖 AI生成的工具")
+    st.caption("通过'生成工具'页面由AI自动创建的工具 | Tools automatically created by AI via 'Generate Tool' page")
+    
+    if not generated_tools:
+        st.info("""
+        💡 **还没有AI生成的工具**
+        
+        **如何创建:**
+        1. 点击左侧导航的 **"生成工具 | Generate Tool"**
+        2. 描述你需要的工具功能
+        3. AI会自动生成完整的Python代码
+        4. 生成后可在"创建智能体"时使用
+        
+        **优势:**
+        - 自动编写代码，功能强大
+        - 支持复杂逻辑
+        - 包含错误处理
+        """)
+    else:
+        for i, metadata in enumerate(generated_tools):
+            tool_name = metadata.get('name', 'Unnamed')
+            with st.expander(f"🤖 {tool_name}"):
+                st.markdown(f"**描述:** {metadata.get('description', '无描述')}")
+                st.markdown(f"**创建时间:** {metadata.get('created_at', 'Unknown')[:19]}")
+                
+                # Parameters
+                params = metadata.get('input_parameters', [])
+                if params:
+                    st.markdown("**参数:**")
+                    for param in params:
+                        param_name = param.get('name')
+                        param_type = param.get('type', 'unknown')
+                        param_desc = param.get('description', '无描述')
+                        st.write(f"- `{param_name}` ({param_type}): {param_desc}")
+                
+                # Expected output
+                if metadata.get('expected_output'):
+                    st.markdown(f"**返回值:** {metadata['expected_output']}")
+                
+                # Dependencies
+                if metadata.get('dependencies'):
+                    deps = ', '.join(metadata['dependencies'])
+                    st.markdown(f"**依赖:** `{deps}`")
+                
+                # Code file
+                tool_file = metadata.get('file_path')
+                tool_mtime = _mtime_ns(tool_file) if tool_file else 0
+                if tool_mtime:
+                    with st.expander("查看代码"):
+                        code = _read_file_cached(tool_file, tool_mtime)
+                        st.code(code, language='python')
+    
+    st.markdown("---")
+    
+    # Section 3: Manually Created Custom Tools
+    st.markdown("### ✍️ 手动创建的工具")
+    st.caption("通过工具管理手动添加的简单工具 | Simple tools manually added via tool management")
+    
+    custom_tools = _custom_tool_views_cached(tool_storage, _mtime_ns(tool_storage.tools_file))
+    
+    if not custom_tools:
+        st.info("""
+        💡 **还没有手动创建的工具**
         
-        - **这里是手动创建**简单工具（如简单的文本处理）
-        - **如果需要AI自动生成代码**，请使用左侧导航的"生成工具 | Generate Tool"页面
+        **创建方法:**
+        - 在上方的"创建工具"标签页手动创建
         
         **区别:**
-        - 🤖 AI生成：功能强大，自动编写代码，但消耗tokens
-        - ✍️ 手动创建：简单快速，不消耗tokens，适合基础工具
+        - 手动创建：简单快速，适合基础工具，不消耗tokens
+        - AI生成：功能强大，自动编写代码，但消耗tokens
         """)
-        
-        st.markdown("---")
-        
-        # Basic info
-        tool_name = st.text_input(
-            "🏷️ 工具名称 *",
-            placeholder="例如: TextReverser",
-            help="工具的唯一标识名称"
-        )
-        
-        tool_desc = st.text_area(
-            "📝 工具描述 *",
-            placeholder="例如: 反转输入的文本字符串",
-            help="说明这个工具的功能",
-            height=80
+    else:
+        # One markdown element per tool instead of one per parameter
+        # 每个工具一个markdown元素，而不是每个参数一个
+        for name, details_md, code in custom_tools:
+            with st.expander(f"⭐ {name}"):
+                st.markdown(details_md)
+                
+                # Code
+                if code:
+                    with st.expander("查看代码"):
+                        st.code(code, language='python')
+
+
+# JSON schema types offered for manually created tool parameters
+# 手动创建工具参数可选的JSON schema类型
+_PARAM_TYPES = ("string", "number", "integer", "boolean", "array")
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _example_code(param_names: Tuple[str, ...]) -> str:
+    """
+    Placeholder code for the manual tool editor, built once per parameter
+    list and kept across reruns.
+    手动工具编辑器的占位代码，每个参数列表只构建一次，并在重新运行间保留。
+
+    Args:
+        param_names: Parameter names in order / 按顺序排列的参数名称
+
+    Returns:
+        Example code text / 示例代码文本
+    """
+    if not param_names:
+        return "# 示例: 反转字符串\nresult = text[::-1]"
+    return (
+        f"# 示例: 可使用的参数变量: {', '.join(param_names)}\n"
+        "# 使用 result 变量存储返回值\n"
+        f"result = {param_names[0]}[::-1]  # 示例"
+    )
+
+
+def _set_tool_params(params: List[ToolParam], from_editor: bool = False) -> None:
+    """
+    Replace the manual tool parameters, keeping the name set and the table
+    version in sync.
+    替换手动工具参数，并同步名称集合和表格版本。
+
+    Args:
+        params: Tool parameters / 工具参数
+        from_editor: True when the change comes from the parameter table
+            itself; the table already shows it, so its version (and key) is
+            kept and the edit is not discarded /
+            变化是否来自参数表格本身；表格已显示该变化，因此保留其版本（和键），编辑不会丢失
+    """
+    st.session_state.tool_params = params
+    st.session_state.tool_param_names = {param.name for param in params}
+    if not from_editor:
+        st.session_state.tool_params_version += 1
+
+
+@_fragment
+def _create_tool_fragment(tool_storage):
+    """Manually create a custom tool. / 手动创建自定义工具。"""
+    st.subheader("✍️ 手动创建工具 | Manually Create Tool")
+    
+    st.warning(_MANUAL_VS_AI_WARNING)
+    
+    st.markdown("---")
+    
+    # Basic info
+    tool_name = st.text_input(
+        "🏷️ 工具名称 *",
+        placeholder="例如: TextReverser",
+        help="工具的唯一标识名称"
+    )
+    
+    tool_desc = st.text_area(
+        "📝 工具描述 *",
+        placeholder="例如: 反转输入的文本字符串",
+        help="说明这个工具的功能",
+        height=80
+    )
+    
+    st.markdown("---")
+    st.markdown("### 📋 参数配置 | Parameters")
+    st.caption("可以添加多个参数，每个参数需要指定名称、类型和是否必需")
+    
+    # Display existing parameters in one editable table; rows can be edited
+    # or deleted in place
+    # 在一个可编辑表格中显示现有参数；可直接编辑或删除行
+    if st.session_state.tool_params:
+        import pandas as pd
+
+        st.markdown("**当前参数列表:**")
+        edited = st.data_editor(
+            pd.DataFrame(st.session_state.tool_params, columns=["name", "type", "required"]),
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "name": st.column_config.TextColumn("参数名称", required=True),
+                "type": st.column_config.SelectboxColumn(
+                    "参数类型", options=_PARAM_TYPES, required=True
+                ),
+                "required": st.column_config.CheckboxColumn("必需参数", default=True),
+            },
+            # A new key per outside change (add, save, clear), so edits are
+            # never replayed onto a replaced parameter list
+            # 每次外部变化（添加、保存、清空）使用新键，编辑不会重放到被替换的参数列表上
+            key=f"param_editor_{st.session_state.tool_params_version}"
         )
-        
+        params = [
+            ToolParam(row["name"], row["type"] or "string", bool(row["required"]))
+            for row in edited.to_dict("records")
+            if row.get("name")
+        ]
+        if params != st.session_state.tool_params:
+            _set_tool_params(params, from_editor=True)
         st.markdown("---")
-        st.markdown("### 📋 参数配置 | Parameters")
-        st.caption("可以添加多个参数，每个参数需要指定名称、类型和是否必需")
-        
-        # Initialize session state for parameters
-        if 'tool_params' not in st.session_state:
-            st.session_state.tool_params = []
-        
-        # Display existing parameters
-        if st.session_state.tool_params:
-            st.markdown("**当前参数列表:**")
-            for idx, param in enumerate(st.session_state.tool_params):
-                col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
-                with col1:
-                    st.text(f"📌 {param['name']}")
-                with col2:
-                    st.text(f"类型: {param['type']}")
-                with col3:
-                    req_text = "✅ 必需" if param['required'] else "⭕ 可选"
-                    st.text(req_text)
-                with col4:
-                    if st.button("🗑️", key=f"del_param_{idx}", help="删除此参数"):
-                        st.session_state.tool_params.pop(idx)
-                        st.rerun()
-            st.markdown("---")
-        
-        # Add new parameter
-        st.markdown("**添加新参数:**")
+    
+    # Add new parameter
+    st.markdown("**添加新参数:**")
+    # A form, so picking a type or ticking "required" does not rerun the
+    # fragment until the parameter is added
+    # 使用表单，选择类型或勾选"必需"不会在添加参数前重新运行片段
+    with st.form("add_tool_param"):
         col1, col2, col3 = st.columns([3, 2, 2])
         
         with col1:
@@ -1156,7 +1668,7 @@ def tool_management_interface():
         with col2:
             new_param_type = st.selectbox(
                 "参数类型",
-                ["string", "number", "integer", "boolean", "array"],
+                _PARAM_TYPES,
                 key="new_param_type"
             )
         
@@ -1167,183 +1679,186 @@ def tool_management_interface():
                 key="new_param_required"
             )
         
-        if st.button("➕ 添加参数", use_container_width=True):
-            if new_param_name:
-                # Check for duplicate
-                if any(p['name'] == new_param_name for p in st.session_state.tool_params):
-                    st.error(f"❌ 参数 '{new_param_name}' 已存在")
-                else:
-                    st.session_state.tool_params.append({
-                        'name': new_param_name,
-                        'type': new_param_type,
-                        'required': new_param_required
-                    })
-                    st.success(f"✅ 已添加参数: {new_param_name}")
-                    st.rerun()
+        submitted = st.form_submit_button("➕ 添加参数", use_container_width=True)
+    
+    if submitted:
+        if new_param_name:
+            # Check for duplicate
+            if new_param_name in st.session_state.tool_param_names:
+                st.error(f"❌ 参数 '{new_param_name}' 已存在")
             else:
-                st.error("❌ 请输入参数名称")
-        
-        st.markdown("---")
-        st.markdown("**💻 Python代码实现 (可选)**")
-        st.caption("可以直接使用参数名作为变量，使用 result 变量存储返回值")
-        
-        # Show example based on parameters
-        if st.session_state.tool_params:
-            param_names = ", ".join([p['name'] for p in st.session_state.tool_params])
-            example_text = f"""# 示例: 可使用的参数变量: {param_names}
-# 使用 result 变量存储返回值
-result = {st.session_state.tool_params[0]['name']}[::-1]  # 示例"""
+                _set_tool_params(st.session_state.tool_params + [
+                    ToolParam(new_param_name, new_param_type, new_param_required)
+                ])
+                st.success(f"✅ 已添加参数: {new_param_name}")
+                st.rerun()
         else:
-            example_text = """# 示例: 反转字符串
-result = text[::-1]"""
-        
-        code_example = st.text_area(
-            "代码",
-            placeholder=example_text,
-            height=150,
-            help="编写Python代码实现工具功能"
+            st.error("❌ 请输入参数名称")
+    
+    st.markdown("---")
+    st.markdown("**💻 Python代码实现 (可选)**")
+    st.caption("可以直接使用参数名作为变量，使用 result 变量存储返回值")
+    
+    # Show example based on parameters
+    example_text = _example_code(tuple(p.name for p in st.session_state.tool_params))
+    
+    code_example = st.text_area(
+        "代码",
+        placeholder=example_text,
+        height=150,
+        help="编写Python代码实现工具功能"
+    )
+    
+    st.markdown("---")
+    
+    # Save and reset buttons
+    col_btn1, col_btn2 = st.columns(2)
+    with col_btn1:
+        if st.button("💾 保存工具", type="primary", use_container_width=True):
+            if not tool_name or not tool_desc:
+                st.error("❌ 请填写工具名称和描述")
+            elif not st.session_state.tool_params:
+                st.error("❌ 请至少添加一个参数")
+            else:
+                # Build parameters schema
+                params = {
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+                
+                for param in st.session_state.tool_params:
+                    params["properties"][param.name] = {
+                        "type": param.type
+                    }
+                    if param.required:
+                        params["required"].append(param.name)
+                
+                config = {
+                    "name": tool_name,
+                    "description": tool_desc,
+                    "parameters": params,
+                    "code": code_example.strip() if code_example.strip() else None
+                }
+                
+                if tool_storage.save_tool(config):
+                    st.success(f"✅ 工具 '{tool_name}' 保存成功！")
+                    st.balloons()
+                    # Clear parameters
+                    _set_tool_params([])
+                    st.rerun()
+                else:
+                    st.error("❌ 保存失败，工具名称可能已存在")
+    
+    with col_btn2:
+        if st.button("🗑️ 清空重置", use_container_width=True):
+            _set_tool_params([])
+            st.rerun()
+
+
+@_fragment
+def _edit_tool_fragment(tool_storage):
+    """Edit a custom tool. / 编辑自定义工具。"""
+    st.subheader("✏️ 编辑工具 | Edit Tool")
+    
+    st.caption("只能编辑自定义工具，内置工具无法修改 | Only custom tools can be edited")
+    
+    tools = _custom_tool_configs(tool_storage)
+    
+    if not tools:
+        st.info("📭 还没有自定义工具可以编辑\n\n请先创建或生成工具")
+    else:
+        # Look tools up in the cached configs instead of re-reading storage
+        # 在缓存的配置中查找工具，而不是重新读取存储
+        tools_by_name = {tool.get('name'): tool for tool in tools}
+        tool_names = list(tools_by_name)
+        selected = st.selectbox(
+            "选择要编辑的工具",
+            tool_names,
+            key="edit_select"
         )
         
-        st.markdown("---")
-        
-        # Save and reset buttons
-        col_btn1, col_btn2 = st.columns(2)
-        with col_btn1:
-            if st.button("💾 保存工具", type="primary", use_container_width=True):
-                if not tool_name or not tool_desc:
-                    st.error("❌ 请填写工具名称和描述")
-                elif not st.session_state.tool_params:
-                    st.error("❌ 请至少添加一个参数")
-                else:
-                    # Build parameters schema
-                    params = {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                    
-                    for param in st.session_state.tool_params:
-                        params["properties"][param['name']] = {
-                            "type": param['type']
-                        }
-                        if param['required']:
-                            params["required"].append(param['name'])
+        if selected:
+            tool = tools_by_name.get(selected)
+            
+            if tool:
+                st.markdown("---")
+                
+                new_name = st.text_input("工具名称", value=tool.get('name', ''))
+                new_desc = st.text_area("描述", value=tool.get('description', ''), height=80)
+                new_code = st.text_area("代码", value=tool.get('code', ''), height=200)
+                
+                if st.button("💾 保存修改", type="primary"):
+                    if new_name != selected:
+                        tool_storage.delete_tool(selected)
                     
-                    config = {
-                        "name": tool_name,
-                        "description": tool_desc,
-                        "parameters": params,
-                        "code": code_example.strip() if code_example.strip() else None
+                    updated = {
+                        "name": new_name,
+                        "description": new_desc,
+                        "parameters": tool.get('parameters', {}),
+                        "code": new_code.strip() or None
                     }
                     
-                    if tool_storage.save_tool(config):
-                        st.success(f"✅ 工具 '{tool_name}' 保存成功！")
-                        st.balloons()
-                        # Clear parameters
-                        st.session_state.tool_params = []
+                    if tool_storage.save_tool(updated):
+                        st.success("✅ 更新成功！")
                         st.rerun()
                     else:
-                        st.error("❌ 保存失败，工具名称可能已存在")
-        
-        with col_btn2:
-            if st.button("🗑️ 清空重置", use_container_width=True):
-                st.session_state.tool_params = []
-                st.rerun()
+                        st.error("❌ 更新失败")
+
+
+@_fragment
+def _delete_tool_fragment(tool_storage):
+    """Delete custom tools. / 删除自定义工具。"""
+    st.subheader("🗑️ 删除工具 | Delete Tool")
     
-    # Tab 3: Edit Tool
-    with tab3:
-        st.subheader("✏️ 编辑工具 | Edit Tool")
-        
-        st.caption("只能编辑自定义工具，内置工具无法修改 | Only custom tools can be edited")
+    st.caption("只能删除自定义工具，内置工具无法删除 | Only custom tools can be deleted")
+    
+    tools = _custom_tool_configs(tool_storage)
+    
+    if not tools:
+        st.info("📭 没有可删除的工具")
+    else:
+        st.warning("⚠️ 删除操作不可恢复，请谨慎操作")
         
-        tools = tool_storage.load_all_tools()
+        # Look tools up in the cached configs instead of re-reading storage
+        # 在缓存的配置中查找工具，而不是重新读取存储
+        tools_by_name = {tool.get('name'): tool for tool in tools}
+        tool_names = list(tools_by_name)
+        selected = st.selectbox("选择要删除的工具", tool_names)
         
-        if not tools:
-            st.info("📭 还没有自定义工具可以编辑\n\n请先创建或生成工具")
-        else:
-            tool_names = [tool.get('name') for tool in tools]
-            selected = st.selectbox(
-                "选择要编辑的工具",
-                tool_names,
-                key="edit_select"
-            )
+        if selected:
+            tool = tools_by_name.get(selected)
             
-            if selected:
-                tool = tool_storage.get_tool(selected)
+            if tool:
+                with st.expander("📄 工具信息", expanded=True):
+                    st.markdown(f"**名称:** {tool.get('name')}")
+                    st.markdown(f"**描述:** {tool.get('description')}")
                 
-                if tool:
-                    st.markdown("---")
-                    
-                    new_name = st.text_input("工具名称", value=tool.get('name', ''))
-                    new_desc = st.text_area("描述", value=tool.get('description', ''), height=80)
-                    new_code = st.text_area("代码", value=tool.get('code', ''), height=200)
-                    
-                    if st.button("💾 保存修改", type="primary"):
-                        if new_name != selected:
-                            tool_storage.delete_tool(selected)
-                        
-                        updated = {
-                            "name": new_name,
-                            "description": new_desc,
-                            "parameters": tool.get('parameters', {}),
-                            "code": new_code.strip() or None
-                        }
-                        
-                        if tool_storage.save_tool(updated):
-                            st.success("✅ 更新成功！")
+                col1, col2 = st.columns(2)
+                with col1:
+                    if st.button("🗑️ 确认删除", type="primary", use_container_width=True):
+                        if tool_storage.delete_tool(selected):
+                            st.success(f"✅ 已删除 '{selected}'")
                             st.rerun()
                         else:
-                            st.error("❌ 更新失败")
-    
-    # Tab 4: Delete Tool
-    with tab4:
-        st.subheader("🗑️ 删除工具 | Delete Tool")
-        
-        st.caption("只能删除自定义工具，内置工具无法删除 | Only custom tools can be deleted")
-        
-        tools = tool_storage.load_all_tools()
-        
-        if not tools:
-            st.info("📭 没有可删除的工具")
-        else:
-            st.warning("⚠️ 删除操作不可恢复，请谨慎操作")
-            
-            tool_names = [tool.get('name') for tool in tools]
-            selected = st.selectbox("选择要删除的工具", tool_names)
-            
-            if selected:
-                tool = tool_storage.get_tool(selected)
+                            st.error("❌ 删除失败")
                 
-                if tool:
-                    with st.expander("📄 工具信息", expanded=True):
-                        st.markdown(f"**名称:** {tool.get('name')}")
-                        st.markdown(f"**描述:** {tool.get('description')}")
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        if st.button("🗑️ 确认删除", type="primary", use_container_width=True):
-                            if tool_storage.delete_tool(selected):
-                                st.success(f"✅ 已删除 '{selected}'")
-                                st.rerun()
-                            else:
-                                st.error("❌ 删除失败")
-                    
-                    with col2:
-                        if st.button("❌ 取消", use_container_width=True):
-                            st.rerun()
-            
-            st.markdown("---")
-            st.markdown("### ⚠️ 危险操作")
-            
-            with st.expander("删除所有自定义工具"):
-                st.error("这将删除所有自定义工具，此操作不可恢复！")
-                confirm = st.checkbox("我明白此操作的后果")
-                if confirm and st.button("🗑️ 删除全部"):
-                    if tool_storage.clear_all_tools():
-                        st.success("✅ 已删除所有工具")
+                with col2:
+                    if st.button("❌ 取消", use_container_width=True):
                         st.rerun()
-                    else:
-                        st.error("❌ 操作失败")
+        
+        st.markdown("---")
+        st.markdown("### ⚠️ 危险操作")
+        
+        with st.expander("删除所有自定义工具"):
+            st.error("这将删除所有自定义工具，此操作不可恢复！")
+            confirm = st.checkbox("我明白此操作的后果")
+            if confirm and st.button("🗑️ 删除全部"):
+                if tool_storage.clear_all_tools():
+                    st.success("✅ 已删除所有工具")
+                    st.rerun()
+                else:
+                    st.error("❌ 操作失败")
 
 
 def main():
@@ -1357,25 +1872,7 @@ def main():
     
     # Add quick start guide in sidebar
     with st.sidebar.expander("🚀 快速开始 | Quick Start"):
-        st.markdown("""
-        ### 使用步骤：
-        
-        **1️⃣ 配置LLM**
-        - 在左侧输入API信息
-        - 点击"测试连接"
-        
-        **2️⃣ 创建智能体**
-        - 进入"创建智能体"页面
-        - 选择工具，命名智能体
-        
-        **3️⃣ 开始对话**
-        - 进入"对话"页面
-        - 与智能体交互
-        
-        **💡 高级功能：**
-        - 生成工具：用AI创建自定义工具
-        - 编排：多智能体协作
-        """)
+        st.markdown(_QUICK_START_MD)
 
     page = st.sidebar.radio(
         "Select Page | 选择页面",
@@ -1391,7 +1888,9 @@ def main():
 
     if st.sidebar.button("Clear All | 清除所有"):
         st.session_state.agents = {}
-        st.session_state.chat_history = []
+        st.session_state.chat_history.clear()
+        st.session_state.chat_count = 0
+        st.session_state.chat_render_window = CHAT_VISIBLE_MESSAGES
         st.success("All data cleared | 所有数据已清除")
 
     if "Create" in page:
@@ -0,0 +1,36 @@
+"""
+GUI Data Models / GUI数据模型
+
+Small data types kept in session state by the Streamlit app. They live in an
+importable module rather than in app.py: Streamlit re-executes the main
+script on every rerun, which would redefine the classes and make instances
+from earlier runs compare unequal.
+Streamlit应用保存在会话状态中的小型数据类型。它们位于可导入的模块而不是app.py中：
+Streamlit每次重新运行都会重新执行主脚本，这会重新定义类，使之前运行创建的实例比较不相等。
+
+Author: LLM Agent Framework
+License: MIT
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ToolParam:
+    """
+    One parameter of a manually created tool.
+    手动创建工具的一个参数。
+
+    Attributes:
+        name (str): Parameter name / 参数名称
+        type (str): JSON schema type / JSON schema类型
+        required (bool): Whether the parameter is required / 是否为必需参数
+    """
+
+    # Explicit slots instead of dataclass(slots=True), which needs Python 3.10
+    # 显式声明slots，而不是需要Python 3.10的dataclass(slots=True)
+    __slots__ = ("name", "type", "required")
+
+    name: str
+    type: str
+    required: bool
@@ -0,0 +1,13 @@
+"""
+Shared pytest setup / 共享的pytest设置
+
+Makes the framework packages (core, tools, utils) importable from tests.
+使测试可以导入框架包（core、tools、utils）。
+"""
+
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
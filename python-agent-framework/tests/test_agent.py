@@ -0,0 +1,94 @@
+"""
+Tests for the agent reasoning loop / 智能体推理循环测试
+"""
+
+from core.agent import Agent
+from core.tool import Tool
+
+
+class StreamResponse:
+    """Streamed HTTP response stand-in that records whether it was closed."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class StreamingClient:
+    """LLM client that streams a fixed list of chunks per call."""
+
+    model = "stub"
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.streams = []
+
+    def chat(self, messages, stream=False, **kwargs):
+        stream_response = StreamResponse(self.replies.pop(0))
+        self.streams.append(stream_response)
+        return {"success": True, "stream": True, "response": stream_response}
+
+    def parse_stream(self, response):
+        for chunk in response.chunks:
+            if response.closed:
+                return
+            yield chunk
+
+
+class EchoTool(Tool):
+    """Returns its text argument."""
+
+    def __init__(self):
+        super().__init__(
+            "echo",
+            "Echoes text",
+            {"type": "object", "properties": {"text": {"type": "string"}}, "required": ["text"]}
+        )
+
+    def execute(self, text):
+        return {"success": True, "result": text}
+
+
+def _streamed_text(events):
+    return "".join(e["content"] for e in events if e["type"] == "thought_chunk")
+
+
+def test_run_stream_keeps_streaming_after_non_tool_json_block():
+    """A JSON example inside a reply must not cut the reply off."""
+    reply = [
+        "Use this config:\n```json\n",
+        '{"retries": 3}\n',
+        "```",
+        "\nThen restart the service.",
+    ]
+    client = StreamingClient(reply)
+    agent = Agent("a", client)
+
+    events = list(agent.run_stream("how?"))
+
+    assert _streamed_text(events) == "".join(reply)
+    assert not client.streams[0].closed
+    assert events[-1] == {"type": "response", "content": "".join(reply)}
+
+
+def test_run_stream_stops_after_tool_call_block():
+    """A closed tool call block ends the stream early and runs the tool."""
+    tool_call = [
+        "I will echo.\n```json\n",
+        '{"action": "echo", "action_input": {"text": "hi"}}\n',
+        "```",
+        "\nignored trailing text",
+    ]
+    final = ['```json\n{"final_answer": "hi"}\n```']
+    client = StreamingClient(tool_call, final)
+    agent = Agent("a", client, tools=[EchoTool()])
+
+    events = list(agent.run_stream("echo hi"))
+
+    assert client.streams[0].closed
+    assert "ignored trailing text" not in _streamed_text(events)
+    assert any(e["type"] == "tool_result" and '"hi"' in e["content"] for e in events)
+    assert events[-1]["type"] == "final_answer"
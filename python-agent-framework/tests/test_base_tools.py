@@ -0,0 +1,37 @@
+"""
+Tests for the built-in tools / 内置工具测试
+"""
+
+from tools.base_tools import CalculatorTool, PythonREPLTool
+
+
+def test_python_repl_does_not_share_variables_by_default():
+    """A shared default instance must not leak state between calls."""
+    tool = PythonREPLTool()
+
+    assert tool.execute(code="secret = 42")["success"]
+    result = tool.execute(code="print(secret)")
+
+    assert not result["success"]
+    assert "secret" in result["error"]
+
+
+def test_python_repl_persistent_keeps_variables_until_reset():
+    """An opted-in instance keeps variables until reset() is called."""
+    tool = PythonREPLTool(persistent=True)
+
+    tool.execute(code="total = 40")
+    assert tool.execute(code="print(total + 2)")["output"] == "42\n"
+
+    tool.reset()
+    assert not tool.execute(code="print(total)")["success"]
+
+
+def test_tool_schemas_are_not_shared_between_instances():
+    """Editing one instance's schema leaves the class template alone."""
+    first, second = CalculatorTool(), CalculatorTool()
+
+    first.parameters["properties"]["expression"]["description"] = "changed"
+
+    assert CalculatorTool._PARAMETERS["properties"]["expression"]["description"] != "changed"
+    assert second.parameters == CalculatorTool._PARAMETERS
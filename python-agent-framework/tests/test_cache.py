@@ -0,0 +1,200 @@
+"""
+Tests for the cache utilities / 缓存工具测试
+"""
+
+from core import cache as cache_module
+from core.agent import Agent
+from core.cache import DiskCache, LRUCache, ToolResultCache
+from core.tool import Tool, ToolRegistry
+
+
+class CountingTool(Tool):
+    """Cacheable tool that counts how often it really runs."""
+
+    cacheable = True
+
+    def __init__(self):
+        super().__init__("counter", "Counts executions", {"type": "object", "properties": {}})
+        self.calls = 0
+
+    def execute(self, **kwargs):
+        self.calls += 1
+        return {"success": True, "result": self.calls}
+
+
+class RowsTool(CountingTool):
+    """Cacheable tool whose result holds nested containers."""
+
+    def execute(self, **kwargs):
+        self.calls += 1
+        return {"success": True, "rows": [{"id": 1}]}
+
+
+class StubClient:
+    """LLM client stand-in; the tests never call it."""
+
+    model = "stub"
+
+
+def test_shared_cache_is_used_by_two_agents():
+    """An empty shared cache must not be replaced by a private one."""
+    cache = ToolResultCache()
+    tool = CountingTool()
+    first = Agent("first", StubClient(), tools=[tool], tool_cache=cache)
+    second = Agent("second", StubClient(), tools=[tool], tool_cache=cache)
+
+    assert first.tool_cache is cache
+    assert second.tool_cache is cache
+
+    first.tool_cache.call(tool, {"x": 1})
+    result = second.tool_cache.call(tool, {"x": 1})
+
+    assert result["result"] == 1
+    assert tool.calls == 1
+    assert cache.hits == 1
+
+
+def test_shared_cache_is_used_by_two_registries():
+    """Registries sharing a cache serve each other's results."""
+    cache = ToolResultCache()
+    tool = CountingTool()
+    first, second = ToolRegistry(cache), ToolRegistry(cache)
+    first.register(tool)
+    second.register(tool)
+
+    first.execute("counter", x=1)
+    second.execute("counter", x=1)
+
+    assert tool.calls == 1
+    assert cache.hits == 1
+
+
+class FlakyTool(Tool):
+    """Cacheable tool that fails on its first call."""
+
+    cacheable = True
+
+    def __init__(self):
+        super().__init__("flaky", "Fails once", {"type": "object", "properties": {}})
+        self.calls = 0
+
+    def execute(self, **kwargs):
+        self.calls += 1
+        return {"success": self.calls > 1, "result": self.calls}
+
+
+def test_lru_evicts_least_recently_used():
+    """A get() refreshes an entry, so the untouched one is evicted."""
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_entries_expire_after_ttl(monkeypatch):
+    """Entries older than ttl are misses and are removed."""
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUCache(maxsize=4, ttl=10)
+    cache.set("k", "v")
+
+    now[0] = 109.0
+    assert cache.get("k") == "v"
+
+    now[0] = 111.0
+    assert cache.get("k", "missing") == "missing"
+    assert "k" not in cache
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_clear_resets_counters():
+    """clear() drops entries and hit/miss counts."""
+    cache = LRUCache()
+    cache.set("k", 1)
+    cache.get("k")
+    cache.get("other")
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_disk_cache_round_trip(tmp_path):
+    """A value written by one DiskCache is read back by a new one."""
+    DiskCache(str(tmp_path)).set(("chat", "hi"), {"content": "hello"})
+
+    reloaded = DiskCache(str(tmp_path))
+
+    assert ("chat", "hi") in reloaded
+    assert reloaded.get(("chat", "hi")) == {"content": "hello"}
+    assert (reloaded.hits, reloaded.misses) == (1, 0)
+    assert reloaded.get("absent") is None
+
+    reloaded.clear()
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_tool_result_cache_keys_on_tool_and_arguments():
+    """Argument order does not matter; different arguments are new calls."""
+    cache = ToolResultCache()
+    tool = CountingTool()
+
+    cache.call(tool, {"a": 1, "b": 2})
+    cache.call(tool, {"b": 2, "a": 1})
+    cache.call(tool, {"a": 2, "b": 2})
+
+    assert tool.calls == 2
+
+
+def test_tool_result_cache_stores_only_successes():
+    """A failed result is retried, the later success is cached."""
+    cache = ToolResultCache()
+    tool = FlakyTool()
+
+    assert not cache.call(tool, {})["success"]
+    assert cache.call(tool, {})["success"]
+    assert cache.call(tool, {})["success"]
+    assert tool.calls == 2
+
+
+def test_tool_result_cache_returns_copies():
+    """Mutating a returned result does not change the cached entry."""
+    cache = ToolResultCache()
+    tool = CountingTool()
+
+    cache.call(tool, {})["result"] = "changed"
+
+    assert cache.call(tool, {})["result"] == 1
+
+
+def test_tool_result_cache_copies_nested_results():
+    """Nested containers in a result are not shared with the cache either."""
+    cache = ToolResultCache()
+    tool = RowsTool()
+
+    first = cache.call(tool, {})
+    first["rows"][0]["id"] = 2
+    first["rows"].append({"id": 3})
+
+    assert cache.call(tool, {})["rows"] == [{"id": 1}]
+
+
+def test_tool_result_cache_skips_non_cacheable_tools():
+    """Tools without cacheable = True always run."""
+    cache = ToolResultCache()
+    tool = CountingTool()
+    tool.cacheable = False
+
+    cache.call(tool, {})
+    cache.call(tool, {})
+
+    assert tool.calls == 2
+    assert len(cache) == 0
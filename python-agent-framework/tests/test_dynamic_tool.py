@@ -0,0 +1,49 @@
+"""
+Tests for dynamically created tools / 动态创建工具测试
+"""
+
+from utils.dynamic_tool import load_tool_from_config
+
+
+def _reverser():
+    return load_tool_from_config({
+        "name": "reverser",
+        "description": "Reverses text",
+        "parameters": {
+            "type": "object",
+            "properties": {"text": {"type": "string"}},
+            "required": ["text"]
+        },
+        "code": "result = text[::-1]"
+    })
+
+
+def test_code_is_compiled_once_and_reused():
+    """Repeated calls reuse the compiled code object."""
+    tool = _reverser()
+
+    assert tool.execute(text="abc")["result"] == "cba"
+    compiled = tool._compiled_code
+    assert tool.execute(text="xy")["result"] == "yx"
+    assert tool._compiled_code is compiled
+
+
+def test_reassigning_code_runs_the_new_code():
+    """Changing code after a call must not keep running the old code."""
+    tool = _reverser()
+    tool.execute(text="abc")
+
+    tool.code = "result = text.upper()"
+
+    assert tool.execute(text="abc")["result"] == "ABC"
+
+
+def test_syntax_error_is_reported_as_failed_result():
+    """Invalid code fails the call instead of raising."""
+    tool = _reverser()
+    tool.code = "result = ("
+
+    result = tool.execute(text="abc")
+
+    assert not result["success"]
+    assert "<tool reverser>" in result["error"]
@@ -0,0 +1,128 @@
+"""
+Tests for the LLM client / LLM客户端测试
+"""
+
+import asyncio
+import threading
+import warnings
+
+import pytest
+
+from core.llm_client import LLMClient, httpx
+
+requires_httpx = pytest.mark.skipif(httpx is None, reason="httpx is not installed")
+
+
+def _client():
+    return LLMClient("http://127.0.0.1:9/v1/chat/completions", "key", max_retries=1)
+
+
+@requires_httpx
+def test_async_client_is_reused_within_a_loop_and_closed_by_aclose():
+    """One pooled client per loop, released by aclose()."""
+    client = _client()
+
+    async def scenario():
+        first = client._get_async_client()
+        assert client._get_async_client() is first
+        await client.aclose()
+        assert first.is_closed
+        assert asyncio.get_running_loop() not in client._async_clients
+
+    asyncio.run(scenario())
+
+
+@requires_httpx
+def test_each_loop_gets_its_own_async_client():
+    """Loops never share a client, and closed loops leave nothing open."""
+    client = _client()
+
+    async def open_and_close():
+        opened = client._get_async_client()
+        await client.aclose()
+        return opened
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        first = asyncio.run(open_and_close())
+        second = asyncio.run(open_and_close())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+    assert len(client._async_clients) == 0
+
+
+@requires_httpx
+def test_loops_in_threads_get_separate_clients():
+    """Concurrent threads sharing one LLMClient each get their loop's client."""
+    client = _client()
+    seen = []
+
+    async def grab():
+        seen.append(client._get_async_client())
+        await asyncio.sleep(0.01)
+        await client.aclose()
+
+    threads = [threading.Thread(target=asyncio.run, args=(grab(),)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(c) for c in seen}) == 4
+    assert all(c.is_closed for c in seen)
+
+
+@requires_httpx
+def test_chat_async_reports_a_non_json_body_as_a_failure():
+    """An unparsable response becomes an error result, as in chat()."""
+    client = _client()
+
+    async def scenario():
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text="<html>busy</html>"))
+        client._async_clients[asyncio.get_running_loop()] = httpx.AsyncClient(transport=transport)
+        try:
+            return await client.chat_async([{"role": "user", "content": "Hi"}])
+        finally:
+            await client.aclose()
+
+    result = asyncio.run(scenario())
+
+    assert result["success"] is False
+    assert result["error"]
+
+
+def test_stats_report_hits_of_an_empty_cache():
+    """Hits are reported even after every cached entry has been dropped."""
+    client = LLMClient("https://example.invalid", "key", cache_size=4)
+    client._response_cache.set("key", {"success": True})
+    client._response_cache.get("key")
+    client._response_cache._data.clear()
+
+    assert client.get_stats()["cache_hits"] == 1
+
+
+def test_claude_request_sends_plain_system_string_by_default():
+    """Existing callers keep the string system prompt."""
+    client = LLMClient("https://example.invalid", "key", api_type="claude")
+    messages = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Hi"}]
+
+    headers, payload = client._claude_request(messages, 0.7, None)
+
+    assert payload["system"] == "Be brief."
+    assert payload["messages"] == [{"role": "user", "content": "Hi"}]
+    assert headers["x-api-key"] == "key"
+
+
+def test_claude_request_marks_system_prompt_cacheable_when_enabled():
+    """prompt_caching=True sends the system prompt as a cacheable block."""
+    client = LLMClient("https://example.invalid", "key", api_type="claude", prompt_caching=True)
+    messages = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "Hi"}]
+
+    _, payload = client._claude_request(messages, 0.7, None)
+
+    assert payload["system"] == [{
+        "type": "text",
+        "text": "Be brief.",
+        "cache_control": {"type": "ephemeral"}
+    }]
@@ -0,0 +1,199 @@
+"""
+Tests for the orchestrators / 编排器测试
+"""
+
+import asyncio
+
+import pytest
+
+from core.orchestrator import (
+    ConditionalOrchestrator,
+    CustomOrchestrator,
+    HierarchicalOrchestrator,
+    ParallelOrchestrator,
+    SequentialOrchestrator,
+    SpeculativeOrchestrator,
+)
+
+
+class StubAgent:
+    """Agent stand-in that returns a fixed reply and records its inputs."""
+
+    def __init__(self, name, reply, llm_client=None):
+        self.name = name
+        self.reply = reply
+        self.llm_client = llm_client
+        self.tasks = []
+        self.contexts = []
+
+    def run(self, task, context=None):
+        self.tasks.append(task)
+        self.contexts.append(context)
+        return self.reply
+
+    async def run_async(self, task, context=None):
+        return self.run(task, context)
+
+
+def _speculative(verdict):
+    return SpeculativeOrchestrator(
+        upstream=StubAgent("upstream", "mean is 4.2"),
+        draft=StubAgent("draft", "draft answer"),
+        verifier=StubAgent("verifier", verdict),
+    )
+
+
+def test_speculative_accepts_draft_on_exact_accept():
+    """Only ACCEPT (surrounding whitespace aside) returns the draft."""
+    for verdict in ("ACCEPT", "  ACCEPT\n"):
+        orchestrator = _speculative(verdict)
+        assert orchestrator.run("task") == {"upstream": "mean is 4.2", "verifier": "draft answer"}
+        assert "mean is 4.2" in orchestrator.verifier.tasks[0]
+
+
+def test_speculative_uses_verifier_output_otherwise():
+    """Anything but exactly ACCEPT is treated as the repaired response."""
+    for verdict in ("ACCEPT, but rewrite the summary", "accept.", "ACCEPTABLE", ""):
+        assert _speculative(verdict).run("task")["verifier"] == verdict
+
+
+def test_speculative_gives_the_draft_its_own_task():
+    """draft_task replaces the task for the draft agent only."""
+    orchestrator = _speculative("ACCEPT")
+    orchestrator.run("full task", draft_task="reduced task")
+
+    assert orchestrator.upstream.tasks == ["full task"]
+    assert orchestrator.draft.tasks == ["reduced task"]
+    assert "full task" in orchestrator.verifier.tasks[0]
+
+
+def test_speculative_run_async_matches_run():
+    """The async path applies the same verdict rule and draft task."""
+    orchestrator = _speculative("ACCEPT")
+    result = asyncio.run(orchestrator.run_async("task", draft_task="reduced task"))
+    assert result == {"upstream": "mean is 4.2", "verifier": "draft answer"}
+    assert orchestrator.draft.tasks == ["reduced task"]
+    assert asyncio.run(_speculative("ACCEPTED?").run_async("task"))["verifier"] == "ACCEPTED?"
+
+
+def test_history_is_unbounded_by_default():
+    """Nothing is dropped unless a subclass opts into a cap."""
+    orchestrator = _speculative("ACCEPT")
+    for i in range(1500):
+        orchestrator._log_execution("agent", f"result {i}")
+
+    history = orchestrator.execution_history
+    assert len(history) == 1500
+    assert history[0]["result"] == "result 0"
+
+
+def test_history_cap_is_opt_in():
+    """HISTORY_SIZE on a subclass keeps only the newest entries."""
+
+    class CappedOrchestrator(SpeculativeOrchestrator):
+        HISTORY_SIZE = 2
+
+    orchestrator = CappedOrchestrator(
+        StubAgent("upstream", ""), StubAgent("draft", ""), StubAgent("verifier", "")
+    )
+    for i in range(5):
+        orchestrator._log_execution("agent", f"result {i}")
+
+    (results,) = orchestrator.history_columns("result")
+    assert results == ("result 3", "result 4")
+
+
+def test_history_columns_are_snapshots():
+    """Returned columns are tuples that later runs do not change."""
+    orchestrator = _speculative("ACCEPT")
+    orchestrator._log_execution("agent", "first")
+
+    agents, results = orchestrator.history_columns("agent", "result")
+    orchestrator._log_execution("agent", "second")
+
+    assert isinstance(results, tuple)
+    assert results == ("first",)
+    assert agents == ("agent",)
+
+
+def _diamond_agents():
+    return [StubAgent(name, f"{name} result") for name in ("A", "B", "C", "D")]
+
+
+def test_sequential_plans_diamond_into_waves():
+    """A -> (B, C) -> D runs B and C together, then D with both results."""
+    agents = _diamond_agents()
+    orchestrator = SequentialOrchestrator(
+        agents, dependencies={"B": ["A"], "C": ["A"], "D": ["B", "C"]}
+    )
+
+    assert [[agent.name for agent in wave] for wave in orchestrator._waves] == [
+        ["A"], ["B", "C"], ["D"]
+    ]
+
+    assert orchestrator.run("task") == "D result"
+    a, b, _, d = agents
+    assert a.tasks == ["task"]
+    assert b.contexts[0]["previous_result"] == "A result"
+    assert d.contexts[0]["previous_result"] == "[B]\nB result\n\n[C]\nC result"
+    assert asyncio.run(orchestrator.run_async("task")) == "D result"
+
+
+def test_sequential_rejects_cyclic_dependencies():
+    """A cycle is reported at construction, naming the agents involved."""
+    with pytest.raises(ValueError, match="Cyclic dependencies between agents: B, C"):
+        SequentialOrchestrator(
+            _diamond_agents(), dependencies={"B": ["C"], "C": ["B"], "D": ["B"]}
+        )
+
+
+def test_sequential_rejects_unknown_dependency():
+    """A dependency on a missing agent is reported at construction."""
+    with pytest.raises(ValueError, match="Agent 'D' depends on unknown agent\\(s\\): E"):
+        SequentialOrchestrator(_diamond_agents(), dependencies={"D": ["B", "E"]})
+
+
+def test_sequential_rejects_unknown_dependent_agent():
+    """Dependencies for an agent that is not in the list are rejected."""
+    with pytest.raises(ValueError, match="Unknown agent in dependencies: 'E'"):
+        SequentialOrchestrator(_diamond_agents(), dependencies={"E": ["A"]})
+
+
+class ClosingClient:
+    """LLM client stand-in that counts aclose() calls."""
+
+    def __init__(self):
+        self.closed = 0
+
+    async def aclose(self):
+        self.closed += 1
+
+
+class EchoOrchestrator(CustomOrchestrator):
+    """Minimal custom orchestrator for the aclose test."""
+
+    def orchestrate(self, task, context):
+        return task
+
+
+def test_aclose_closes_each_client_once_for_every_orchestrator_type():
+    """aclose() works whatever shape a subclass gives self.agents."""
+    shared, router_client = ClosingClient(), ClosingClient()
+
+    def agent(name, client=shared):
+        return StubAgent(name, "", llm_client=client)
+
+    orchestrators = [
+        SequentialOrchestrator([agent("a"), agent("b")]),
+        ParallelOrchestrator([agent("a"), agent("b")]),
+        HierarchicalOrchestrator(agent("manager"), [agent("w1"), agent("w2")]),
+        ConditionalOrchestrator(agent("router", router_client), {"a": agent("a"), "b": agent("b")}),
+        SpeculativeOrchestrator(agent("up"), agent("draft"), agent("verifier")),
+        EchoOrchestrator([agent("a")]),
+    ]
+
+    for orchestrator in orchestrators:
+        asyncio.run(orchestrator.aclose())
+
+    assert shared.closed == len(orchestrators)
+    assert router_client.closed == 1
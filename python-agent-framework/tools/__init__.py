@@ -1,40 +1,42 @@
 """
 Tools module for LLM Agent Framework.
 LLM智能体框架的工具模块。
+
+Tool classes are imported on first access, so importing one tool module does
+not load the numpy/scipy/pandas/matplotlib stacks of the others.
+工具类在首次访问时才导入，因此导入单个工具模块不会加载其他模块依赖的numpy/scipy/pandas/matplotlib。
 """
 
-from .base_tools import (
-    CalculatorTool,
-    FileIOTool,
-    PythonREPLTool,
-    WebSearchTool,
-    TextProcessingTool
-)
-
-from .research_tools import (
-    ScientificComputeTool,
-    StatisticalTestTool,
-    LiteratureSearchTool,
-    UnitConverterTool
-)
-
-from .data_tools import (
-    DataAnalysisTool,
-    VisualizationTool,
-    DataCleaningTool
-)
-
-__all__ = [
-    'CalculatorTool',
-    'FileIOTool',
-    'PythonREPLTool',
-    'WebSearchTool',
-    'TextProcessingTool',
-    'ScientificComputeTool',
-    'StatisticalTestTool',
-    'LiteratureSearchTool',
-    'UnitConverterTool',
-    'DataAnalysisTool',
-    'VisualizationTool',
-    'DataCleaningTool'
-]
+import importlib
+
+# Tool class name -> submodule defining it / 工具类名 -> 定义它的子模块
+_TOOL_MODULES = {
+    'CalculatorTool': 'base_tools',
+    'FileIOTool': 'base_tools',
+    'PythonREPLTool': 'base_tools',
+    'WebSearchTool': 'base_tools',
+    'TextProcessingTool': 'base_tools',
+    'ScientificComputeTool': 'research_tools',
+    'StatisticalTestTool': 'research_tools',
+    'LiteratureSearchTool': 'research_tools',
+    'UnitConverterTool': 'research_tools',
+    'DataAnalysisTool': 'data_tools',
+    'VisualizationTool': 'data_tools',
+    'DataCleaningTool': 'data_tools'
+}
+
+__all__ = list(_TOOL_MODULES)
+
+
+def __getattr__(name):
+    """Import tool classes on first access (PEP 562). / 首次访问时导入工具类（PEP 562）。"""
+    module_name = _TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
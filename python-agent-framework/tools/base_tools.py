@@ -8,10 +8,13 @@ Author: LLM Agent Framework
 License: MIT
 """
 
+import copy
 import math
 import os
 import sys
+from functools import lru_cache
 from io import StringIO
+from types import CodeType
 from typing import Dict, Any
 import requests
 
@@ -31,20 +34,27 @@ class CalculatorTool(Tool):
     执行基本和高级数学运算。
     """
 
+    cacheable = True
+
+    _PARAMETERS = {
+        "type": "object",
+        "properties": {
+            "expression": {
+                "type": "string",
+                "description": "Mathematical expression to evaluate"
+            }
+        },
+        "required": ["expression"]
+    }
+
     def __init__(self):
         super().__init__(
             name="calculator",
             description="Perform mathematical calculations. Supports basic operations (+, -, *, /) and advanced functions (sqrt, sin, cos, log, etc.)",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "expression": {
-                        "type": "string",
-                        "description": "Mathematical expression to evaluate"
-                    }
-                },
-                "required": ["expression"]
-            }
+            # Each instance gets its own copy, so changing one tool's schema
+            # never leaks into the class template or other instances
+            # 每个实例都有自己的副本，修改某个工具的模式不会影响类模板或其他实例
+            parameters=copy.deepcopy(self._PARAMETERS)
         )
 
     def execute(self, expression: str, **kwargs) -> Dict[str, Any]:
@@ -92,28 +102,30 @@ class FileIOTool(Tool):
     安全地读写文本文件。
     """
 
+    _PARAMETERS = {
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "description": "Operation to perform: 'read' or 'write'"
+            },
+            "filepath": {
+                "type": "string",
+                "description": "Path to the file"
+            },
+            "content": {
+                "type": "string",
+                "description": "Content to write (only for write operation)"
+            }
+        },
+        "required": ["operation", "filepath"]
+    }
+
     def __init__(self):
         super().__init__(
             name="file_io",
             description="Read from or write to text files",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "description": "Operation to perform: 'read' or 'write'"
-                    },
-                    "filepath": {
-                        "type": "string",
-                        "description": "Path to the file"
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Content to write (only for write operation)"
-                    }
-                },
-                "required": ["operation", "filepath"]
-            }
+            parameters=copy.deepcopy(self._PARAMETERS)
         )
 
     def execute(self, operation: str, filepath: str, content: str = "", **kwargs) -> Dict[str, Any]:
@@ -165,6 +177,12 @@ class FileIOTool(Tool):
             }
 
 
+@lru_cache(maxsize=256)
+def _compile_code(code: str) -> CodeType:
+    """Compile a REPL snippet, reusing the result for repeated code. / 编译REPL代码片段，重复代码复用编译结果。"""
+    return compile(code, "<repl>", "exec")
+
+
 class PythonREPLTool(Tool):
     """
     Python code execution tool.
@@ -174,21 +192,57 @@ class PythonREPLTool(Tool):
     在受限环境中安全执行Python代码。
     """
 
-    def __init__(self):
+    _PARAMETERS = {
+        "type": "object",
+        "properties": {
+            "code": {
+                "type": "string",
+                "description": "Python code to execute"
+            }
+        },
+        "required": ["code"]
+    }
+
+    def __init__(self, persistent: bool = False):
+        """
+        Initialize the tool.
+        初始化工具。
+
+        Args:
+            persistent: Keep variables between calls. Only enable this for an
+                instance owned by a single agent; a shared instance would leak
+                state between users / 在调用之间保留变量。仅对单个智能体独占的实例启用；
+                共享实例会在用户之间泄漏状态
+        """
+        description = "Execute Python code and return the output"
+        if persistent:
+            description += ". Variables persist between calls."
         super().__init__(
             name="python_repl",
-            description="Execute Python code and return the output",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "code": {
-                        "type": "string",
-                        "description": "Python code to execute"
-                    }
-                },
-                "required": ["code"]
-            }
+            description=description,
+            parameters=copy.deepcopy(self._PARAMETERS)
         )
+        self.persistent = persistent
+        # Warm namespace reused by a persistent instance, so an agent can build
+        # on earlier snippets / 持久实例复用的常驻命名空间，智能体可在之前的代码基础上继续
+        self._namespace: Dict[str, Any] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Clear variables defined by earlier calls.
+        清除之前调用定义的变量。
+        """
+        self._namespace.clear()
+        self._namespace.update(self._fresh_namespace())
+
+    @staticmethod
+    def _fresh_namespace() -> Dict[str, Any]:
+        """Globals for a new execution. / 新执行使用的全局变量。"""
+        return {
+            "__builtins__": __builtins__,
+            "math": math,
+        }
 
     def execute(self, code: str, **kwargs) -> Dict[str, Any]:
         """
@@ -205,12 +259,8 @@ class PythonREPLTool(Tool):
         sys.stdout = captured_output = StringIO()
 
         try:
-            exec_globals = {
-                "__builtins__": __builtins__,
-                "math": math,
-            }
-
-            exec(code, exec_globals)
+            namespace = self._namespace if self.persistent else self._fresh_namespace()
+            exec(_compile_code(code), namespace)
 
             output = captured_output.getvalue()
 
@@ -243,24 +293,26 @@ class WebSearchTool(Tool):
     注意：需要搜索API密钥（例如SerpAPI、Bing搜索API）
     """
 
+    _PARAMETERS = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query"
+            },
+            "num_results": {
+                "type": "integer",
+                "description": "Number of results to return (default: 5)"
+            }
+        },
+        "required": ["query"]
+    }
+
     def __init__(self, api_key: str = None):
         super().__init__(
             name="web_search",
             description="Search the internet for information",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query"
-                    },
-                    "num_results": {
-                        "type": "integer",
-                        "description": "Number of results to return (default: 5)"
-                    }
-                },
-                "required": ["query"]
-            }
+            parameters=copy.deepcopy(self._PARAMETERS)
         )
         self.api_key = api_key or os.getenv("SEARCH_API_KEY")
 
@@ -305,32 +357,34 @@ class TextProcessingTool(Tool):
     执行各种文本操作，如计数、拆分、替换等。
     """
 
+    _PARAMETERS = {
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "description": "Operation: 'count_words', 'split', 'replace', 'upper', 'lower', 'strip'"
+            },
+            "text": {
+                "type": "string",
+                "description": "Text to process"
+            },
+            "pattern": {
+                "type": "string",
+                "description": "Pattern for split or replace operations"
+            },
+            "replacement": {
+                "type": "string",
+                "description": "Replacement text for replace operation"
+            }
+        },
+        "required": ["operation", "text"]
+    }
+
     def __init__(self):
         super().__init__(
             name="text_processing",
             description="Process text: count words, split, replace, extract, etc.",
-            parameters={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "description": "Operation: 'count_words', 'split', 'replace', 'upper', 'lower', 'strip'"
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Text to process"
-                    },
-                    "pattern": {
-                        "type": "string",
-                        "description": "Pattern for split or replace operations"
-                    },
-                    "replacement": {
-                        "type": "string",
-                        "description": "Replacement text for replace operation"
-                    }
-                },
-                "required": ["operation", "text"]
-            }
+            parameters=copy.deepcopy(self._PARAMETERS)
         )
 
     def execute(
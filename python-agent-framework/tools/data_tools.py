@@ -15,8 +15,6 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from typing import Dict, Any, List
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
 from core.tool import Tool
 
 
@@ -273,6 +271,8 @@ class VisualizationTool(Tool):
 
     def _line_plot(self, df: pd.DataFrame, x: str, y: str, title: str) -> Dict[str, Any]:
         """Create line plot. / 创建折线图。"""
+        import plotly.graph_objects as go
+
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=df[x] if x else df.index,
@@ -294,6 +294,8 @@ class VisualizationTool(Tool):
 
     def _bar_chart(self, df: pd.DataFrame, x: str, y: str, title: str) -> Dict[str, Any]:
         """Create bar chart. / 创建条形图。"""
+        import plotly.graph_objects as go
+
         fig = go.Figure()
         fig.add_trace(go.Bar(
             x=df[x] if x else df.index,
@@ -314,6 +316,8 @@ class VisualizationTool(Tool):
 
     def _scatter_plot(self, df: pd.DataFrame, x: str, y: str, title: str) -> Dict[str, Any]:
         """Create scatter plot. / 创建散点图。"""
+        import plotly.graph_objects as go
+
         fig = go.Figure()
         fig.add_trace(go.Scatter(
             x=df[x],
@@ -335,6 +339,8 @@ class VisualizationTool(Tool):
 
     def _histogram(self, df: pd.DataFrame, column: str, title: str) -> Dict[str, Any]:
         """Create histogram. / 创建直方图。"""
+        import plotly.graph_objects as go
+
         fig = go.Figure()
         fig.add_trace(go.Histogram(x=df[column], name=column))
         fig.update_layout(title=title, xaxis_title=column, yaxis_title="Frequency")
@@ -351,6 +357,8 @@ class VisualizationTool(Tool):
 
     def _box_plot(self, df: pd.DataFrame, column: str, title: str) -> Dict[str, Any]:
         """Create box plot. / 创建箱线图。"""
+        import plotly.graph_objects as go
+
         fig = go.Figure()
         fig.add_trace(go.Box(y=df[column], name=column))
         fig.update_layout(title=title, yaxis_title=column)
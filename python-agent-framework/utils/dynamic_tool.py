@@ -43,6 +43,18 @@ class DynamicTool(Tool):
         super().__init__(name, description, parameters)
         self.code = code
 
+    @property
+    def code(self) -> Optional[str]:
+        """Python code run by execute() / execute()运行的Python代码"""
+        return self._code
+
+    @code.setter
+    def code(self, value: Optional[str]) -> None:
+        self._code = value
+        # Compiled on first execution and reused until the code is reassigned
+        # 首次执行时编译，并在代码被重新赋值前一直复用
+        self._compiled_code = None
+
     def execute(self, **kwargs) -> Dict[str, Any]:
         """
         Execute the tool with provided parameters.
@@ -66,8 +78,10 @@ class DynamicTool(Tool):
             # If custom code is provided, execute it
             if self.code:
                 # Create a safe execution environment
+                if self._compiled_code is None:
+                    self._compiled_code = compile(self.code, f"<tool {self.name}>", "exec")
                 local_vars = kwargs.copy()
-                exec(self.code, {"__builtins__": __builtins__}, local_vars)
+                exec(self._compiled_code, {"__builtins__": __builtins__}, local_vars)
                 
                 # Return the 'result' variable if it exists
                 if 'result' in local_vars: